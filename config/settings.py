@@ -18,10 +18,12 @@ CHECKPOINT_DIR = DATA_DIR / "checkpoints"
 BACKUP_DIR = DATA_DIR / "backup"
 
 # Discovery output files:
-# - discovered_ids.json: Main JSON file with all IDs and metadata (saved periodically)
-# - discovered_ids.raw.txt: Append-only backup (saved IMMEDIATELY per ID, failsafe)
-DISCOVERED_IDS_FILE = DISCOVERY_DIR / "discovered_ids.json"
-# Note: Raw backup file is auto-created at: DISCOVERED_IDS_FILE.with_suffix('.raw.txt')
+# - discovered_ids.txt: Snapshot of all IDs, one per line (rewritten on compaction)
+# - discovered_ids.meta.json: Timestamps and count (saved periodically)
+# - discovered_ids.raw.txt: Append-only backup/delta log (saved IMMEDIATELY per ID, failsafe)
+# - discovered_ids.json: Legacy JSON format, migrated automatically on first load
+DISCOVERED_IDS_FILE = DISCOVERY_DIR / "discovered_ids.txt"
+# Note: Sibling files are auto-created at: DISCOVERED_IDS_FILE.with_suffix('.meta.json' / '.raw.txt')
 
 # Extraction output files:
 # - extracted_backup.jsonl: JSONL format, one JSON object per line (16 fields per record)
@@ -29,6 +31,12 @@ DISCOVERED_IDS_FILE = DISCOVERY_DIR / "discovered_ids.json"
 # - practitioners_YYYY-MM-DD.csv: CSV output (16 fields per record)
 EXTRACTED_BACKUP_FILE = BACKUP_DIR / "extracted_backup.jsonl"
 
+# Raw HTML cache for API responses (gzip-compressed, one file per reg_id)
+# Lets re-runs / parser changes re-use responses without hitting AHPRA again
+HTML_CACHE_DIR = DATA_DIR / "cache" / "html"
+HTML_CACHE_TTL = 30 * 24 * 3600      # Seconds before a cached page is re-fetched (30 days)
+HTML_CACHE_MAX_BYTES = 2 * 1024 ** 3  # Prune oldest files when cache exceeds 2 GB
+
 # Rate limiting (respectful approach - avoid server overload)
 # These are the primary delays between data scrapes/API calls
 MIN_DELAY = 0.8  # Minimum seconds between requests (increased to avoid CAPTCHA)
@@ -37,6 +45,7 @@ MAX_DELAY = 2  # Maximum seconds between requests
 # UI interaction delays (for form filling, dropdown clicks within same page)
 UI_MIN_DELAY = 0.5  # Quick UI interactions
 UI_MAX_DELAY = 1.2  # Quick UI interactions
+UI_MUTATION_TIMEOUT = 1500  # Max ms to wait for a sidebar click's DOM effect before moving on
 
 # Sidebar filter delays (for optimized discovery mode)
 # These are longer delays to avoid triggering CAPTCHA when using sidebar filters
@@ -57,6 +66,34 @@ PAGE_LOAD_TIMEOUT = 20000  # 20 seconds for slow pages
 VIEWPORT_WIDTH = 1080
 VIEWPORT_HEIGHT = 900
 
+# Chromium launch flags - keep the browser lean (fewer renderer processes,
+# no background services) since we only ever drive a single scraping page
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',  # Required in containers (small /dev/shm)
+    '--no-sandbox',
+    '--renderer-process-limit=1',
+    '--disable-features=Translate,BackForwardCache,OptimizationHints',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--disable-component-update',
+    '--disable-ipc-flooding-protection',
+]
+
+# Image/font/media URLs aborted in every browser context (never needed to read
+# search results). Matched by URL pattern so documents, XHR, scripts and
+# stylesheets never go through a route handler (routing them would cost a
+# Python round-trip each and disable the HTTP cache for them). The extension
+# is checked on the URL path and may be followed by a query string (CMS
+# media: logo.png?v=3). Stylesheets
+# are kept: visibility checks depend on computed CSS.
+BLOCKED_RESOURCE_PATTERN = (
+    r"^[^?#]*\.(png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf|eot|mp4|webm|mp3)([?#]|$)"
+)
+
 # AHPRA URLs
 AHPRA_BASE_URL = "https://www.ahpra.gov.au"
 AHPRA_SEARCH_URL = "https://www.ahpra.gov.au/Registration/Registers-of-Practitioners.aspx"
@@ -67,6 +104,13 @@ CSV_SEPARATOR = ","
 
 # Checkpoint settings
 CHECKPOINT_INTERVAL = 50   # Save checkpoint every N practitioners
+CHECKPOINT_PAGE_INTERVAL = 5  # Full checkpoint save every N result pages with new IDs (raw backup is synced every page)
+COMBINATION_SAVE_INTERVAL = 25  # Multi-dimensional: checkpoint save every N completed combinations...
+COMBINATION_SAVE_SECONDS = 30   # ...or every N seconds, whichever comes first
+EXTRACT_FLUSH_BATCH = 50     # Extraction: flush CSV/JSONL buffers every N records...
+EXTRACT_FLUSH_SECONDS = 2.0  # ...or every N seconds, whichever comes first
+EXTRACT_WRITE_BUFFER = 1 << 20  # Userspace buffer size for extraction output files (1 MiB)
+EXTRACT_PREFETCH_DEPTH = 2   # Extraction: fetched-but-unprocessed responses buffered ahead of parsing
 AUTO_SAVE_INTERVAL = 100   # Auto-save every 5 minutes (in seconds)
 PROGRESS_DISPLAY_INTERVAL = 10  # Display progress every N practitioners
 
@@ -19,12 +19,13 @@ Usage:
 """
 
 import argparse
+import signal
 import sys
 from pathlib import Path
 
 from loguru import logger
 
-from config.settings import DATA_DIR, CHECKPOINT_DIR
+from config.settings import DATA_DIR, CHECKPOINT_DIR, DISCOVERED_IDS_FILE
 from src.utils import setup_logging, format_duration
 from src.browser import BrowserManager
 from src.checkpoint import CheckpointManager
@@ -32,8 +33,16 @@ from src.discovery import DiscoveryEngine
 from src.extractor import ExtractionEngine
 
 
+def _raise_keyboard_interrupt(signum, frame):
+    """Signal handler that turns SIGTERM into KeyboardInterrupt."""
+    raise KeyboardInterrupt
+
+
 def cmd_discover(args):
     """Run the discovery stage to find all practitioner URLs."""
+    # Treat SIGTERM like Ctrl+C so the checkpoint is flushed on shutdown
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
     setup_logging("discovery")
     logger.info("=" * 60)
     logger.info("AHPRA Scraper - Discovery Stage")
@@ -103,7 +112,9 @@ def cmd_discover(args):
             multi_dimensional=multi_dimensional,
             include_suburbs=include_suburbs,
             max_depth=max_depth,
-            test_prefix=test_prefix
+            test_prefix=test_prefix,
+            concurrency=args.workers,
+            filter_first=args.filter_first
         )
 
         if not engine.initialize():
@@ -129,11 +140,11 @@ def cmd_discover(args):
 
         except KeyboardInterrupt:
             logger.warning("Discovery interrupted by user")
-            checkpoint.save()
+            engine.save_checkpoint(durable=True)
             logger.info("Checkpoint saved. Resume with: python main.py discover")
         except Exception as e:
             logger.error(f"Discovery failed: {e}")
-            checkpoint.save()
+            engine.save_checkpoint(durable=True)
             return 1
 
     return 0
@@ -175,11 +186,11 @@ def cmd_extract(args):
 
     except KeyboardInterrupt:
         logger.warning("Extraction interrupted by user")
-        checkpoint.save()
+        checkpoint.save(durable=True)
         logger.info("Checkpoint saved. Resume with: python main.py extract")
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
-        checkpoint.save()
+        checkpoint.save(durable=True)
         return 1
     finally:
         engine.close()
@@ -261,12 +272,10 @@ def cmd_status(args):
         if checkpoint.stats.get('last_save_time'):
             print(f"   Last saved: {checkpoint.stats['last_save_time']}")
 
-    # Show discovered_ids JSON
-    discovery_dir = DATA_DIR / "discovery"
-    discovered_json = discovery_dir / "discovered_ids.json"
-    if discovered_json.exists():
-        size = discovered_json.stat().st_size / 1024 / 1024
-        print(f"\n📄 Discovery JSON: {discovered_json.name} ({size:.2f} MB)")
+    # Show discovered IDs snapshot
+    if DISCOVERED_IDS_FILE.exists():
+        size = DISCOVERED_IDS_FILE.stat().st_size / 1024 / 1024
+        print(f"\n📄 Discovered IDs: {DISCOVERED_IDS_FILE.name} ({size:.2f} MB)")
 
     # Show output files
     print(f"\n📁 Data directory: {DATA_DIR}")
@@ -308,6 +317,19 @@ def cmd_reset(args):
         checkpoint_file.unlink()
         print(f"✓ Deleted checkpoint: {checkpoint_file}")
 
+    # Delete the stats side files (they would override a fresh checkpoint)
+    checkpoint.clear_stats_side_files()
+
+    # Delete combinations delta log
+    if checkpoint.combinations_log_file.exists():
+        checkpoint.combinations_log_file.unlink()
+        print(f"✓ Deleted combinations log: {checkpoint.combinations_log_file}")
+
+    # Delete the saved multi-dimensional combination queue
+    if checkpoint.combination_queue_file.exists():
+        checkpoint.clear_combination_queue()
+        print(f"✓ Deleted combination queue: {checkpoint.combination_queue_file}")
+
     # Delete reg_ids file
     discovery_dir = DATA_DIR / "discovery"
     if discovery_dir.exists():
@@ -316,6 +338,17 @@ def cmd_reset(args):
             reg_ids_file.unlink()
             print(f"✓ Deleted reg_ids: {reg_ids_file}")
 
+    # Delete the discovered IDs snapshot, its raw backup/delta log and metadata
+    for ids_file in (
+        checkpoint.discovered_ids_file,
+        checkpoint.raw_ids_backup_file,
+        checkpoint.discovered_ids_meta_file,
+    ):
+        if ids_file.exists():
+            ids_file.unlink()
+            print(f"✓ Deleted: {ids_file}")
+
+    if discovery_dir.exists():
         # Clean up any old JSON files
         for f in discovery_dir.glob("*.json"):
             f.unlink()
@@ -402,6 +435,14 @@ Examples:
         "--depth", "-d", type=int, default=3, choices=[1, 2, 3, 4],
         help="Maximum search depth (1=A-Z, 2=AA-ZZ, 3=AAA-ZZZ, default: 3)"
     )
+    discover_parser.add_argument(
+        "--workers", "-w", type=int, default=1,
+        help="Parallel browser workers for multi-dimensional mode (default: 1)"
+    )
+    discover_parser.add_argument(
+        "--filter-first", action="store_true", default=False,
+        help="Apply sidebar filters once per profession/state and re-search each prefix (with --multi-dimensional)"
+    )
     discover_parser.add_argument(
         "--headless", dest="headless", action="store_true", default=True,
         help="Run browser in headless mode (default)"
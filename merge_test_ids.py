@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
-Merge test discovered IDs into the main discovered_ids.json file.
+Merge test discovered IDs into the main discovered_ids.txt file.
 
-This script finds all test_*_ids_*.json files in the discovery directory
-and merges their IDs into the main discovered_ids.json file.
+This script finds all test_*_ids_*.txt files (and legacy test_*_ids_*.json
+files) in the discovery directory and merges their IDs into the main
+discovered_ids.txt file.
 
 Usage:
     python merge_test_ids.py           # Preview what will be merged
@@ -18,76 +19,100 @@ from pathlib import Path
 
 from config.settings import DISCOVERY_DIR, DISCOVERED_IDS_FILE
 
+SIBLING_SUFFIXES = ('.meta.json', '.raw.txt')
+
 
 def find_test_files() -> list[Path]:
     """Find all test discovered IDs files."""
     patterns = [
+        "test_*_ids_*.txt",
         "test_*_ids_*.json",
-        "test_discovered_ids_*.json",
-        "test_optimized_ids_*.json",
     ]
 
     test_files = []
     for pattern in patterns:
         test_files.extend(DISCOVERY_DIR.glob(pattern))
 
+    # Skip the metadata / raw backup files that sit next to each snapshot
+    test_files = [f for f in test_files if not f.name.endswith(SIBLING_SUFFIXES)]
+
     # Remove duplicates and sort
     test_files = sorted(set(test_files))
     return test_files
 
 
 def load_ids_from_file(file_path: Path) -> set[str]:
-    """Load reg_ids from a JSON file."""
+    """Load reg_ids from a snapshot (one ID per line, or legacy JSON) plus its raw backup."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return set(data.get('reg_ids', []))
+        if file_path.suffix == '.json':
+            with open(file_path, 'r', encoding='utf-8') as f:
+                ids = set(json.load(f).get('reg_ids', []))
+        else:
+            ids = set(file_path.read_text(encoding='utf-8').split())
+
+        raw_backup = file_path.with_suffix('.raw.txt')
+        if raw_backup.exists():
+            ids.update(raw_backup.read_text(encoding='utf-8').split())
+        return ids
     except Exception as e:
         print(f"  ERROR loading {file_path.name}: {e}")
         return set()
 
 
 def load_main_ids() -> tuple[set[str], dict]:
-    """Load IDs from main discovered_ids.json file."""
-    if not DISCOVERED_IDS_FILE.exists():
-        return set(), {
-            'started_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
-            'total_count': 0,
-            'reg_ids': []
-        }
+    """Load IDs and metadata from main discovered_ids.txt file."""
+    metadata = {
+        'started_at': datetime.now().isoformat(),
+        'last_updated': datetime.now().isoformat(),
+        'total_count': 0,
+    }
+
+    main_file = DISCOVERED_IDS_FILE
+    if not main_file.exists():
+        # Not yet migrated from the legacy JSON format
+        main_file = DISCOVERED_IDS_FILE.with_suffix('.json')
+        if not main_file.exists():
+            return set(), metadata
 
     try:
-        with open(DISCOVERED_IDS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return set(data.get('reg_ids', [])), data
+        meta_file = DISCOVERED_IDS_FILE.with_suffix('.meta.json')
+        if meta_file.exists():
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                metadata.update(json.load(f))
+        return load_ids_from_file(main_file), metadata
     except Exception as e:
         print(f"ERROR loading main file: {e}")
         return set(), {}
 
 
 def save_main_ids(ids: set[str], metadata: dict) -> bool:
-    """Save IDs to main discovered_ids.json file."""
+    """Save IDs to main discovered_ids.txt file and its metadata file."""
     metadata['last_updated'] = datetime.now().isoformat()
     metadata['total_count'] = len(ids)
-    metadata['reg_ids'] = sorted(list(ids))
 
-    # Atomic write
+    # Atomic writes
     temp_file = DISCOVERED_IDS_FILE.with_suffix('.tmp')
+    meta_file = DISCOVERED_IDS_FILE.with_suffix('.meta.json')
+    temp_meta_file = meta_file.with_suffix('.tmp')
     try:
         with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+            f.write('\n'.join(sorted(ids)) + '\n')
         temp_file.replace(DISCOVERED_IDS_FILE)
+
+        with open(temp_meta_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+        temp_meta_file.replace(meta_file)
         return True
     except Exception as e:
         print(f"ERROR saving main file: {e}")
-        if temp_file.exists():
-            temp_file.unlink()
+        for tmp in (temp_file, temp_meta_file):
+            if tmp.exists():
+                tmp.unlink()
         return False
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Merge test IDs into main discovered_ids.json")
+    parser = argparse.ArgumentParser(description="Merge test IDs into main discovered_ids.txt")
     parser.add_argument('--apply', action='store_true', help='Actually perform the merge')
     parser.add_argument('--delete', action='store_true', help='Delete test files after merge')
     args = parser.parse_args()
@@ -153,11 +178,13 @@ def main():
         if args.delete:
             print("\nDeleting test files...")
             for test_file in test_files:
-                try:
-                    test_file.unlink()
-                    print(f"  Deleted: {test_file.name}")
-                except Exception as e:
-                    print(f"  ERROR deleting {test_file.name}: {e}")
+                siblings = [test_file.with_suffix(suffix) for suffix in SIBLING_SUFFIXES]
+                for path in [test_file] + [p for p in siblings if p.exists()]:
+                    try:
+                        path.unlink()
+                        print(f"  Deleted: {path.name}")
+                    except Exception as e:
+                        print(f"  ERROR deleting {path.name}: {e}")
 
             # Also delete associated checkpoint files
             from config.settings import CHECKPOINT_DIR
@@ -21,11 +21,11 @@ from typing import Optional, Dict
 from loguru import logger
 
 from config.settings import (
-    DATA_DIR, EXTRACTED_DIR, BACKUP_DIR,
-    EXTRACTED_BACKUP_FILE, DATA_FIELDS,
+    EXTRACTED_DIR, BACKUP_DIR,
+    EXTRACTED_BACKUP_FILE, DATA_FIELDS, DISCOVERED_IDS_FILE,
 )
 from src.utils import setup_logging, format_duration, get_date_string
-from src.checkpoint import CheckpointManager
+from src.checkpoint import CheckpointManager, load_discovered_reg_ids
 from src.browser import BrowserManager
 from src.parser import PractitionerParser
 
@@ -356,22 +356,17 @@ class BrowserExtractionEngine:
 
 
 def load_discovered_ids(limit: int = None) -> list:
-    """Load discovered reg IDs from JSON file."""
-    discovered_file = DATA_DIR / "discovery" / "discovered_ids.json"
-    
-    if not discovered_file.exists():
-        logger.error(f"Discovered IDs file not found: {discovered_file}")
-        return []
-    
+    """Load discovered reg IDs from the discovery snapshot."""
     try:
-        with open(discovered_file, 'r') as f:
-            data = json.load(f)
+        ids = load_discovered_reg_ids(DISCOVERED_IDS_FILE)
+        if not ids:
+            logger.error(f"No discovered IDs found at: {DISCOVERED_IDS_FILE}")
+            return []
         
-        ids = data.get("reg_ids", [])
         if limit:
             ids = ids[:limit]
         
-        logger.info(f"Loaded {len(ids)} IDs from discovered_ids.json")
+        logger.info(f"Loaded {len(ids)} IDs from {DISCOVERED_IDS_FILE.name}")
         return ids
     
     except Exception as e:
@@ -539,7 +534,7 @@ def main():
             logger.info(f"Time elapsed: {format_duration(elapsed)}")
             
             engine.close()
-            checkpoint.save()
+            checkpoint.save(durable=True)
             
             return 0 if len(failed_ids) == 0 else 1
     
@@ -9,36 +9,30 @@ Usage:
     python phase2_extract.py [--batch-size N] [--limit N] [--fresh] [--retry-failed]
 """
 
-import json
 import argparse
 import sys
 from pathlib import Path
 from loguru import logger
 
-from config.settings import DATA_DIR
+from config.settings import DISCOVERED_IDS_FILE
 from src.utils import setup_logging, format_duration
-from src.checkpoint import CheckpointManager
+from src.checkpoint import CheckpointManager, load_discovered_reg_ids
 from src.extractor import ExtractionEngine
 import time
 
 
 def load_discovered_ids(limit: int = None) -> list:
-    """Load discovered reg IDs from JSON file"""
-    discovered_file = DATA_DIR / "discovery" / "discovered_ids.json"
-    
-    if not discovered_file.exists():
-        logger.error(f"Discovered IDs file not found: {discovered_file}")
-        return []
-    
+    """Load discovered reg IDs from the discovery snapshot"""
     try:
-        with open(discovered_file, 'r') as f:
-            data = json.load(f)
+        ids = load_discovered_reg_ids(DISCOVERED_IDS_FILE)
+        if not ids:
+            logger.error(f"No discovered IDs found at: {DISCOVERED_IDS_FILE}")
+            return []
         
-        ids = data.get("reg_ids", [])
         if limit:
             ids = ids[:limit]
         
-        logger.info(f"Loaded {len(ids)} IDs from discovered_ids.json")
+        logger.info(f"Loaded {len(ids)} IDs from {DISCOVERED_IDS_FILE.name}")
         return ids
     
     except Exception as e:
@@ -238,9 +232,7 @@ def main():
                         )
                         checkpoint.save()
                         # Reset the API session to get fresh cookies
-                        engine.api_client.session.close()
-                        engine.api_client._cookies_initialized = False
-                        engine.api_client._setup_session()
+                        engine.api_client.reset_session()
                         # 5-minute pause to let WAF sliding windows reset
                         time.sleep(LONG_COOLDOWN_DURATION)
                         consecutive_failures = 0
@@ -279,13 +271,13 @@ def main():
             logger.warning(f"Failed IDs: {len(failed_ids)} total (use --retry-failed to retry)")
         
         # Save checkpoint
-        checkpoint.save()
+        checkpoint.save(durable=True)
         
         return 0 if len(failed_ids) == 0 else 1
     
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
-        checkpoint.save()
+        checkpoint.save(durable=True)
         return 1
     finally:
         engine.close()
@@ -5,8 +5,13 @@ Updated with proper browser fingerprinting headers to avoid CAPTCHA/WAF blocking
 Key additions: Sec-Fetch headers, proper session flow, Content-Type on POST.
 """
 
+import atexit
+import gzip
+import itertools
 import random
+import re
 import time
+from pathlib import Path
 from typing import Optional
 
 import requests
@@ -19,40 +24,108 @@ from config.settings import (
     MAX_DELAY,
     MAX_RETRIES,
     RETRY_DELAY,
+    HTML_CACHE_DIR,
+    HTML_CACHE_TTL,
+    HTML_CACHE_MAX_BYTES,
 )
 
+# Prune the HTML cache every N new cache writes
+CACHE_PRUNE_INTERVAL = 500
+
+# Chunk size when streaming response bodies
+STREAM_CHUNK_SIZE = 65536
+
+# Explicit charset parameter in a Content-Type header
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Size of the pre-generated random buffers for user agents / delay jitter
+RANDOM_BUFFER_SIZE = 4096
+
+# Process-wide HTTP session, shared by every AHPRAClient so the connection
+# pool (TCP + TLS handshakes) and cookies are reused across instances
+_SESSION: Optional[requests.Session] = None
+
+
+def _build_session() -> requests.Session:
+    """Create a session with browser-like headers including Sec-Fetch headers."""
+    session = requests.Session()
+
+    # Use Mac Chrome user agent consistently (working scraper uses this)
+    ua = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+    session.headers.update({
+        'User-Agent': ua,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-AU,en;q=0.9,en-US;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        # Critical Sec-Fetch headers for WAF bypass
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        # Additional browser headers
+        'Upgrade-Insecure-Requests': '1',
+        'Cache-Control': 'max-age=0',
+    })
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Get the shared process-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _build_session()
+        atexit.register(_close_session)
+    return _SESSION
+
+
+def _close_session() -> None:
+    """Close the shared session (registered to run at exit)."""
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+def _reset_session() -> requests.Session:
+    """Replace the shared session with a fresh one (new cookies and connections)."""
+    global _SESSION
+    old = _SESSION
+    _SESSION = None
+    session = _get_session()
+    if old is not None:
+        old.close()
+    return session
+
 
 class AHPRAClient:
     """HTTP client for fetching practitioner data from AHPRA API."""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self._setup_session()
+    def __init__(self, cache_dir: Optional[Path] = None, use_cache: bool = True):
+        """
+        Initialize API client.
+
+        Args:
+            cache_dir: Directory for cached HTML responses (default from settings)
+            use_cache: Read/write cached responses before hitting the network
+        """
+        self.session = _get_session()
         self.request_count = 0
         self._cookies_initialized = False
         self.consecutive_failures = 0  # Track failures for adaptive delays
         self.last_request_time = 0  # Track timing
 
-    def _setup_session(self):
-        """Configure session with browser-like headers including Sec-Fetch headers."""
-        # Use Mac Chrome user agent consistently (working scraper uses this)
-        ua = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        
-        self.session.headers.update({
-            'User-Agent': ua,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-AU,en;q=0.9,en-US;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            # Critical Sec-Fetch headers for WAF bypass
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            # Additional browser headers
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
-        })
+        # Pre-generated cycling buffers (non-crypto randomness is fine here)
+        self._ua_cycle = itertools.cycle(random.choices(USER_AGENTS, k=RANDOM_BUFFER_SIZE))
+        self._jitter_cycle = itertools.cycle(
+            [random.uniform(-2, 2) for _ in range(RANDOM_BUFFER_SIZE)]
+        )
+
+        # On-disk HTML cache (gzip, keyed by reg_id)
+        self.use_cache = use_cache
+        self._cache_dir = cache_dir or HTML_CACHE_DIR
+        self._cache_writes = 0
+        if self.use_cache:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _init_cookies(self):
         """
@@ -84,8 +157,7 @@ class AHPRAClient:
 
     def _rotate_user_agent(self):
         """Rotate to a random user agent."""
-        ua = random.choice(USER_AGENTS)
-        self.session.headers['User-Agent'] = ua
+        self.session.headers['User-Agent'] = next(self._ua_cycle)
 
     def _apply_delay(self):
         """
@@ -102,7 +174,7 @@ class AHPRAClient:
         delay = base_delay + adaptive_extra
 
         # Add small randomization (±2s) to avoid pattern detection
-        delay += random.uniform(-2, 2)
+        delay += next(self._jitter_cycle)
         delay = max(13, delay)  # Never go below 13s
 
         # Ensure minimum time since last request
@@ -115,16 +187,144 @@ class AHPRAClient:
 
         self.last_request_time = time.time()
 
+    def _cache_path(self, reg_id: str) -> Path:
+        """Get the cache file path for a reg_id."""
+        return self._cache_dir / f"{reg_id}.html.gz"
+
+    def _read_cache(self, reg_id: str) -> Optional[str]:
+        """
+        Read a cached HTML response if present and not expired.
+
+        Args:
+            reg_id: Practitioner registration ID
+
+        Returns:
+            Cached HTML, or None on miss/expiry
+        """
+        path = self._cache_path(reg_id)
+        try:
+            if time.time() - path.stat().st_mtime > HTML_CACHE_TTL:
+                return None
+            return gzip.decompress(path.read_bytes()).decode('utf-8')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry for {reg_id}: {e}")
+            return None
+
+    def _write_cache(self, reg_id: str, html: str) -> None:
+        """
+        Write an HTML response to the cache (atomic temp file + rename).
+
+        Args:
+            reg_id: Practitioner registration ID
+            html: HTML content to cache
+        """
+        path = self._cache_path(reg_id)
+        try:
+            temp_file = path.with_suffix('.tmp')
+            temp_file.write_bytes(gzip.compress(html.encode('utf-8'), compresslevel=6))
+            temp_file.replace(path)
+        except Exception as e:
+            logger.debug(f"Failed to cache response for {reg_id}: {e}")
+            return
+
+        self._cache_writes += 1
+        if self._cache_writes % CACHE_PRUNE_INTERVAL == 0:
+            self.prune_cache()
+
+    def discard_cached(self, reg_id: str) -> None:
+        """
+        Remove a cached response (e.g., when it turns out to be a blocking page).
+
+        Args:
+            reg_id: Practitioner registration ID
+        """
+        try:
+            self._cache_path(reg_id).unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Failed to discard cache entry for {reg_id}: {e}")
+
+    def prune_cache(self, max_bytes: int = None) -> int:
+        """
+        Delete least-recently-written cache files until under the size limit.
+
+        Args:
+            max_bytes: Size limit in bytes (default from settings)
+
+        Returns:
+            Number of files deleted
+        """
+        limit = max_bytes if max_bytes is not None else HTML_CACHE_MAX_BYTES
+        try:
+            entries = [(p, p.stat()) for p in self._cache_dir.glob('*.html.gz')]
+        except Exception as e:
+            logger.debug(f"Failed to scan HTML cache: {e}")
+            return 0
+
+        total = sum(st.st_size for _, st in entries)
+        if total <= limit:
+            return 0
+
+        deleted = 0
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+                total -= st.st_size
+                deleted += 1
+            except Exception:
+                continue
+
+        logger.info(f"Pruned {deleted} files from HTML cache")
+        return deleted
+
+    @staticmethod
+    def _read_body(response: requests.Response) -> str:
+        """
+        Read a response body, decoding as UTF-8 unless a charset is declared.
+
+        `response.text` would decode a text/html body without a charset as
+        ISO-8859-1 (requests' HTTP default), garbling non-ASCII names; only an
+        explicit `charset=` in the Content-Type header overrides UTF-8 here.
+        The whole body is still read into memory (same as `response.content`);
+        streaming only lets error responses log their head without a download.
+
+        Args:
+            response: Response opened with stream=True
+
+        Returns:
+            Decoded body text
+        """
+        match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+        encoding = match.group(1) if match else 'utf-8'
+        try:
+            return response.content.decode(encoding, errors='replace')
+        except LookupError:
+            # Unknown charset name declared by the server
+            return response.content.decode('utf-8', errors='replace')
+
     def fetch_practitioner(self, reg_id: str) -> Optional[str]:
         """
         Fetch practitioner details via POST request.
 
+        Checks the on-disk HTML cache first; successful responses are cached.
+
         Args:
             reg_id: Practitioner registration ID (e.g., NMW0001234567)
 
         Returns:
             HTML content of the practitioner detail page, or None on failure
         """
+        if self.use_cache:
+            cached = self._read_cache(reg_id)
+            if cached is not None:
+                logger.debug(f"Cache hit for {reg_id} ({len(cached)} bytes)")
+                return cached
+
         # Initialize session cookies if not done
         if not self._cookies_initialized:
             self._init_cookies()
@@ -153,30 +353,34 @@ class AHPRAClient:
             try:
                 self._apply_delay()
 
-                response = self.session.post(
+                with self.session.post(
                     AHPRA_SEARCH_URL,
                     data=data,
                     headers=post_headers,
                     timeout=30,
-                )
+                    stream=True,
+                ) as response:
+                    if response.status_code == 200:
+                        # Check for blocking indicators
+                        html = self._read_body(response)
+                        if 'Request Rejected' in html or len(html) < 500:
+                            logger.warning(f"Blocked response for {reg_id} (Request Rejected or too short)")
+                            self.consecutive_failures += 1
+                            continue
 
-                if response.status_code == 200:
-                    # Check for blocking indicators
-                    html = response.text
-                    if 'Request Rejected' in html or len(html) < 500:
-                        logger.warning(f"Blocked response for {reg_id} (Request Rejected or too short)")
+                        # Success - reset failure counter
+                        self.consecutive_failures = 0
+                        logger.debug(f"Fetched {reg_id} successfully ({len(html)} bytes)")
+                        if self.use_cache:
+                            self._write_cache(reg_id, html)
+                        return html
+                    else:
                         self.consecutive_failures += 1
-                        continue
-                    
-                    # Success - reset failure counter
-                    self.consecutive_failures = 0
-                    logger.debug(f"Fetched {reg_id} successfully ({len(html)} bytes)")
-                    return html
-                else:
-                    self.consecutive_failures += 1
-                    logger.warning(f"HTTP {response.status_code} for {reg_id}")
-                    if response.text:
-                        logger.debug(f"Response body: {response.text[:500]}...")
+                        logger.warning(f"HTTP {response.status_code} for {reg_id}")
+                        # Only the head of an error body is logged - don't download the rest
+                        body = next(response.iter_content(STREAM_CHUNK_SIZE), b'')
+                        if body:
+                            logger.debug(f"Response body: {body[:500].decode('utf-8', 'replace')}...")
 
             except requests.exceptions.Timeout:
                 self.consecutive_failures += 1
@@ -200,9 +404,23 @@ class AHPRAClient:
         except requests.exceptions.RequestException:
             return False
 
+    def reset_session(self) -> None:
+        """
+        Start over with a fresh shared session (new cookies and connections).
+
+        Used after long cooldowns so the WAF sees a new client session.
+        """
+        self.session = _reset_session()
+        self._cookies_initialized = False
+
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """
+        Release the client.
+
+        The underlying session is shared process-wide and closed at exit,
+        so this does not tear down pooled connections.
+        """
+        pass
 
     def __enter__(self):
         return self
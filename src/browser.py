@@ -3,8 +3,9 @@ Browser management using Playwright for AHPRA scraper.
 """
 
 import random
-from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+import re
+from typing import Dict, Optional
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Locator
 from loguru import logger
 
 from config.settings import (
@@ -14,8 +15,13 @@ from config.settings import (
     VIEWPORT_WIDTH,
     VIEWPORT_HEIGHT,
     USER_AGENTS,
+    BROWSER_LAUNCH_ARGS,
+    BLOCKED_RESOURCE_PATTERN,
 )
 
+# Compiled once: Playwright matches a regex route against the full URL
+_BLOCKED_RESOURCE_RE = re.compile(BLOCKED_RESOURCE_PATTERN, re.IGNORECASE)
+
 
 class BrowserManager:
     """
@@ -35,6 +41,8 @@ class BrowserManager:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self._user_agent = None
+        # Locators keyed by selector string (reset whenever the page is recreated)
+        self._locator_cache: Dict[str, Locator] = {}
 
     def __enter__(self):
         """Context manager entry."""
@@ -56,11 +64,8 @@ class BrowserManager:
         # Use Chromium for best compatibility
         self.browser = self.playwright.chromium.launch(
             headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-            ]
+            args=BROWSER_LAUNCH_ARGS,
+            chromium_sandbox=False,
         )
 
         # Rotate user agent
@@ -77,18 +82,30 @@ class BrowserManager:
         # Set default timeouts
         self.context.set_default_timeout(BROWSER_TIMEOUT)
         self.context.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+        self._block_unneeded_resources()
 
         # Create page
         self.page = self.context.new_page()
 
         logger.info(f"Browser started with user agent: {self._user_agent[:50]}...")
 
+    def _block_unneeded_resources(self) -> None:
+        """
+        Abort image/font/media requests for every page in the current context.
+
+        Only URLs matching BLOCKED_RESOURCE_PATTERN are routed; everything
+        else bypasses the handler entirely.
+        """
+        self.context.route(_BLOCKED_RESOURCE_RE, lambda route: route.abort())
+
     def close(self) -> None:
         """
         Close the browser and cleanup resources.
         """
         logger.info("Closing browser")
 
+        self._locator_cache.clear()
+
         if self.page:
             self.page.close()
             self.page = None
@@ -220,6 +237,24 @@ class BrowserManager:
         """
         return self.page.query_selector_all(selector)
 
+    def _loc(self, selector: str) -> Locator:
+        """
+        Get a cached Locator for a selector on the current page.
+
+        Locators are lazy and re-resolve on every use, so one instance per
+        selector can be reused across navigations of the same page.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Locator for the selector
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
+
     def get_element_text(self, selector: str) -> Optional[str]:
         """
         Get text content of an element.
@@ -231,9 +266,9 @@ class BrowserManager:
             Text content or None
         """
         try:
-            element = self.page.query_selector(selector)
-            if element:
-                return element.text_content()
+            locator = self._loc(selector)
+            if locator.count():
+                return locator.first.text_content()
         except Exception as e:
             logger.debug(f"Failed to get text for {selector}: {e}")
         return None
@@ -250,9 +285,9 @@ class BrowserManager:
             Attribute value or None
         """
         try:
-            element = self.page.query_selector(selector)
-            if element:
-                return element.get_attribute(attribute)
+            locator = self._loc(selector)
+            if locator.count():
+                return locator.first.get_attribute(attribute)
         except Exception as e:
             logger.debug(f"Failed to get attribute {attribute} for {selector}: {e}")
         return None
@@ -273,7 +308,8 @@ class BrowserManager:
         """
         logger.info("Rotating user agent")
 
-        # Close current page and context
+        # Close current page and context (cached locators belong to the old page)
+        self._locator_cache.clear()
         if self.page:
             self.page.close()
         if self.context:
@@ -289,6 +325,7 @@ class BrowserManager:
         )
         self.context.set_default_timeout(BROWSER_TIMEOUT)
         self.context.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+        self._block_unneeded_resources()
         self.page = self.context.new_page()
 
         logger.info(f"New user agent: {self._user_agent[:50]}...")
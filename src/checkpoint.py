@@ -2,18 +2,225 @@
 Checkpoint management for resumable scraping.
 """
 
+import itertools
 import json
+import mmap
+import os
+import sys
 import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Set, Dict, Any, Optional, List
+from typing import Set, Dict, Any, Optional, List, Iterable, Iterator, BinaryIO, Tuple
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Stats side file falls back to JSON
+    msgpack = None
+
 from config.settings import (
     CHECKPOINT_DIR, CHECKPOINT_INTERVAL, AUTO_SAVE_INTERVAL,
     DISCOVERY_DIR, DISCOVERED_IDS_FILE
 )
 
+# Rewrite the full discovered_ids snapshot only once the append-only delta log
+# (the raw backup) has grown past this fraction of the snapshot size
+COMPACT_RATIO = 0.25
+COMPACT_MIN_DELTA = 1000  # Never compact for fewer new IDs than this
+
+# Raw backup writes are buffered and synced to disk once this many bytes are
+# pending, or at prefix/combination boundaries
+RAW_BACKUP_BUFFER_SIZE = 64 * 1024
+
+# fdatasync is not available on every platform (e.g. macOS, Windows)
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _sync_raw_backup_fd(fd: int) -> None:
+    """
+    fdatasync the raw backup and drop its now-clean pages from the page cache.
+
+    The log is write-once and only read back on crash recovery, so keeping
+    it cached just evicts pages the scraper actually uses (the same benefit
+    O_DIRECT gives, without its block-alignment rules for small appends).
+    """
+    _fdatasync(fd)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+# JSON files larger than this are parsed straight from a read-only mmap
+MMAP_LOAD_THRESHOLD = 8 * 1024 * 1024
+
+# Large ID collections are written in batches of this many items, through a
+# write buffer of WRITE_BUFFER_SIZE bytes, instead of copying them into one list
+WRITE_BATCH_SIZE = 8192
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# When none of the checkpoint sets changed, a save only rewrites the small stats
+# side file; the full checkpoint is still rewritten every this many such saves
+FULL_SAVE_EVERY = 10
+
+
+# Search combination key: (profession, state, suburb or None, prefix)
+CombinationKey = Tuple[str, str, Optional[str], str]
+
+# Cached (epoch seconds, ISO string) for _fast_now_iso
+_last_iso = [0.0, ""]
+
+
+def _fast_now_iso() -> str:
+    """Current local time as an ISO string, recomputed at most once per second."""
+    now = time.time()
+    if now - _last_iso[0] > 1.0:
+        _last_iso[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _last_iso[1]
+
+
+def _parse_combination_key(value: Any) -> Optional[CombinationKey]:
+    """
+    Convert a persisted combination key back to a tuple.
+
+    Accepts the JSON array form and the legacy pipe-joined string
+    ("profession|state|prefix" or "profession|state|suburb|prefix").
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        parts = value.split('|')
+        if len(parts) == 3:
+            return (parts[0], parts[1], None, parts[2])
+        return tuple(parts)
+    return tuple(value)
+
+
+def _fsync_path(path: Path) -> None:
+    """
+    Flush a renamed file and its directory entry to disk.
+
+    The file is fsynced for its contents, and on POSIX the parent directory
+    is fsynced too so the rename itself survives a power loss.
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    if os.name == 'posix':
+        dir_fd = os.open(str(path.parent), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes (orjson when available).
+
+    Checkpoints are not pretty-printed; use `python -m json.tool` to inspect one.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _iter_batches(values: Iterable[Any], size: int = WRITE_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items from an iterable."""
+    it = iter(values)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _write_json_array(f: BinaryIO, values: Iterable[Any]) -> None:
+    """
+    Stream a collection (strings or key tuples) to a binary file as a JSON array.
+
+    Each batch is encoded as its own array and spliced in without its
+    brackets, so only one batch is ever materialised as a list.
+    """
+    f.write(b'[')
+    first = True
+    for batch in _iter_batches(values):
+        if not first:
+            f.write(b',')
+        f.write(_json_dumps(batch)[1:-1])
+        first = False
+    f.write(b']')
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file as raw bytes (orjson when available).
+
+    Large files are mapped into memory so orjson parses directly from the
+    page cache instead of copying through a Python read buffer first.
+    """
+    if orjson is not None and path.stat().st_size > MMAP_LOAD_THRESHOLD:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_id_lines(path: Path) -> List[str]:
+    """
+    Read a newline-delimited reg_id file (snapshot or delta log), interning each ID.
+
+    Large files are decoded straight out of a read-only mmap, skipping the
+    intermediate bytes copy; splitting and interning both run in C.
+    """
+    if path.stat().st_size > MMAP_LOAD_THRESHOLD:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+    else:
+        text = path.read_bytes().decode('utf-8')
+
+    return list(map(sys.intern, text.split()))
+
+
+def load_discovered_reg_ids(discovered_ids_file: Path = DISCOVERED_IDS_FILE) -> List[str]:
+    """
+    Load discovered reg_ids without a CheckpointManager (for extraction scripts).
+
+    Reads the snapshot (or the legacy discovered_ids.json) followed by the
+    delta log, dropping duplicates while keeping file order.
+
+    Args:
+        discovered_ids_file: Path to the discovered IDs snapshot
+
+    Returns:
+        List of discovered reg_ids
+    """
+    reg_ids: List[str] = []
+    legacy_json = discovered_ids_file.with_suffix('.json')
+    if discovered_ids_file.exists():
+        reg_ids = _read_id_lines(discovered_ids_file)
+    elif legacy_json.exists():
+        reg_ids = list(map(sys.intern, _read_json(legacy_json).get('reg_ids', [])))
+
+    raw_backup = discovered_ids_file.with_suffix('.raw.txt')
+    if raw_backup.exists():
+        reg_ids.extend(_read_id_lines(raw_backup))
+
+    return list(dict.fromkeys(reg_ids))
+
 
 class CheckpointManager:
     """
@@ -26,6 +233,23 @@ class CheckpointManager:
     - Statistics and metadata
     """
 
+    # Fixed attribute layout: no per-instance __dict__ for the GC to traverse
+    __slots__ = (
+        'checkpoint_name', 'checkpoint_file', 'checkpoint_stats_file',
+        '_stats_json_file', '_stats_msgpack_file',
+        'reg_ids_file', 'discovered_ids_file', 'legacy_discovered_ids_json',
+        'discovered_ids_meta_file', 'raw_ids_backup_file', 'combination_queue_file',
+        'combinations_log_file', '_unlogged_combinations', '_combination_log_count',
+        '_raw_backup_handle', '_raw_written_since_sync', '_sync_executor', '_pending_sync',
+        '_snapshot_count', '_delta_count',
+        'completed_prefixes', 'completed_combinations', 'empty_combinations', 'scraped_reg_ids',
+        'extracted_reg_ids', 'failed_reg_ids',
+        'current_prefix', 'current_page', 'current_combination',
+        '_pending_cache', '_dirty', '_persisted_sizes', '_soft_saves', '_save_seq', '_generation',
+        'discovery_started_at', 'discovery_last_updated',
+        'stats', '_last_auto_save',
+    )
+
     def __init__(self, checkpoint_name: str = "scraper", discovered_ids_file: Optional[Path] = None):
         """
         Initialize checkpoint manager.
@@ -38,26 +262,67 @@ class CheckpointManager:
         """
         self.checkpoint_name = checkpoint_name
         self.checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_name}_checkpoint.json"
+        # Scalar fields only (position, stats), written when no set has changed.
+        # msgpack when available; the JSON name is still read on load.
+        self._stats_json_file = self.checkpoint_file.with_suffix('.stats.json')
+        self._stats_msgpack_file = self.checkpoint_file.with_suffix('.stats.msgpack')
+        self.checkpoint_stats_file = (
+            self._stats_msgpack_file if msgpack is not None else self._stats_json_file
+        )
         self.reg_ids_file = DISCOVERY_DIR / "reg_ids.txt"  # Legacy flat file (for migration)
+        # Remaining multi-dimensional combinations, so resume doesn't rebuild the plan
+        self.combination_queue_file = CHECKPOINT_DIR / f"{checkpoint_name}_combination_queue.json"
+        # Append-only delta log of combinations completed / found empty since the
+        # last full checkpoint write, so saves don't rewrite the growing sets
+        self.combinations_log_file = CHECKPOINT_DIR / f"{checkpoint_name}_combinations.log"
+        self._unlogged_combinations: List[Tuple[str, CombinationKey]] = []  # ('c'|'e', key) not yet appended
+        self._combination_log_count = 0  # Entries in the delta log file
         # Use custom path if provided (for test isolation), otherwise use global file
         self.discovered_ids_file = discovered_ids_file if discovered_ids_file else DISCOVERED_IDS_FILE
+        self.legacy_discovered_ids_json = self.discovered_ids_file.with_suffix('.json')  # For migration
+
+        # Small metadata file (timestamps, counts) rewritten on every save
+        self.discovered_ids_meta_file = self.discovered_ids_file.with_suffix('.meta.json')
 
         # RAW BACKUP: Append-only file for immediate ID backup (failsafe)
-        # This file gets each ID appended immediately when found - never loses data
+        # This file gets each ID appended immediately when found - never loses data.
+        # It doubles as the delta log on top of the discovered_ids.txt snapshot:
+        # saves only touch the metadata file, and the snapshot is rewritten
+        # (and this log truncated) once the log grows large enough.
         self.raw_ids_backup_file = self.discovered_ids_file.with_suffix('.raw.txt')
         self._raw_backup_handle = None
+        self._raw_written_since_sync = 0  # Bytes buffered since the last fdatasync
+        self._sync_executor: Optional[ThreadPoolExecutor] = None  # Background fdatasync
+        self._pending_sync: Optional[Future] = None
+        self._snapshot_count = 0  # IDs in the on-disk snapshot
+        self._delta_count = 0     # IDs appended to the delta log since last compaction
 
         # Checkpoint data
         self.completed_prefixes: Set[str] = set()
-        self.completed_combinations: Set[str] = set()  # For multi-dimensional search
+        self.completed_combinations: Set[CombinationKey] = set()  # For multi-dimensional search
+        self.empty_combinations: Set[CombinationKey] = set()  # Searched combinations with zero results
         self.scraped_reg_ids: Set[str] = set()  # In-memory set for dedup during discovery
         self.extracted_reg_ids: Set[str] = set()
         self.failed_reg_ids: Set[str] = set()  # Track IDs that failed extraction
         self.current_prefix: Optional[str] = None
         self.current_page: int = 0
-        self.current_combination: Optional[str] = None  # For multi-dimensional search
-
-        # Discovery metadata (stored in discovered_ids.json)
+        self.current_combination: Optional[CombinationKey] = None  # For multi-dimensional search
+
+        # Cached pending count as (len(scraped), len(extracted), pending). The sizes
+        # detect direct mutation of the sets by callers, which forces a recount.
+        self._pending_cache: Optional[tuple] = None
+
+        # Change tracking for partial saves. _dirty is set by the mark_* methods;
+        # the set sizes catch callers that mutate the sets directly.
+        self._dirty = False
+        self._persisted_sizes: Optional[tuple] = None
+        self._soft_saves = 0
+        self._save_seq = 0  # Orders the checkpoint and stats side file on load
+        # Identifies the checkpoint a stats side file belongs to; renewed on reset
+        # so orphaned side files from an earlier run are ignored
+        self._generation: Optional[str] = uuid.uuid4().hex
+
+        # Discovery metadata (stored in discovered_ids.meta.json)
         self.discovery_started_at: Optional[str] = None
         self.discovery_last_updated: Optional[str] = None
 
@@ -79,28 +344,48 @@ class CheckpointManager:
 
     def load(self) -> bool:
         """
-        Load checkpoint from file and reg_ids from JSON (or migrate from flat file).
+        Load checkpoint from file and reg_ids from the snapshot (or migrate legacy files).
 
         Returns:
             True if checkpoint loaded successfully, False otherwise
         """
-        # Try to load from new JSON format first
+        migrated = False
+
+        # Try to load the newline-delimited snapshot first
         if self.discovered_ids_file.exists():
             try:
-                self._load_discovered_ids_json()
+                self._load_discovered_ids()
                 logger.info(f"Loaded {len(self.scraped_reg_ids)} reg_ids from {self.discovered_ids_file}")
             except Exception as e:
-                logger.error(f"Failed to load discovered_ids.json: {e}")
+                logger.error(f"Failed to load discovered IDs: {e}")
+        # Fall back to legacy discovered_ids.json and migrate
+        elif self.legacy_discovered_ids_json.exists():
+            try:
+                self._migrate_from_json()
+                migrated = True
+                logger.info(f"Migrating {len(self.scraped_reg_ids)} reg_ids from {self.legacy_discovered_ids_json}")
+            except Exception as e:
+                logger.error(f"Failed to migrate discovered_ids.json: {e}")
         # Fall back to legacy flat file and migrate
         elif self.reg_ids_file.exists():
             try:
                 self._migrate_from_txt()
-                logger.info(f"Migrated {len(self.scraped_reg_ids)} reg_ids from {self.reg_ids_file} to JSON format")
+                migrated = True
+                logger.info(f"Migrating {len(self.scraped_reg_ids)} reg_ids from {self.reg_ids_file}")
             except Exception as e:
                 logger.error(f"Failed to migrate reg_ids file: {e}")
 
         # AUTO-RECOVER: Check raw backup for any IDs missed due to crash
         self.recover_from_raw_backup()
+        self._pending_cache = None
+
+        # Write the migrated snapshot only after the raw backup has been replayed,
+        # since compaction truncates it
+        if migrated and not self.discovered_ids_file.exists():
+            try:
+                self.compact_discovered_ids()
+            except Exception as e:
+                logger.error(f"Failed to write migrated discovered IDs: {e}")
 
         # Load checkpoint JSON
         if not self.checkpoint_file.exists():
@@ -110,17 +395,41 @@ class CheckpointManager:
             return len(self.scraped_reg_ids) > 0
 
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(self.checkpoint_file)
 
             self.completed_prefixes = set(data.get('completed_prefixes', []))
-            self.completed_combinations = set(data.get('completed_combinations', []))
-            self.extracted_reg_ids = set(data.get('extracted_reg_ids', []))
-            self.failed_reg_ids = set(data.get('failed_reg_ids', []))
+            self.completed_combinations = set(
+                map(_parse_combination_key, data.get('completed_combinations', []))
+            )
+            self.empty_combinations = set(
+                map(_parse_combination_key, data.get('empty_combinations', []))
+            )
+            # Intern so IDs shared with scraped_reg_ids are stored once
+            self.extracted_reg_ids = set(map(sys.intern, data.get('extracted_reg_ids', [])))
+            self.failed_reg_ids = set(map(sys.intern, data.get('failed_reg_ids', [])))
+            self._pending_cache = None
             self.current_prefix = data.get('current_prefix')
             self.current_page = data.get('current_page', 0)
-            self.current_combination = data.get('current_combination')
+            self.current_combination = _parse_combination_key(data.get('current_combination'))
             self.stats = data.get('stats', self.stats)
+            self._save_seq = data.get('save_seq', 0)
+            self._generation = data.get('generation')
+
+            # Stats side file holds newer scalar fields if written after the checkpoint
+            side = self._load_stats_side_file(self._generation)
+            if side and side.get('save_seq', 0) > self._save_seq:
+                self.current_prefix = side.get('current_prefix')
+                self.current_page = side.get('current_page', 0)
+                self.current_combination = _parse_combination_key(side.get('current_combination'))
+                self.stats = side.get('stats', self.stats)
+                self._save_seq = side['save_seq']
+
+            # Replay combinations logged since the checkpoint was written
+            self._replay_combinations_log()
+
+            self._dirty = False
+            self._persisted_sizes = self._set_sizes()
+            self._soft_saves = 0
 
             # Update total_discovered from actual count
             self.stats['total_discovered'] = len(self.scraped_reg_ids)
@@ -137,62 +446,110 @@ class CheckpointManager:
             logger.error(f"Failed to load checkpoint: {e}")
             return False
 
-    def _load_discovered_ids_json(self) -> None:
-        """Load discovered reg_ids from JSON file."""
-        with open(self.discovered_ids_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def _load_discovered_ids(self) -> None:
+        """Load discovered reg_ids from the snapshot and timestamps from the metadata file."""
+        self.scraped_reg_ids = set(_read_id_lines(self.discovered_ids_file))
+        self._snapshot_count = len(self.scraped_reg_ids)
 
-        self.scraped_reg_ids = set(data.get('reg_ids', []))
+        if self.discovered_ids_meta_file.exists():
+            try:
+                meta = _read_json(self.discovered_ids_meta_file)
+                self.discovery_started_at = meta.get('started_at')
+                self.discovery_last_updated = meta.get('last_updated')
+            except Exception as e:
+                logger.warning(f"Failed to load discovered_ids metadata: {e}")
+
+    def _migrate_from_json(self) -> None:
+        """Load legacy discovered_ids.json (reg_ids list plus metadata) for migration."""
+        data = _read_json(self.legacy_discovered_ids_json)
+
+        self.scraped_reg_ids = set(map(sys.intern, data.get('reg_ids', [])))
         self.discovery_started_at = data.get('started_at')
         self.discovery_last_updated = data.get('last_updated')
 
     def _migrate_from_txt(self) -> None:
-        """Migrate legacy reg_ids.txt to new JSON format."""
-        # Load from flat file
-        with open(self.reg_ids_file, 'r', encoding='utf-8') as f:
-            self.scraped_reg_ids = set(line.strip() for line in f if line.strip())
+        """Load legacy reg_ids.txt for migration."""
+        self.scraped_reg_ids = set(_read_id_lines(self.reg_ids_file))
 
         # Set initial timestamps
-        self.discovery_started_at = datetime.now().isoformat()
-        self.discovery_last_updated = datetime.now().isoformat()
+        self.discovery_started_at = _fast_now_iso()
+        self.discovery_last_updated = _fast_now_iso()
 
-        # Save to new JSON format
-        self._save_discovered_ids_json()
+    def save(self, durable: bool = False) -> bool:
+        """
+        Save checkpoint to file and discovered IDs metadata (and snapshot if due).
 
-        logger.info(f"Migration complete: {len(self.scraped_reg_ids)} reg_ids migrated to JSON format")
+        Regular saves are atomic (temp file + rename) but not fsynced, keeping
+        fsync stalls off the discovery loop. Pass durable=True at real exit
+        points to also flush the files and their directory entries to disk.
 
-    def save(self) -> bool:
-        """
-        Save checkpoint to file and discovered_ids to JSON.
+        If none of the checkpoint sets changed since the last full write, only
+        the scalar fields are written to the small stats side file. Newly
+        completed / empty combinations are appended to a delta log instead of
+        rewriting the sets; the log is folded into a full write once it grows
+        past COMPACT_RATIO of the completed set.
+
+        Args:
+            durable: fsync the written files and their directory
 
         Returns:
             True if saved successfully, False otherwise
         """
         try:
             # Update save time and stats
-            self.stats['last_save_time'] = datetime.now().isoformat()
+            self.stats['last_save_time'] = _fast_now_iso()
             self.stats['total_discovered'] = len(self.scraped_reg_ids)
 
-            data = {
-                'completed_prefixes': list(self.completed_prefixes),
-                'completed_combinations': list(self.completed_combinations),
-                'extracted_reg_ids': list(self.extracted_reg_ids),
-                'failed_reg_ids': list(self.failed_reg_ids),
+            self._save_seq += 1
+            fields = {
                 'current_prefix': self.current_prefix,
                 'current_page': self.current_page,
                 'current_combination': self.current_combination,
                 'stats': self.stats,
+                'save_seq': self._save_seq,
+                'generation': self._generation,
             }
 
-            # Write to temp file first, then rename (atomic)
-            temp_file = self.checkpoint_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-
-            temp_file.replace(self.checkpoint_file)
+            sizes = self._set_sizes()
+            unlogged = self._unlogged_combinations
+            full = (
+                durable
+                or self._dirty
+                or sizes != self._expected_sizes()
+                or self._combination_log_count + len(unlogged) >= max(
+                    COMPACT_MIN_DELTA, COMPACT_RATIO * len(self.completed_combinations)
+                )
+                or (not unlogged and self._soft_saves >= FULL_SAVE_EVERY)
+                or not self.checkpoint_file.exists()
+            )
 
-            # Also save discovered_ids JSON
-            self._save_discovered_ids_json()
+            if full:
+                self._write_checkpoint(fields, durable)
+                self._truncate_combinations_log()
+                self._dirty = False
+                self._persisted_sizes = sizes
+                self._soft_saves = 0
+            else:
+                if unlogged:
+                    # Only the combination sets grew: append the new keys
+                    self._append_combinations_log()
+                    self._persisted_sizes = sizes
+                else:
+                    self._soft_saves += 1
+
+                # Write to temp file first, then rename (atomic)
+                temp_file = self.checkpoint_stats_file.with_suffix('.tmp')
+                if msgpack is not None:
+                    temp_file.write_bytes(msgpack.packb(fields))
+                else:
+                    temp_file.write_bytes(_json_dumps(fields))
+                temp_file.replace(self.checkpoint_stats_file)
+
+            # Make sure every ID counted in the checkpoint reaches the disk
+            self.sync_raw_backup(wait=durable)
+
+            # Also save discovered IDs
+            self._save_discovered_ids(durable)
 
             logger.debug(f"Checkpoint saved to {self.checkpoint_file}")
             self._last_auto_save = time.time()
@@ -202,28 +559,218 @@ class CheckpointManager:
             logger.error(f"Failed to save checkpoint: {e}")
             return False
 
-    def _save_discovered_ids_json(self) -> None:
-        """Save discovered reg_ids to JSON file with metadata."""
+    def _load_stats_side_file(self, generation: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Load the newest stats side file (msgpack or JSON) for a checkpoint.
+
+        Args:
+            generation: Generation id of the loaded checkpoint; side files
+                        written for any other checkpoint are ignored
+
+        Returns:
+            Scalar fields dict with the highest save_seq, or None
+        """
+        candidates = []
+        if msgpack is not None and self._stats_msgpack_file.exists():
+            try:
+                candidates.append(msgpack.unpackb(self._stats_msgpack_file.read_bytes()))
+            except Exception as e:
+                logger.warning(f"Failed to load checkpoint stats file: {e}")
+        if self._stats_json_file.exists():
+            try:
+                candidates.append(_read_json(self._stats_json_file))
+            except Exception as e:
+                logger.warning(f"Failed to load checkpoint stats file: {e}")
+
+        candidates = [side for side in candidates if side.get('generation') == generation]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda side: side.get('save_seq', 0))
+
+    def clear_stats_side_files(self) -> None:
+        """Delete the stats side files (msgpack and JSON) on reset."""
+        for path in (self._stats_msgpack_file, self._stats_json_file):
+            try:
+                path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error(f"Failed to delete checkpoint stats file {path}: {e}")
+
+    def _set_sizes(self) -> tuple:
+        """Sizes of the sets persisted in the checkpoint file (for change detection)."""
+        return (
+            len(self.completed_prefixes), len(self.completed_combinations),
+            len(self.empty_combinations), len(self.extracted_reg_ids), len(self.failed_reg_ids),
+        )
+
+    def _expected_sizes(self) -> Optional[tuple]:
+        """
+        Set sizes accounted for by the checkpoint file, its delta log and the
+        keys waiting to be logged. Any other difference means a caller changed
+        a set directly, which needs a full write.
+        """
+        if self._persisted_sizes is None:
+            return None
+        completed = sum(1 for kind, _ in self._unlogged_combinations if kind == 'c')
+        empty = len(self._unlogged_combinations) - completed
+        prefixes, combinations, empties, *rest = self._persisted_sizes
+        return (prefixes, combinations + completed, empties + empty, *rest)
+
+    def _append_combinations_log(self) -> None:
+        """Append the pending completed/empty combination keys to the delta log."""
+        with open(self.combinations_log_file, 'ab') as f:
+            f.write(b''.join(
+                _json_dumps([kind, *key]) + b'\n' for kind, key in self._unlogged_combinations
+            ))
+        self._combination_log_count += len(self._unlogged_combinations)
+        self._unlogged_combinations = []
+
+    def _truncate_combinations_log(self) -> None:
+        """Drop the delta log once a full checkpoint write has absorbed it."""
+        self._unlogged_combinations = []
+        self._combination_log_count = 0
+        if self.combinations_log_file.exists():
+            self.combinations_log_file.unlink()
+
+    def _replay_combinations_log(self) -> None:
+        """Apply combination keys logged after the checkpoint file was written."""
+        self._combination_log_count = 0
+        if not self.combinations_log_file.exists():
+            return
+
+        with open(self.combinations_log_file, 'rb') as f:
+            for line in f:
+                try:
+                    kind, *key = orjson.loads(line) if orjson is not None else json.loads(line)
+                except Exception:
+                    continue  # Torn final line from a crash mid-append
+                target = self.completed_combinations if kind == 'c' else self.empty_combinations
+                target.add(_parse_combination_key(key))
+                self._combination_log_count += 1
+
+        if self._combination_log_count:
+            logger.info(f"Replayed {self._combination_log_count} combinations from {self.combinations_log_file}")
+
+    def _write_checkpoint(self, fields: Dict[str, Any], durable: bool) -> None:
+        """
+        Write the full checkpoint file: all sets plus the scalar fields.
+
+        Args:
+            fields: Scalar fields (position, stats, save_seq)
+            durable: fsync the file and its directory
+        """
+        # Large collections are streamed straight from the sets
+        arrays = {
+            'completed_prefixes': self.completed_prefixes,
+            'completed_combinations': self.completed_combinations,
+            'empty_combinations': self.empty_combinations,
+            'extracted_reg_ids': self.extracted_reg_ids,
+            'failed_reg_ids': self.failed_reg_ids,
+        }
+
+        # Write to temp file first, then rename (atomic)
+        temp_file = self.checkpoint_file.with_suffix('.tmp')
+        with open(temp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{')
+            for key, values in arrays.items():
+                f.write(b'"' + key.encode('utf-8') + b'":')
+                _write_json_array(f, values)
+                f.write(b',')
+            f.write(_json_dumps(fields)[1:-1] + b'}')
+
+        temp_file.replace(self.checkpoint_file)
+        if durable:
+            _fsync_path(self.checkpoint_file)
+
+    def _save_discovered_ids(self, durable: bool = False) -> None:
+        """
+        Save discovery metadata, compacting the delta log into the snapshot if needed.
+
+        The full reg_ids list is only rewritten when the delta log has grown
+        past COMPACT_RATIO of the snapshot - otherwise a save is O(1).
+
+        Args:
+            durable: fsync the metadata file and its directory
+        """
         # Update last_updated timestamp
-        self.discovery_last_updated = datetime.now().isoformat()
+        self.discovery_last_updated = _fast_now_iso()
 
         # Set started_at if this is a new discovery
         if not self.discovery_started_at:
-            self.discovery_started_at = datetime.now().isoformat()
+            self.discovery_started_at = _fast_now_iso()
+
+        if self._needs_compaction():
+            self.compact_discovered_ids()
+        else:
+            self._write_discovered_ids_meta(durable)
+
+    def _write_discovered_ids_meta(self, durable: bool = False) -> None:
+        """
+        Write the small discovered IDs metadata file (timestamps, count).
 
-        data = {
+        Args:
+            durable: fsync the file and its directory
+        """
+        meta = {
             'started_at': self.discovery_started_at,
             'last_updated': self.discovery_last_updated,
             'total_count': len(self.scraped_reg_ids),
-            'reg_ids': list(self.scraped_reg_ids),
         }
 
+        # Write to temp file first, then rename (atomic)
+        temp_file = self.discovered_ids_meta_file.with_suffix('.tmp')
+        temp_file.write_bytes(_json_dumps(meta))
+
+        temp_file.replace(self.discovered_ids_meta_file)
+        if durable:
+            _fsync_path(self.discovered_ids_meta_file)
+
+    def _needs_compaction(self) -> bool:
+        """Check whether the delta log should be folded into the snapshot."""
+        if not self.discovered_ids_file.exists():
+            return True
+        threshold = max(self._snapshot_count * COMPACT_RATIO, COMPACT_MIN_DELTA)
+        return self._delta_count > threshold
+
+    def compact_discovered_ids(self) -> None:
+        """
+        Write a full discovered IDs snapshot (one ID per line) and truncate the delta log.
+
+        The snapshot is renamed into place and fsynced before the log is
+        truncated, so a crash in between only leaves duplicate IDs in the log
+        (deduped on load). This is the one write that is always durable, since
+        it is the point where the log stops being the only copy of new IDs.
+        """
         # Write to temp file first, then rename (atomic)
         temp_file = self.discovered_ids_file.with_suffix('.tmp')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with open(temp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for batch in _iter_batches(self.scraped_reg_ids):
+                f.write('\n'.join(batch).encode('utf-8'))
+                f.write(b'\n')
 
         temp_file.replace(self.discovered_ids_file)
+        _fsync_path(self.discovered_ids_file)
+        self._write_discovered_ids_meta(durable=True)
+
+        # Snapshot is durable - truncate the delta log
+        self._close_raw_backup_handle()
+        if self.raw_ids_backup_file.exists():
+            self.raw_ids_backup_file.write_text('', encoding='utf-8')
+
+        logger.debug(
+            f"Compacted {self._delta_count} logged IDs into snapshot "
+            f"({len(self.scraped_reg_ids)} total)"
+        )
+        self._snapshot_count = len(self.scraped_reg_ids)
+        self._delta_count = 0
+
+    def auto_save_due(self) -> bool:
+        """
+        Check whether the next auto_save_if_needed() call will save.
+
+        Returns:
+            True if enough time has passed since the last auto-save
+        """
+        return time.time() - self._last_auto_save >= AUTO_SAVE_INTERVAL
 
     def auto_save_if_needed(self) -> bool:
         """
@@ -232,7 +779,7 @@ class CheckpointManager:
         Returns:
             True if saved, False otherwise
         """
-        if time.time() - self._last_auto_save >= AUTO_SAVE_INTERVAL:
+        if self.auto_save_due():
             return self.save()
         return False
 
@@ -268,8 +815,10 @@ class CheckpointManager:
             prefix: Search prefix
         """
         self.completed_prefixes.add(prefix)
+        self._dirty = True
         self.current_prefix = None
         self.current_page = 0
+        self.sync_raw_backup()
         logger.debug(f"Marked prefix '{prefix}' as completed")
 
     def set_current_position(self, prefix: str, page: int) -> None:
@@ -308,49 +857,171 @@ class CheckpointManager:
         Returns:
             True if new (not duplicate), False if already exists
         """
-        if reg_id in self.scraped_reg_ids:
+        reg_id = sys.intern(reg_id)
+
+        # Single hash probe: add() is a no-op for duplicates, so the size
+        # change tells us whether the ID was new
+        before = len(self.scraped_reg_ids)
+        self.scraped_reg_ids.add(reg_id)
+        if len(self.scraped_reg_ids) == before:
             logger.debug(f"Duplicate reg_id skipped: {reg_id}")
             return False
 
-        self.scraped_reg_ids.add(reg_id)
+        self._update_pending_cache(
+            (before, len(self.extracted_reg_ids)),
+            0 if reg_id in self.extracted_reg_ids else 1,
+        )
+
         self.stats['total_discovered'] += 1
 
         # IMMEDIATELY append to raw backup file (failsafe)
         self._append_to_raw_backup(reg_id)
+        self._delta_count += 1
 
         return True
 
+    def save_reg_ids_batch(self, reg_ids: Iterable[str]) -> int:
+        """
+        Save a page worth of discovered reg_ids in one pass.
+
+        Same semantics as save_reg_id, but the new IDs reach the raw backup
+        file as a single write.
+
+        Args:
+            reg_ids: Registration IDs (duplicates are skipped)
+
+        Returns:
+            Number of new reg_ids added
+        """
+        scraped = self.scraped_reg_ids
+        sizes_before = (len(scraped), len(self.extracted_reg_ids))
+
+        new_ids = []
+        for reg_id in reg_ids:
+            if reg_id not in scraped:
+                reg_id = sys.intern(reg_id)
+                scraped.add(reg_id)
+                new_ids.append(reg_id)
+
+        if not new_ids:
+            return 0
+
+        extracted = self.extracted_reg_ids
+        self._update_pending_cache(
+            sizes_before, sum(1 for reg_id in new_ids if reg_id not in extracted)
+        )
+
+        self.stats['total_discovered'] += len(new_ids)
+
+        # IMMEDIATELY append to raw backup file (failsafe)
+        self._append_to_raw_backup('\n'.join(new_ids))
+        self._delta_count += len(new_ids)
+
+        return len(new_ids)
+
     def _append_to_raw_backup(self, reg_id: str) -> None:
         """
-        Append a single reg_id to the raw backup file immediately.
+        Append a reg_id (or newline-joined reg_ids) to the buffered raw backup file.
 
-        This is an append-only operation that ensures data is never lost.
+        Writes are coalesced in a RAW_BACKUP_BUFFER_SIZE buffer and synced once
+        it fills, and at every prefix/combination boundary and save.
         """
         try:
             # Open file handle if not already open
             if self._raw_backup_handle is None:
-                self._raw_backup_handle = open(self.raw_ids_backup_file, 'a', encoding='utf-8')
+                self._raw_backup_handle = open(
+                    self.raw_ids_backup_file, 'ab', buffering=RAW_BACKUP_BUFFER_SIZE
+                )
 
-            self._raw_backup_handle.write(reg_id + '\n')
-            self._raw_backup_handle.flush()  # Flush immediately
+            line = (reg_id + '\n').encode('utf-8')
+            self._raw_backup_handle.write(line)
+            self._raw_written_since_sync += len(line)
+
+            if self._raw_written_since_sync >= RAW_BACKUP_BUFFER_SIZE:
+                self.sync_raw_backup()
         except Exception as e:
             logger.error(f"Failed to write to raw backup: {e}")
 
+    def sync_raw_backup(self, wait: bool = False) -> None:
+        """
+        Flush buffered raw backup writes and fdatasync them to disk.
+
+        The flush (a write into the page cache) happens inline; the fdatasync
+        is handed to a background thread so the discovery loop doesn't stall
+        on the disk.
+
+        Args:
+            wait: Block until the data is on disk
+        """
+        if self._raw_backup_handle is None:
+            return
+
+        try:
+            if self._raw_written_since_sync:
+                self._raw_backup_handle.flush()
+                self._raw_written_since_sync = 0
+
+                if self._sync_executor is None:
+                    self._sync_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="raw-backup-sync"
+                    )
+                # Single worker: syncs run in order, so waiting on the latest
+                # one also covers every earlier flush
+                self._pending_sync = self._sync_executor.submit(
+                    _sync_raw_backup_fd, self._raw_backup_handle.fileno()
+                )
+
+            if wait:
+                self._wait_for_sync()
+        except Exception as e:
+            logger.error(f"Failed to sync raw backup: {e}")
+
+    def _wait_for_sync(self) -> None:
+        """Block until any in-flight raw backup fdatasync has finished."""
+        if self._pending_sync is not None:
+            try:
+                self._pending_sync.result()
+            except Exception as e:
+                logger.error(f"Failed to sync raw backup: {e}")
+            self._pending_sync = None
+
+    def _close_raw_backup_handle(self) -> None:
+        """Close the raw backup handle once its pending sync has completed."""
+        if self._raw_backup_handle is None:
+            return
+
+        self.sync_raw_backup(wait=True)
+        try:
+            self._raw_backup_handle.close()
+        except Exception:
+            pass
+        self._raw_backup_handle = None
+        self._raw_written_since_sync = 0
+
     def close_raw_backup(self) -> None:
-        """Close the raw backup file handle."""
-        if self._raw_backup_handle:
+        """Fold any logged IDs into the snapshot and close the raw backup file handle."""
+        if self._delta_count > 0:
             try:
-                self._raw_backup_handle.flush()
-                self._raw_backup_handle.close()
-            except Exception:
-                pass
-            self._raw_backup_handle = None
+                self.compact_discovered_ids()
+            except Exception as e:
+                logger.error(f"Failed to compact discovered IDs: {e}")
 
-    def recover_from_raw_backup(self) -> int:
+        self._close_raw_backup_handle()
+
+        if self._sync_executor is not None:
+            self._sync_executor.shutdown(wait=True)
+            self._sync_executor = None
+
+    def recover_from_raw_backup(self, save_after_recover: bool = False) -> int:
         """
-        Recover reg_ids from raw backup file that may not be in main JSON.
+        Recover reg_ids from raw backup file that may not be in the snapshot yet.
 
         This is useful if the process crashed before checkpoint.save() was called.
+        Recovered IDs stay in the raw backup until the next compaction, so the
+        save is deferred to the next auto-save rather than done here.
+
+        Args:
+            save_after_recover: Save immediately instead of deferring
 
         Returns:
             Number of IDs recovered
@@ -360,17 +1031,18 @@ class CheckpointManager:
 
         recovered = 0
         try:
-            with open(self.raw_ids_backup_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    reg_id = line.strip()
-                    if reg_id and reg_id not in self.scraped_reg_ids:
-                        self.scraped_reg_ids.add(reg_id)
-                        recovered += 1
+            logged_ids = _read_id_lines(self.raw_ids_backup_file)
+            before = len(self.scraped_reg_ids)
+            self.scraped_reg_ids.update(logged_ids)
+            recovered = len(self.scraped_reg_ids) - before
+            self._delta_count = len(logged_ids)
 
             if recovered > 0:
                 logger.info(f"Recovered {recovered} IDs from raw backup file")
-                # Save to main JSON immediately
-                self.save()
+                if save_after_recover:
+                    self.save()
+                else:
+                    self._last_auto_save = 0.0  # Force the next auto-save
 
         except Exception as e:
             logger.error(f"Failed to recover from raw backup: {e}")
@@ -379,25 +1051,22 @@ class CheckpointManager:
 
     def load_all_reg_ids(self) -> Set[str]:
         """
-        Load all reg_ids from JSON file (or legacy flat file).
+        Load all reg_ids from the snapshot plus delta log (or legacy files).
 
         Returns:
             Set of all discovered reg_ids
         """
-        # Try new JSON format first
-        if self.discovered_ids_file.exists():
+        # Snapshot (or legacy discovered_ids.json) plus delta log
+        if self.discovered_ids_file.exists() or self.legacy_discovered_ids_json.exists():
             try:
-                with open(self.discovered_ids_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return set(data.get('reg_ids', []))
+                return set(load_discovered_reg_ids(self.discovered_ids_file))
             except Exception as e:
-                logger.error(f"Failed to load discovered_ids.json: {e}")
+                logger.error(f"Failed to load discovered IDs: {e}")
 
         # Fall back to legacy flat file
         if self.reg_ids_file.exists():
             try:
-                with open(self.reg_ids_file, 'r', encoding='utf-8') as f:
-                    return set(line.strip() for line in f if line.strip())
+                return set(_read_id_lines(self.reg_ids_file))
             except Exception as e:
                 logger.error(f"Failed to load reg_ids: {e}")
 
@@ -422,8 +1091,28 @@ class CheckpointManager:
         Args:
             reg_id: Registration ID
         """
+        reg_id = sys.intern(reg_id)
+        before = (len(self.scraped_reg_ids), len(self.extracted_reg_ids))
         self.extracted_reg_ids.add(reg_id)
         self.stats['total_extracted'] += 1
+        self._dirty = True
+
+        if len(self.extracted_reg_ids) != before[1]:
+            self._update_pending_cache(before, -1 if reg_id in self.scraped_reg_ids else 0)
+
+    def _update_pending_cache(self, sizes_before: tuple, delta: int) -> None:
+        """
+        Adjust the cached pending count after reg_ids are added or extracted.
+
+        Args:
+            sizes_before: (len(scraped), len(extracted)) before the change
+            delta: Change in the number of pending reg_ids
+        """
+        cache = self._pending_cache
+        if cache is not None and cache[:2] == sizes_before:
+            self._pending_cache = (
+                len(self.scraped_reg_ids), len(self.extracted_reg_ids), cache[2] + delta
+            )
 
     def increment_errors(self) -> None:
         """Increment error count."""
@@ -432,7 +1121,7 @@ class CheckpointManager:
     def start_session(self) -> None:
         """Mark the start of a scraping session."""
         if not self.stats['start_time']:
-            self.stats['start_time'] = datetime.now().isoformat()
+            self.stats['start_time'] = _fast_now_iso()
 
     def get_pending_reg_ids(self) -> List[str]:
         """
@@ -441,10 +1130,23 @@ class CheckpointManager:
         Returns:
             List of pending reg_ids
         """
-        return [
-            reg_id for reg_id in self.scraped_reg_ids
-            if reg_id not in self.extracted_reg_ids
-        ]
+        return list(self.scraped_reg_ids - self.extracted_reg_ids)
+
+    def get_pending_count(self) -> int:
+        """
+        Get the number of reg_ids discovered but not yet extracted.
+
+        Maintained incrementally by save_reg_id/mark_extracted, so progress
+        displays don't rebuild the pending list.
+
+        Returns:
+            Number of pending reg_ids
+        """
+        sizes = (len(self.scraped_reg_ids), len(self.extracted_reg_ids))
+        if self._pending_cache is None or self._pending_cache[:2] != sizes:
+            pending = sizes[0] - len(self.scraped_reg_ids & self.extracted_reg_ids)
+            self._pending_cache = (*sizes, pending)
+        return self._pending_cache[2]
 
     def get_progress_summary(self) -> Dict[str, Any]:
         """
@@ -453,7 +1155,7 @@ class CheckpointManager:
         Returns:
             Progress summary dictionary
         """
-        pending = len(self.get_pending_reg_ids())
+        pending = self.get_pending_count()
         return {
             'prefixes_completed': len(self.completed_prefixes),
             'combinations_completed': len(self.completed_combinations),
@@ -472,13 +1174,21 @@ class CheckpointManager:
         """Reset all checkpoint data and delete discovery files."""
         self.completed_prefixes.clear()
         self.completed_combinations.clear()
+        self.empty_combinations.clear()
         self.scraped_reg_ids.clear()
         self.extracted_reg_ids.clear()
+        self.failed_reg_ids.clear()
         self.current_prefix = None
         self.current_page = 0
         self.current_combination = None
         self.discovery_started_at = None
         self.discovery_last_updated = None
+        self._snapshot_count = 0
+        self._delta_count = 0
+        self._pending_cache = None
+        self._dirty = True
+        self._save_seq = 0
+        self._generation = uuid.uuid4().hex
         self.stats = {
             "total_discovered": 0,
             "total_extracted": 0,
@@ -487,7 +1197,7 @@ class CheckpointManager:
             "last_save_time": None,
         }
 
-        # Delete discovered_ids JSON file
+        # Delete discovered IDs snapshot
         if self.discovered_ids_file.exists():
             try:
                 self.discovered_ids_file.unlink()
@@ -495,6 +1205,34 @@ class CheckpointManager:
             except Exception as e:
                 logger.error(f"Failed to delete discovered_ids file: {e}")
 
+        # Delete discovered_ids metadata file
+        if self.discovered_ids_meta_file.exists():
+            try:
+                self.discovered_ids_meta_file.unlink()
+            except Exception as e:
+                logger.error(f"Failed to delete discovered_ids metadata file: {e}")
+
+        # Delete legacy discovered_ids.json if exists
+        if self.legacy_discovered_ids_json.exists():
+            try:
+                self.legacy_discovered_ids_json.unlink()
+                logger.info(f"Deleted {self.legacy_discovered_ids_json}")
+            except Exception as e:
+                logger.error(f"Failed to delete legacy discovered_ids file: {e}")
+
+        # Delete the stats side files, which would otherwise outrank the next
+        # checkpoint (their save_seq is higher than a fresh one)
+        self.clear_stats_side_files()
+
+        # Delete the combinations delta log (the full write after reset replaces it)
+        try:
+            self._truncate_combinations_log()
+        except Exception as e:
+            logger.error(f"Failed to delete combinations log: {e}")
+
+        # Delete persisted combination queue
+        self.clear_combination_queue()
+
         # Delete legacy reg_ids file if exists
         if self.reg_ids_file.exists():
             try:
@@ -513,10 +1251,13 @@ class CheckpointManager:
         state: str,
         prefix: str,
         suburb: Optional[str] = None
-    ) -> str:
+    ) -> CombinationKey:
         """
         Create a unique key for a search combination.
 
+        The key is a tuple in the same (profession, state, suburb, prefix)
+        order as the search queue entries, so no string is built per check.
+
         Args:
             profession: Profession name
             state: State name
@@ -524,60 +1265,151 @@ class CheckpointManager:
             suburb: Optional suburb name
 
         Returns:
-            Combination key string
+            Combination key tuple
         """
-        if suburb:
-            return f"{profession}|{state}|{suburb}|{prefix}"
-        return f"{profession}|{state}|{prefix}"
+        return (profession, state, suburb or None, prefix)
 
-    def is_combination_completed(self, combination_key: str) -> bool:
+    def is_combination_completed(self, combination_key: CombinationKey) -> bool:
         """
         Check if a search combination has been completed.
 
         Args:
-            combination_key: Combination key string
+            combination_key: Combination key tuple
 
         Returns:
             True if completed
         """
         return combination_key in self.completed_combinations
 
-    def mark_combination_completed(self, combination_key: str) -> None:
+    def mark_combination_completed(self, combination_key: CombinationKey) -> None:
         """
         Mark a search combination as completed.
 
         Args:
-            combination_key: Combination key string
+            combination_key: Combination key tuple
         """
-        self.completed_combinations.add(combination_key)
+        if combination_key not in self.completed_combinations:
+            self.completed_combinations.add(combination_key)
+            self._unlogged_combinations.append(('c', combination_key))
         self.current_combination = None
+        self.sync_raw_backup()
         logger.debug(f"Marked combination '{combination_key}' as completed")
 
-    def set_current_combination(self, combination_key: str) -> None:
+    def mark_combination_empty(self, combination_key: CombinationKey) -> None:
         """
-        Set current search combination position.
+        Record that a search combination returned zero results.
 
         Args:
-            combination_key: Combination key string
+            combination_key: Combination key tuple
         """
-        self.current_combination = combination_key
+        if combination_key not in self.empty_combinations:
+            self.empty_combinations.add(combination_key)
+            self._unlogged_combinations.append(('e', combination_key))
 
-    def export_reg_ids(self, output_file: Path) -> bool:
+    def has_empty_parent(self, combination_key: CombinationKey) -> bool:
         """
-        Export discovered reg_ids to a file.
+        Check if a shorter prefix of the same combination returned zero results.
+
+        Every name matching 'ABC' also matches 'AB' and 'A', so if any of those
+        came back empty for the same profession/state/suburb, so will this one.
 
         Args:
-            output_file: Output file path
+            combination_key: Combination key tuple
 
         Returns:
-            True if successful
+            True if the combination can be skipped
+        """
+        if not self.empty_combinations:
+            return False
+        profession, state, suburb, prefix = combination_key
+        return any(
+            (profession, state, suburb, prefix[:length]) in self.empty_combinations
+            for length in range(1, len(prefix))
+        )
+
+    def save_combination_queue(
+        self,
+        queue: Iterable[CombinationKey],
+        signature: str,
+        retry_counts: Optional[Dict[CombinationKey, int]] = None
+    ) -> None:
+        """
+        Persist the remaining multi-dimensional combination queue.
+
+        Written when a run builds its queue and again when it finishes, so the
+        file always covers a superset of the remaining work (completed
+        combinations are still filtered out on load).
+
+        Args:
+            queue: Remaining (profession, state, suburb, prefix) tuples
+            signature: Plan signature the queue was built for
+            retry_counts: Failed attempts per combination so far
         """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for reg_id in sorted(self.scraped_reg_ids):
-                    f.write(f"{reg_id}\n")
-            logger.info(f"Exported {len(self.scraped_reg_ids)} reg_ids to {output_file}")
-            return True
+            retries = [[list(key), count] for key, count in (retry_counts or {}).items()]
+
+            # Write to temp file first, then rename (atomic)
+            temp_file = self.combination_queue_file.with_suffix('.tmp')
+            with open(temp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(b'{"signature":' + _json_dumps(signature))
+                f.write(b',"retry_counts":' + _json_dumps(retries))
+                f.write(b',"queue":')
+                _write_json_array(f, queue)
+                f.write(b'}')
+            temp_file.replace(self.combination_queue_file)
+
         except Exception as e:
-            logger.error(f"Failed to export reg_ids: {e}")
-            return False
+            logger.error(f"Failed to save combination queue: {e}")
+
+    def clear_combination_queue(self) -> None:
+        """Delete the persisted combination queue (drained queue or reset)."""
+        try:
+            self.combination_queue_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to delete combination queue file: {e}")
+
+    def load_combination_queue(
+        self,
+        signature: str
+    ) -> Optional[Tuple[List[CombinationKey], Dict[CombinationKey, int]]]:
+        """
+        Load the persisted combination queue if it matches the current plan.
+
+        Args:
+            signature: Plan signature of the current search configuration
+
+        Returns:
+            Tuple of (pending combinations, retry counts), or None if there is
+            no usable saved queue
+        """
+        if not self.combination_queue_file.exists():
+            return None
+
+        try:
+            data = _read_json(self.combination_queue_file)
+        except Exception as e:
+            logger.warning(f"Failed to load combination queue: {e}")
+            return None
+
+        if data.get('signature') != signature:
+            logger.info("Search plan changed since the combination queue was saved; rebuilding")
+            return None
+
+        completed = self.completed_combinations
+        queue = [
+            key for key in map(_parse_combination_key, data.get('queue', []))
+            if key is not None and key not in completed
+        ]
+        retry_counts = {
+            _parse_combination_key(key): count for key, count in data.get('retry_counts', [])
+        }
+        return queue, retry_counts
+
+    def set_current_combination(self, combination_key: CombinationKey) -> None:
+        """
+        Set current search combination position.
+
+        Args:
+            combination_key: Combination key tuple
+        """
+        self.current_combination = combination_key
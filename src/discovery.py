@@ -8,7 +8,11 @@ Discovers all practitioner URLs by:
 """
 
 import re
-from typing import List, Dict, Optional, Tuple
+import threading
+import time
+from itertools import count, groupby, product
+from operator import itemgetter
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from collections import deque
 from loguru import logger
 
@@ -16,14 +20,152 @@ from config.settings import (
     AHPRA_SEARCH_URL,
     MAX_RESULTS_PER_PAGE,
     PAGINATION_LIMIT,
+    CHECKPOINT_PAGE_INTERVAL,
+    COMBINATION_SAVE_INTERVAL,
+    COMBINATION_SAVE_SECONDS,
     MAX_RETRIES,
     RETRY_DELAY,
+    UI_MUTATION_TIMEOUT,
 )
 from config.professions import PROFESSIONS, STATES, STATE_ABBREVIATIONS, ALPHABET, MAJOR_SUBURBS
 from src.browser import BrowserManager
 from src.checkpoint import CheckpointManager
 from src.search import SearchOrchestrator
-from src.utils import random_delay, ui_delay, sidebar_filter_delay, get_timestamp
+from src.utils import random_delay, ui_delay, sidebar_filter_delay, get_timestamp, RequestPacer
+
+# Registration ID patterns, tried in priority order by _extract_reg_id
+_REG_ID_URL_QS = re.compile(r'[?&]id=([A-Z]{3}\d+)')    # ?id=MED0001234567
+_REG_ID_PATH = re.compile(r'/([A-Z]{3}\d{10,})')        # /MED0001234567
+_REG_ID_TEXT = re.compile(r'([A-Z]{3}\d{10,})')         # anywhere in item text
+
+# Single-pass profession matcher for _extract_profession_from_result
+# (longest names first so overlapping names prefer the more specific one)
+_PROF_RE = re.compile(
+    '(' + '|'.join(re.escape(p) for p in sorted(PROFESSIONS, key=len, reverse=True)) + ')',
+    re.IGNORECASE
+)
+_PROF_LOOKUP = {p.lower(): p for p in PROFESSIONS}
+
+# Declared total in the results summary, e.g. "Showing 1 - 50 of 1,234 results"
+_RESULT_TOTAL_RE = re.compile(r'(\d[\d,]*)\s*(?:results?|practitioners?)\b', re.IGNORECASE)
+
+# Sets a sidebar profession checkbox in one round-trip: clicks the visible label,
+# else the parent <li>, else sets .checked and dispatches change/click.
+# Returns {ok, method} or {ok: false, reason}.
+_TOGGLE_PROFESSION_JS = """
+({checkboxSelector, labelSelector, select}) => {
+    const cb = document.querySelector(checkboxSelector);
+    if (!cb) return {ok: false, reason: 'checkbox not found'};
+    if (cb.checked === select) return {ok: true, method: 'none'};
+
+    const label = Array.from(document.querySelectorAll(labelSelector))
+        .find(el => el.getClientRects().length > 0);
+    if (label) {
+        label.click();
+        if (cb.checked === select) return {ok: true, method: 'label'};
+    }
+
+    // No label (or its click didn't toggle): try the parent <li>, then set directly
+    const li = cb.closest('li');
+    if (li && li !== label) {
+        li.click();
+        if (cb.checked === select) return {ok: true, method: 'li'};
+    }
+
+    cb.checked = select;
+    cb.dispatchEvent(new Event('change', {bubbles: true}));
+    cb.dispatchEvent(new Event('click', {bubbles: true}));
+    return {ok: true, method: 'js'};
+}
+"""
+
+# One read per results page: every row's reg_id plus whether a visible, enabled
+# next-page control exists (CSS twin of SELECTORS['next_page']; the
+# "Load more" text match is done in JS since :has-text is Playwright-only)
+_PAGE_ROWS_JS = """
+([rowSel, nextSel]) => {
+    const ids = Array.from(document.querySelectorAll(rowSel),
+                           r => r.getAttribute('data-practitioner-row-id'));
+    const controls = [
+        ...document.querySelectorAll(nextSel),
+        ...Array.from(document.querySelectorAll('button'))
+            .filter(b => /load more/i.test(b.textContent)),
+    ];
+    const next = controls.find(el => el.getClientRects().length > 0);
+    const hasNext = !!next && !next.hasAttribute('disabled')
+        && next.getAttribute('aria-disabled') !== 'true';
+    return [ids, hasNext];
+}
+"""
+
+# Results state after a sidebar filter change: `ready` once the results table
+# (or no-results message) is attached and no loading indicator remains;
+# `snapshot` changes whenever the row count or results summary does
+_RESULTS_STATE_JS = """
+({tableSel, noResultsSel, loadingSel, rowSel, summarySel}) => {
+    const summary = document.querySelector(summarySel);
+    const hasResults = !!(document.querySelector(tableSel) || document.querySelector(noResultsSel));
+    return {
+        ready: document.readyState !== 'loading' && hasResults && !document.querySelector(loadingSel),
+        snapshot: document.querySelectorAll(rowSel).length + '|' + (summary ? summary.textContent.trim() : ''),
+    };
+}
+"""
+
+# Per-selector DOM mutation counters: arming returns the current count for
+# `sel` (installing one observer per element on first use), and waiting
+# resolves once the count moves past it. A missing counter means the page
+# reloaded, which is an observable effect too.
+_MUTATION_WATCH_JS = """
+(sel) => {
+    const el = document.querySelector(sel);
+    if (!el) return null;
+    const counts = window.__mut = window.__mut || {};
+    if (!el.__mutObserved) {
+        counts[sel] = counts[sel] || 0;
+        new MutationObserver(() => { counts[sel]++; })
+            .observe(el, {childList: true, subtree: true, attributes: true});
+        el.__mutObserved = true;
+    }
+    return counts[sel] || 0;
+}
+"""
+
+# True once any of the given selectors is attached (short-circuits in order)
+_ANY_ATTACHED_JS = """
+(selectors) => selectors.some(sel => document.querySelector(sel) !== null)
+"""
+
+_MUTATION_SEEN_JS = """
+([sel, baseline]) => !window.__mut || (window.__mut[sel] || 0) > baseline
+"""
+
+
+class _SerializedCheckpoint:
+    """
+    Proxy that serializes CheckpointManager method calls behind a lock.
+
+    Used by parallel multi-dimensional discovery so worker threads can
+    share a single checkpoint. Plain attribute reads (stats, sets) pass
+    straight through.
+    """
+
+    def __init__(self, checkpoint: CheckpointManager, lock: threading.RLock):
+        self._checkpoint = checkpoint
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._checkpoint, name)
+        if not callable(attr):
+            return attr
+
+        lock = self._lock
+
+        def locked(*args, **kwargs):
+            with lock:
+                return attr(*args, **kwargs)
+
+        return locked
 
 
 class DiscoveryEngine:
@@ -94,6 +236,12 @@ class DiscoveryEngine:
         'captcha_text': 'text="I\'m not a robot", text="verify you are human"',
     }
 
+    # Plain-CSS part of SELECTORS['next_page'] (usable inside page.evaluate)
+    _NEXT_PAGE_CSS = '.load-more-btn, .pagination .next'
+
+    # Generic option elements scanned by _select_from_dropdown's fallback
+    _DROPDOWN_OPTIONS = 'li, .dropdown-item, [role="option"]'
+
     # Profession checkbox ID mapping (matches AHPRA's IDs)
     PROFESSION_CHECKBOX_IDS = {
         "Aboriginal and Torres Strait Islander Health Practitioner": "001",
@@ -123,7 +271,9 @@ class DiscoveryEngine:
         include_suburbs: bool = False,
         max_depth: int = 3,
         test_prefix: Optional[str] = None,
-        use_optimized: bool = True  # NEW: Use sidebar filters for faster discovery
+        use_optimized: bool = True,  # NEW: Use sidebar filters for faster discovery
+        concurrency: int = 1,
+        filter_first: bool = False
     ):
         """
         Initialize discovery engine.
@@ -139,6 +289,12 @@ class DiscoveryEngine:
             use_optimized: Use sidebar filters for faster discovery (default True)
                           When True, only navigates to home page once per prefix,
                           then uses sidebar filters to change profession/state.
+            concurrency: Number of browser workers for multi-dimensional mode
+                         (default 1). Each worker owns its own browser; the
+                         optimized mode splits work by prefix.
+            filter_first: In optimized mode, apply each profession/state/suburb
+                          filter set once and re-submit only the search box per
+                          prefix (default False).
         """
         self.browser = browser
         self.checkpoint = checkpoint
@@ -148,6 +304,8 @@ class DiscoveryEngine:
         self.max_depth = max_depth
         self.test_prefix = test_prefix
         self.use_optimized = use_optimized
+        self.concurrency = max(1, concurrency)
+        self.filter_first = filter_first
         self.orchestrator = SearchOrchestrator(
             comprehensive=comprehensive,
             multi_dimensional=multi_dimensional,
@@ -158,6 +316,39 @@ class DiscoveryEngine:
         self._search_queue = deque()
         self._combination_queue = deque()  # For multi-dimensional search
         self._retry_counts: Dict[str, int] = {}  # Track retries per combination/prefix
+        self._resume = True  # Whether the current run resumes saved progress
+        # Parallel discovery: set to make workers stop after their current item,
+        # and the lock serializing their checkpoint calls (None when sequential)
+        self._stop_workers = threading.Event()
+        self._checkpoint_lock: Optional[threading.RLock] = None
+        self._pages_since_save = 0  # Pages with new IDs since the last full checkpoint save
+        self._completed_since_save = 0  # Combinations completed since the last checkpoint save
+        # Sidebar sections known to be expanded on the current page (cleared on navigation)
+        self._expanded_sections: set = set()
+        self._expansion_page = None
+        self._last_save_ts = time.monotonic()
+        # Spaces navigations, searches and "Load more" clicks (shared with workers)
+        self._pacer = RequestPacer()
+
+        # Sidebar profession (checkbox, label) selectors, built once. Each is a CSS
+        # union of the ID formats AHPRA has used, so one query finds the element.
+        # (CSS IDs can't start with digits, hence the attribute selectors.)
+        self._profession_filter_selectors: Dict[str, Tuple[str, str]] = {
+            profession: (
+                f'input[id="_{checkbox_id}"], input[id="{checkbox_id}"], '
+                f'input[name="health-profession-{checkbox_id}"]',
+                f'label[for="_{checkbox_id}"], label[for="{checkbox_id}"]',
+            )
+            for profession, checkbox_id in self.PROFESSION_CHECKBOX_IDS.items()
+        }
+        # Sidebar state option selectors keyed by abbreviation ("All" clears the filter)
+        self._state_option_selectors: Dict[str, str] = {
+            abbrev: f'{self.SELECTORS["sidebar_state_options"]}:text-is("{abbrev}")'
+            for abbrev in STATE_ABBREVIATIONS.values()
+        }
+        self._state_option_selectors["All"] = (
+            f'{self.SELECTORS["sidebar_state_options"]}:has-text("All States")'
+        )
 
     def initialize(self) -> bool:
         """
@@ -195,6 +386,7 @@ class DiscoveryEngine:
         logger.info("Starting discovery process")
 
         # Load checkpoint if resuming
+        self._resume = resume
         if resume:
             self.checkpoint.load()
 
@@ -205,6 +397,8 @@ class DiscoveryEngine:
             # Use optimized sidebar filter approach if enabled
             if self.use_optimized:
                 logger.info("Using OPTIMIZED sidebar filter mode (faster)")
+                if self.filter_first:
+                    return self._run_filter_first_discovery()
                 return self._run_optimized_multi_dimensional_discovery()
             else:
                 logger.info("Using STANDARD multi-dimensional mode (navigates home for each combination)")
@@ -220,27 +414,30 @@ class DiscoveryEngine:
         )
         self._search_queue = deque(initial_prefixes)
 
-        # Resume from current position if applicable
+        # Resume from current position if applicable. Its later duplicate in
+        # the queue is skipped via `searched`, so no O(n) remove is needed.
         if self.checkpoint.current_prefix:
-            # Put current prefix at front of queue
-            if self.checkpoint.current_prefix in self._search_queue:
-                self._search_queue.remove(self.checkpoint.current_prefix)
             self._search_queue.appendleft(self.checkpoint.current_prefix)
 
         total_discovered = self.checkpoint.stats['total_discovered']
         logger.info(f"Queue initialized with {len(self._search_queue)} prefixes")
 
+        # Prefixes searched successfully this run (expanded ones are never
+        # marked completed, so this also catches their duplicates)
+        searched = set()
+
         while self._search_queue:
             prefix = self._search_queue.popleft()
 
-            # Skip if already completed
-            if self.checkpoint.is_prefix_completed(prefix):
+            # Skip if already completed or searched
+            if self.checkpoint.is_prefix_completed(prefix) or prefix in searched:
                 continue
 
             logger.info(f"Searching prefix: '{prefix}' (queue size: {len(self._search_queue)})")
 
             try:
                 count = self._search_prefix(prefix)
+                searched.add(prefix)
 
                 # Check if we need to expand this prefix
                 children = self.orchestrator.handle_search_result(
@@ -276,7 +473,7 @@ class DiscoveryEngine:
                 random_delay(RETRY_DELAY, RETRY_DELAY * 2)
 
         # Final save and cleanup
-        self.checkpoint.save()
+        self.checkpoint.save(durable=True)
         self.checkpoint.close_raw_backup()
 
         new_discovered = self.checkpoint.stats['total_discovered'] - total_discovered
@@ -286,82 +483,274 @@ class DiscoveryEngine:
 
     def _run_multi_dimensional_discovery(self) -> int:
         """Run multi-dimensional discovery (profession × state × suburb × prefix)."""
-        # Initialize combination queue
-        combinations = self.orchestrator.get_multi_dimensional_queue(
-            self.checkpoint.completed_combinations
-        )
+        # Initialize combination queue: when resuming, reuse the persisted one if
+        # the plan is unchanged; otherwise build the full plan and diff it
+        # against completed
+        signature = self.orchestrator.get_multi_dimensional_signature()
+        saved = self.checkpoint.load_combination_queue(signature) if self._resume else None
+        if saved is not None:
+            combinations, retry_counts = saved
+            self._retry_counts.update(retry_counts)
+            logger.info(f"Resuming saved combination queue ({len(combinations):,} remaining)")
+        else:
+            combinations = self.orchestrator.get_multi_dimensional_queue(
+                self.checkpoint.completed_combinations
+            )
         self._combination_queue = deque(combinations)
+        self.checkpoint.save_combination_queue(self._combination_queue, signature, self._retry_counts)
 
         total_discovered = self.checkpoint.stats['total_discovered']
         total_combinations = len(self._combination_queue)
-        logger.info(f"Multi-dimensional queue: {total_combinations:,} combinations")
+        logger.info(f"Multi-dimensional queue: {total_combinations:,} combinations remaining")
 
-        processed = 0
-        while self._combination_queue:
-            profession, state, suburb, prefix = self._combination_queue.popleft()
+        if self.concurrency > 1:
+            self._run_combination_workers(total_combinations, total_discovered)
+        else:
+            processed = count(1)
+            while self._combination_queue:
+                self._process_combination(
+                    self._combination_queue.popleft(), processed, total_combinations, total_discovered
+                )
 
-            # Create combination key
-            combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
+        # Final save and cleanup. A drained queue is deleted so the next run
+        # rebuilds the plan instead of resuming an empty queue.
+        if self._combination_queue:
+            self.checkpoint.save_combination_queue(self._combination_queue, signature, self._retry_counts)
+        else:
+            self.checkpoint.clear_combination_queue()
+        self.checkpoint.save(durable=True)
+        self.checkpoint.close_raw_backup()
 
-            # Skip if already completed
-            if self.checkpoint.is_combination_completed(combo_key):
-                continue
+        new_discovered = self.checkpoint.stats['total_discovered'] - total_discovered
+        logger.info(f"Multi-dimensional discovery complete. New practitioners found: {new_discovered:,}")
 
-            # Log progress
-            processed += 1
-            remaining = len(self._combination_queue)
-            if suburb:
-                logger.info(
-                    f"[{processed}/{total_combinations}] Searching: {profession} | {state} | {suburb} | '{prefix}'"
-                )
+        return new_discovered
+
+    def _maybe_save_checkpoint(self, force: bool = False) -> None:
+        """
+        Save the checkpoint in tumbling windows of completed combinations.
+
+        Called after each completed combination; writes only every
+        COMBINATION_SAVE_INTERVAL completions or COMBINATION_SAVE_SECONDS
+        seconds. Discovered IDs are unaffected (they go to the raw backup
+        immediately), so an unclean exit re-searches at most one window.
+
+        Args:
+            force: Save now regardless of the window (error paths)
+        """
+        self._completed_since_save += 1
+        if (
+            force
+            or self._completed_since_save >= COMBINATION_SAVE_INTERVAL
+            or time.monotonic() - self._last_save_ts >= COMBINATION_SAVE_SECONDS
+        ):
+            self.checkpoint.save()
+            self._completed_since_save = 0
+            self._last_save_ts = time.monotonic()
+
+    def _process_combination(
+        self,
+        combination: Tuple[str, str, Optional[str], str],
+        processed: Iterator[int],
+        total_combinations: int,
+        total_discovered: int
+    ) -> None:
+        """
+        Search a single multi-dimensional combination and record the outcome.
+
+        Failed combinations are re-queued on ``self._combination_queue``
+        until MAX_RETRIES is reached.
+
+        Args:
+            combination: (profession, state, suburb, prefix) tuple
+            processed: Shared counter yielding the running combination number
+            total_combinations: Queue size at start (for progress logging)
+            total_discovered: Discovered count at start (for progress logging)
+        """
+        profession, state, suburb, prefix = combination
+
+        # Create combination key (the queue was already diffed against
+        # completed combinations when it was built or reloaded)
+        combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
+
+        # Skip if a shorter prefix for the same filters already returned nothing
+        if self.checkpoint.has_empty_parent(combo_key):
+            logger.debug(f"Pruned combination '{combo_key}' (shorter prefix had no results)")
+            self.checkpoint.mark_combination_completed(combo_key)
+            return
+
+        # Log progress
+        current = next(processed)
+        if suburb:
+            logger.info(
+                f"[{current}/{total_combinations}] Searching: {profession} | {state} | {suburb} | '{prefix}'"
+            )
+        else:
+            logger.info(
+                f"[{current}/{total_combinations}] Searching: {profession} | {state} | '{prefix}'"
+            )
+
+        try:
+            self.checkpoint.set_current_combination(combo_key)
+
+            # Search with all filters
+            count = self._search_combination(prefix, profession, state, suburb)
+            # Only an explicit no-results page prunes longer prefixes: a failed
+            # count read or a timed-out results wait also yields 0
+            if count == 0 and self._no_results_shown():
+                self.checkpoint.mark_combination_empty(combo_key)
+
+            # Mark combination as completed (saved in tumbling windows; found
+            # IDs are already in the raw backup, so at most a window is re-searched)
+            self.checkpoint.mark_combination_completed(combo_key)
+            self._maybe_save_checkpoint()
+
+            # Log discovery count periodically
+            if current % 50 == 0:
+                current_discovered = self.checkpoint.stats['total_discovered']
+                new_so_far = current_discovered - total_discovered
+                logger.info(f"Progress: {current}/{total_combinations} | New discoveries: {new_so_far:,}")
+
+        except Exception as e:
+            logger.error(f"Error searching combination '{combo_key}': {e}")
+            self.checkpoint.increment_errors()
+
+            # Track retry count
+            self._retry_counts[combo_key] = self._retry_counts.get(combo_key, 0) + 1
+
+            if self._retry_counts[combo_key] < MAX_RETRIES:
+                # Re-add to end of queue for retry
+                logger.info(f"Retrying combination '{combo_key}' (attempt {self._retry_counts[combo_key] + 1}/{MAX_RETRIES})")
+                self._combination_queue.append(combination)
             else:
-                logger.info(
-                    f"[{processed}/{total_combinations}] Searching: {profession} | {state} | '{prefix}'"
-                )
+                # Max retries reached, skip this combination
+                logger.warning(f"Skipping combination '{combo_key}' after {MAX_RETRIES} failed attempts")
 
-            try:
-                self.checkpoint.set_current_combination(combo_key)
+            # Flush pending completions before backing off
+            self._maybe_save_checkpoint(force=True)
+            random_delay(RETRY_DELAY, RETRY_DELAY * 2)
 
-                # Search with all filters
-                count = self._search_combination(prefix, profession, state, suburb)
+    def _run_combination_workers(self, total_combinations: int, total_discovered: int) -> None:
+        """
+        Drain the combination queue with ``self.concurrency`` browser workers.
 
-                # Mark combination as completed
-                self.checkpoint.mark_combination_completed(combo_key)
+        Playwright's sync API is bound to the thread that started it, so each
+        worker thread launches its own BrowserManager and drives a private
+        DiscoveryEngine. Workers share the combination queue, retry counts and
+        a lock-serialized view of the checkpoint.
 
-                # Save checkpoint after each combination (more reliable for long-running processes)
-                self.checkpoint.save()
+        Args:
+            total_combinations: Queue size at start (for progress logging)
+            total_discovered: Discovered count at start (for progress logging)
+        """
+        self._checkpoint_lock = threading.RLock()
+        checkpoint = _SerializedCheckpoint(self.checkpoint, self._checkpoint_lock)
+        processed = count(1)
 
-                # Log discovery count periodically
-                if processed % 50 == 0:
-                    current_discovered = self.checkpoint.stats['total_discovered']
-                    new_so_far = current_discovered - total_discovered
-                    logger.info(f"Progress: {processed}/{total_combinations} | New discoveries: {new_so_far:,}")
+        self._run_worker_threads(
+            self._combination_worker,
+            (checkpoint, processed, total_combinations, total_discovered)
+        )
 
-            except Exception as e:
-                logger.error(f"Error searching combination '{combo_key}': {e}")
-                self.checkpoint.increment_errors()
+    def _run_worker_threads(self, target, args: Tuple) -> None:
+        """
+        Start ``self.concurrency`` worker threads running target and wait for them.
 
-                # Track retry count
-                self._retry_counts[combo_key] = self._retry_counts.get(combo_key, 0) + 1
+        Args:
+            target: Worker function (each thread calls target(*args))
+            args: Arguments passed to every worker
+        """
+        logger.info(f"Starting {self.concurrency} discovery workers")
+
+        threads = [
+            threading.Thread(
+                target=target,
+                args=args,
+                name=f"discovery-worker-{i + 1}",
+                daemon=True,
+            )
+            for i in range(self.concurrency)
+        ]
+        self._stop_workers.clear()
+        for thread in threads:
+            thread.start()
 
-                if self._retry_counts[combo_key] < MAX_RETRIES:
-                    # Re-add to end of queue for retry
-                    logger.info(f"Retrying combination '{combo_key}' (attempt {self._retry_counts[combo_key] + 1}/{MAX_RETRIES})")
-                    self._combination_queue.append((profession, state, suburb, prefix))
-                else:
-                    # Max retries reached, skip this combination
-                    logger.warning(f"Skipping combination '{combo_key}' after {MAX_RETRIES} failed attempts")
+        # Join with a timeout so KeyboardInterrupt still reaches the main thread
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            # Let workers finish their current item so the caller's final
+            # checkpoint save doesn't race their updates
+            logger.warning("Stopping discovery workers (press Ctrl+C again to stop waiting)")
+            self._stop_workers.set()
+            try:
+                for thread in threads:
+                    while thread.is_alive():
+                        thread.join(0.5)
+            except KeyboardInterrupt:
+                logger.warning("Stopped waiting for discovery workers")
+            raise
+
+    def save_checkpoint(self, durable: bool = False) -> bool:
+        """
+        Save the checkpoint, serialized with any discovery workers still running.
 
-                random_delay(RETRY_DELAY, RETRY_DELAY * 2)
+        Args:
+            durable: fsync the written files (see CheckpointManager.save)
 
-        # Final save and cleanup
-        self.checkpoint.save()
-        self.checkpoint.close_raw_backup()
+        Returns:
+            True if saved successfully
+        """
+        if self._checkpoint_lock is None:
+            return self.checkpoint.save(durable=durable)
+        with self._checkpoint_lock:
+            return self.checkpoint.save(durable=durable)
 
-        new_discovered = self.checkpoint.stats['total_discovered'] - total_discovered
-        logger.info(f"Multi-dimensional discovery complete. New practitioners found: {new_discovered:,}")
+    def _combination_worker(
+        self,
+        checkpoint: _SerializedCheckpoint,
+        processed: Iterator[int],
+        total_combinations: int,
+        total_discovered: int
+    ) -> None:
+        """
+        Worker thread body for parallel multi-dimensional discovery.
 
-        return new_discovered
+        Args:
+            checkpoint: Lock-serialized checkpoint shared by all workers
+            processed: Shared counter yielding the running combination number
+            total_combinations: Queue size at start (for progress logging)
+            total_discovered: Discovered count at start (for progress logging)
+        """
+        try:
+            with BrowserManager(headless=self.browser.headless) as browser:
+                worker = DiscoveryEngine(
+                    browser,
+                    checkpoint,
+                    multi_dimensional=True,
+                    include_suburbs=self.include_suburbs,
+                    max_depth=self.max_depth,
+                    test_prefix=self.test_prefix,
+                    use_optimized=False,
+                )
+                # Share queue and retry bookkeeping with the coordinating engine
+                worker._combination_queue = self._combination_queue
+                worker._retry_counts = self._retry_counts
+                worker._pacer = self._pacer
+
+                while not self._stop_workers.is_set():
+                    try:
+                        combination = self._combination_queue.popleft()
+                    except IndexError:
+                        break
+                    worker._process_combination(
+                        combination, processed, total_combinations, total_discovered
+                    )
+
+        except Exception as e:
+            logger.error(f"Discovery worker {threading.current_thread().name} failed: {e}")
 
     def _search_combination(
         self,
@@ -369,7 +758,7 @@ class DiscoveryEngine:
         profession: str,
         state: str,
         suburb: Optional[str] = None
-    ) -> int:
+    ) -> Optional[int]:
         """
         Search for practitioners with specific profession/state/suburb/prefix.
 
@@ -380,53 +769,42 @@ class DiscoveryEngine:
             suburb: Optional suburb filter
 
         Returns:
-            Total number of results found
+            Total number of results found, or None if the search could not run
         """
         # Navigate to fresh search page
+        self._pacer.wait()
         if not self.browser.navigate(AHPRA_SEARCH_URL, wait_until='domcontentloaded'):
             logger.warning("Failed to navigate to search page")
-            return 0
+            return None
 
-        random_delay()
+        ui_delay()  # Let the search form finish initialising
 
-        # Perform search with filters
+        # Perform search with filters (paced before the search request)
         if not self._perform_search(prefix, profession, state, suburb):
             logger.warning(f"Search failed for combination")
-            return 0
-
-        random_delay()
+            return None
 
         # Get result count
-        result_count = self._get_result_count()
+        row_count, declared_total = self._get_result_totals()
+        result_count = declared_total or row_count
 
         if result_count == 0:
             return 0
 
         # Process all pages
         page = 1
-        total_collected = 0
 
         while page <= PAGINATION_LIMIT:
-            # Collect practitioners from current page
-            collected = self._collect_practitioners_from_page(prefix)
-            total_collected += collected
-
+            # Collect practitioners from current page (next page loads meanwhile)
+            collected, has_next = self._collect_practitioners_from_page(
+                prefix, load_next=page < PAGINATION_LIMIT, total_results=declared_total
+            )
             logger.debug(f"Page {page}: collected {collected} practitioners")
 
-            # Check for next page
-            if not self._has_next_page() or collected == 0:
-                break
-
-            # Go to next page
-            if not self._go_to_next_page():
+            if not has_next or collected == 0:
                 break
 
             page += 1
-            random_delay()
-
-            # Save checkpoint periodically
-            if self.checkpoint.should_save(total_collected):
-                self.checkpoint.save()
 
         return result_count
 
@@ -438,62 +816,57 @@ class DiscoveryEngine:
             prefix: Name prefix to search
 
         Returns:
-            Total number of results found
+            Result count for the expansion decision: the declared total when
+            it exceeds the rows pagination can reach (PAGINATION_LIMIT pages),
+            otherwise the first page's row count
         """
         self.checkpoint.set_current_position(prefix, 0)
 
         # Always navigate to fresh search page to ensure clean state
         logger.debug(f"Navigating to search page for prefix '{prefix}'")
+        self._pacer.wait()
         if not self.browser.navigate(AHPRA_SEARCH_URL, wait_until='domcontentloaded'):
             logger.warning(f"Failed to navigate to search page for prefix '{prefix}'")
             return 0
 
-        # Respectful delay after server navigation
-        random_delay()
+        ui_delay()  # Let the search form finish initialising
 
-        # Perform search
+        # Perform search (paced before the search request)
         if not self._perform_search(prefix):
             logger.warning(f"Search failed for prefix '{prefix}'")
             return 0
 
-        random_delay()
-
         # Get result count
-        result_count = self._get_result_count()
+        row_count, declared_total = self._get_result_totals()
+        result_count = declared_total or row_count
         logger.info(f"Prefix '{prefix}': {result_count} results")
 
         if result_count == 0:
             return 0
 
+        # Only a total that pagination cannot fully load should drive
+        # expansion; anything reachable is collected by paging below
+        reachable = PAGINATION_LIMIT * row_count
+        expansion_count = declared_total if declared_total and declared_total > reachable else row_count
+
         # Process all pages
         page = 1
-        total_collected = 0
 
         while page <= PAGINATION_LIMIT:
             self.checkpoint.set_current_position(prefix, page)
 
-            # Collect practitioners from current page
-            collected = self._collect_practitioners_from_page(prefix)
-            total_collected += collected
-
+            # Collect practitioners from current page (next page loads meanwhile)
+            collected, has_next = self._collect_practitioners_from_page(
+                prefix, load_next=page < PAGINATION_LIMIT, total_results=declared_total
+            )
             logger.debug(f"Page {page}: collected {collected} practitioners")
 
-            # Check for next page
-            if not self._has_next_page() or collected == 0:
-                break
-
-            # Go to next page
-            if not self._go_to_next_page():
+            if not has_next or collected == 0:
                 break
 
             page += 1
-            random_delay()
 
-            # Save checkpoint periodically
-            if self.checkpoint.should_save(total_collected):
-                self.checkpoint.save()
-
-        return result_count
+        return expansion_count
 
     def _perform_search(
         self,
@@ -562,27 +935,26 @@ class DiscoveryEngine:
                     suburb_input.fill(suburb)
                     ui_delay()
 
-            # Click search button
+            # Click search button (server request: respect the pacing budget)
             search_button = self.browser.page.query_selector(self.SELECTORS['search_button'])
+            self._pacer.wait()
             if search_button and search_button.is_visible():
                 search_button.click()
             else:
                 # Try pressing Enter in search field
                 search_input.press('Enter')
 
-            # Wait for results to load (server was hit, use main delay)
-            random_delay()
-
-            # Wait for either results or no-results message
+            # Wait for either results or no-results message. This returns as
+            # soon as the server-rendered results are in the DOM, so no extra
+            # settle delay is needed afterwards.
             try:
                 self.browser.page.wait_for_selector(
-                    '.search-results-table-row[data-practitioner-row-id], .no-results-message',
+                    f"{self.SELECTORS['result_row']}, {self.SELECTORS['no_results']}",
                     timeout=15000
                 )
             except:
                 pass
 
-            ui_delay(1, 2)  # Brief pause after selector wait
             return True
 
         except Exception as e:
@@ -618,13 +990,18 @@ class DiscoveryEngine:
                 ui_delay()  # UI interaction
                 return True
 
-            # Alternative: look for list items
-            options = self.browser.page.query_selector_all('li, .dropdown-item, [role="option"]')
-            for opt in options:
-                if option_text.lower() in (opt.text_content() or '').lower():
-                    opt.click()
-                    ui_delay()  # UI interaction
-                    return True
+            # Alternative: look for list items. The text match runs in the page
+            # and returns the option's index, so scanning costs one round-trip
+            # instead of a text_content() call per option.
+            index = self.browser.page.evaluate(
+                """([sel, text]) => Array.from(document.querySelectorAll(sel))
+                    .findIndex(o => (o.textContent || '').toLowerCase().includes(text))""",
+                [self._DROPDOWN_OPTIONS, option_text.lower()]
+            )
+            if index >= 0:
+                self.browser.page.locator(self._DROPDOWN_OPTIONS).nth(index).click()
+                ui_delay()  # UI interaction
+                return True
 
             logger.debug(f"Option '{option_text}' not found in dropdown")
             return False
@@ -633,75 +1010,123 @@ class DiscoveryEngine:
             logger.debug(f"Dropdown selection failed: {e}")
             return False
 
-    def _get_result_count(self) -> int:
+    def _get_result_totals(self) -> Tuple[int, Optional[int]]:
         """
-        Get the total number of search results.
+        Get the loaded row count and the total declared by the results summary.
 
         Returns:
-            Result count, or 0 if not found
+            Tuple of (rows currently on the page, declared total or None
+            if the summary is missing or unparseable)
         """
         try:
-            # Count visible result rows (most reliable method)
-            result_rows = self.browser.page.query_selector_all(self.SELECTORS['result_row'])
-            count = len(result_rows)
-
-            if count > 0:
-                return count
+            # One round-trip for both the row count and the summary text
+            row_count, summary = self.browser.page.evaluate(
+                """([rowSel, summarySel]) => {
+                    const summary = document.querySelector(summarySel);
+                    return [document.querySelectorAll(rowSel).length,
+                            summary ? summary.textContent : ''];
+                }""",
+                [self.SELECTORS['result_row'], self.SELECTORS['result_count']]
+            )
+        except Exception as e:
+            logger.debug(f"Could not get result count: {e}")
+            return 0, None
 
-            # Fallback: check no results message
-            no_results = self.browser.page.query_selector(self.SELECTORS['no_results'])
-            if no_results and no_results.is_visible():
-                return 0
+        matches = _RESULT_TOTAL_RE.findall(summary or '')
+        if not matches:
+            return row_count, None
+        return row_count, int(matches[-1].replace(',', ''))
 
-            return 0
+    def _no_results_shown(self) -> bool:
+        """
+        Check for AHPRA's explicit no-results message on the current page.
 
+        Returns:
+            True if the message is present, False if absent or unreadable
+        """
+        try:
+            return self.browser.page.query_selector(self.SELECTORS['no_results']) is not None
         except Exception as e:
-            logger.debug(f"Could not get result count: {e}")
-            return 0
+            logger.debug(f"Could not check for no-results message: {e}")
+            return False
 
-    def _collect_practitioners_from_page(self, current_prefix: str) -> int:
+    def _get_result_count(self) -> int:
+        """
+        Get the total number of search results.
+
+        Returns:
+            Declared total from the results summary, falling back to the
+            number of visible rows, or 0 if not found
+        """
+        row_count, declared_total = self._get_result_totals()
+        return declared_total or row_count
+
+    def _collect_practitioners_from_page(
+        self,
+        current_prefix: str,
+        load_next: bool = False,
+        total_results: Optional[int] = None
+    ) -> Tuple[int, bool]:
         """
         Collect practitioner reg_ids from the current results page.
 
         Only extracts registration IDs - full data will be fetched
         via API in the extraction stage.
 
+        When load_next is set, the row IDs are read first and "Load more"
+        is clicked before they are saved, so the server round-trip for the
+        next page overlaps with checkpoint IO.
+
         Args:
             current_prefix: Current search prefix (for logging)
+            load_next: Start loading the next page while saving this one
+            total_results: Declared result total; no further page is requested
+                           once this many rows are loaded
 
         Returns:
-            Number of practitioners collected
+            Tuple of (number of practitioners collected, next page loaded)
         """
-        collected = 0
+        reg_ids: List[str] = []
+        row_count = 0
+        first_row_id = None
+        has_next_control = False
 
         try:
-            # Get all result rows with data-practitioner-row-id attribute
-            result_rows = self.browser.page.query_selector_all(self.SELECTORS['result_row'])
+            # Snapshot reg_ids and the next-page control state in a single round-trip
+            row_values, has_next_control = self.browser.page.evaluate(
+                _PAGE_ROWS_JS, [self.SELECTORS['result_row'], self._NEXT_PAGE_CSS]
+            )
+            row_count = len(row_values)
+            reg_ids = [reg_id for reg_id in row_values if reg_id]
+            first_row_id = row_values[0] if row_values else None
 
-            for row in result_rows:
-                try:
-                    # Get registration ID from data attribute
-                    reg_id = row.get_attribute('data-practitioner-row-id')
-                    if not reg_id:
-                        continue
+        except Exception as e:
+            logger.error(f"Error collecting practitioners: {e}")
 
-                    # Save reg_id (handles deduplication internally)
-                    if self.checkpoint.save_reg_id(reg_id):
-                        collected += 1
+        # Every declared result is already loaded - skip the extra round-trip
+        if total_results and row_count >= total_results:
+            load_next = False
 
-                except Exception as e:
-                    logger.debug(f"Error processing result row: {e}")
-                    continue
+        # Kick off the next page before doing any checkpoint IO
+        loading = load_next and row_count > 0 and has_next_control and self._click_load_more()
 
-        except Exception as e:
-            logger.error(f"Error collecting practitioners: {e}")
+        # Save reg_ids (handles deduplication internally)
+        collected = self.checkpoint.save_reg_ids_batch(reg_ids)
 
-        # IMMEDIATELY save after collecting from page to prevent data loss
+        # New IDs are already in the raw backup; push them to disk now and
+        # write the full checkpoint every CHECKPOINT_PAGE_INTERVAL pages
         if collected > 0:
-            self.checkpoint.save()
-            logger.debug(f"Saved {collected} new IDs immediately after page collection")
+            self._pages_since_save += 1
+            if self._pages_since_save >= CHECKPOINT_PAGE_INTERVAL:
+                self.checkpoint.save()
+                self._pages_since_save = 0
+            else:
+                self.checkpoint.sync_raw_backup()
+            logger.debug(f"Saved {collected} new IDs after page collection")
 
-        return collected
+        has_next = loading and self._wait_for_more_rows(row_count, first_row_id)
+
+        return collected, has_next
 
     def _extract_reg_id(self, url: str, item) -> Optional[str]:
         """
@@ -715,19 +1140,19 @@ class DiscoveryEngine:
             Registration ID or None
         """
         # Try to extract from URL (e.g., ?id=MED0001234567)
-        match = re.search(r'[?&]id=([A-Z]{3}\d+)', url)
+        match = _REG_ID_URL_QS.search(url)
         if match:
             return match.group(1)
 
         # Try common URL patterns
-        match = re.search(r'/([A-Z]{3}\d{10,})', url)
+        match = _REG_ID_PATH.search(url)
         if match:
             return match.group(1)
 
         # Try to find in item text
         try:
             text = item.text_content()
-            match = re.search(r'([A-Z]{3}\d{10,})', text)
+            match = _REG_ID_TEXT.search(text)
             if match:
                 return match.group(1)
         except:
@@ -746,92 +1171,63 @@ class DiscoveryEngine:
             Profession name or None
         """
         try:
-            text = item.text_content().lower()
-            for profession in PROFESSIONS:
-                if profession.lower() in text:
-                    return profession
+            match = _PROF_RE.search(item.text_content() or '')
+            if match:
+                return _PROF_LOOKUP[match.group(1).lower()]
         except:
             pass
         return None
 
-    def _has_next_page(self) -> bool:
+    def _click_load_more(self) -> bool:
         """
-        Check if there's a next page of results (Load more button).
+        Click the visible "Load more" / next-page control.
+
+        Callers check that an enabled control exists first (see _PAGE_ROWS_JS),
+        so this is a single paced click.
 
         Returns:
-            True if next page exists
+            True if the button was clicked
         """
         try:
-            # Try multiple selectors for load more / next page
-            selectors_to_try = [
-                self.SELECTORS['next_page'],
-                self.SELECTORS['load_more'],
-                'button:has-text("Load more")',
-                '.load-more-btn',
-            ]
-
-            for selector in selectors_to_try:
-                try:
-                    next_button = self.browser.page.query_selector(selector)
-                    if next_button and next_button.is_visible():
-                        # Check if button is disabled
-                        disabled = next_button.get_attribute('disabled')
-                        aria_disabled = next_button.get_attribute('aria-disabled')
-                        if disabled or aria_disabled == 'true':
-                            return False
-                        return True
-                except:
-                    continue
+            self._pacer.wait()
+            self.browser.page.locator(f"{self.SELECTORS['next_page']} >> visible=true").first.click()
+            return True
 
         except Exception as e:
-            logger.debug(f"Error checking for next page: {e}")
+            logger.debug(f"Failed to click load more: {e}")
 
         return False
 
-    def _go_to_next_page(self) -> bool:
+    def _wait_for_more_rows(self, previous_rows: int, previous_first_id: Optional[str] = None) -> bool:
         """
-        Navigate to the next page of results (click Load more).
+        Wait for rows loaded by a "Load more" / next-page click.
+
+        Fires as soon as rows are appended ("Load more") or the first row
+        changes (classic pagination replacing the rows), rather than waiting
+        for the network to go idle.
+
+        Args:
+            previous_rows: Row count before the click
+            previous_first_id: data-practitioner-row-id of the first row before the click
 
         Returns:
-            True if successful
+            True if new results loaded
         """
         try:
-            # Try multiple selectors for load more / next page
-            selectors_to_try = [
-                self.SELECTORS['next_page'],
-                self.SELECTORS['load_more'],
-                'button:has-text("Load more")',
-                '.load-more-btn',
-            ]
-
-            for selector in selectors_to_try:
-                try:
-                    next_button = self.browser.page.query_selector(selector)
-                    if next_button and next_button.is_visible():
-                        # Get current row count before clicking
-                        current_rows = len(self.browser.page.query_selector_all(self.SELECTORS['result_row']))
-
-                        next_button.click()
-
-                        # Wait for new results to load
-                        try:
-                            self.browser.page.wait_for_function(
-                                f"document.querySelectorAll('{self.SELECTORS['result_row']}').length > {current_rows}",
-                                timeout=10000
-                            )
-                        except:
-                            # Fallback: wait for network idle
-                            self.browser.page.wait_for_load_state('networkidle', timeout=10000)
-
-                        ui_delay()
-                        return True
-                except:
-                    continue
-
+            self.browser.page.wait_for_function(
+                """([rowSel, previousRows, previousFirst]) => {
+                    const rows = document.querySelectorAll(rowSel);
+                    if (rows.length > previousRows) return true;
+                    return rows.length > 0 && rows[0].getAttribute('data-practitioner-row-id') !== previousFirst;
+                }""",
+                arg=[self.SELECTORS['result_row'], previous_rows, previous_first_id],
+                timeout=10000
+            )
         except Exception as e:
-            logger.debug(f"Failed to go to next page: {e}")
+            logger.debug(f"Failed to load next page: {e}")
+            return False
 
-        return False
+        return True
 
     def get_progress(self) -> Dict:
         """
@@ -880,30 +1276,50 @@ class DiscoveryEngine:
         """
         Expand a collapsed sidebar filter section.
 
+        Sections already expanded on the current page are remembered, so
+        repeat calls make no round-trips until the page navigates.
+
         Args:
             section_selector: CSS selector for the section (e.g., '.health-profession-filters')
 
         Returns:
             True if expanded successfully
         """
+        page = self.browser.page
+        if page is not self._expansion_page:
+            # New page object (e.g. after a UA rotation): start a fresh cache and
+            # drop it whenever the page navigates, since a reload collapses sections
+            self._expanded_sections = set()
+            self._expansion_page = page
+
+            def on_navigated(frame):
+                if frame == page.main_frame:
+                    self._expanded_sections.clear()
+
+            page.on('framenavigated', on_navigated)
+
+        if section_selector in self._expanded_sections:
+            return True
+
         try:
-            section = self.browser.page.query_selector(section_selector)
+            section = page.query_selector(section_selector)
             if not section:
                 logger.debug(f"Sidebar section not found: {section_selector}")
                 return False
 
             # Find the title/toggle element
             title = section.query_selector('a.title')
-            if not title:
-                return True  # Section might already be expanded
-
-            # Check if the content is hidden (collapsed)
-            content = section.query_selector('ul.hide, .form-group.hide')
-            if content:
-                # Click to expand
-                title.click()
-                ui_delay()
-
+            if title:
+                # Check if the content is hidden (collapsed)
+                content = section.query_selector('ul.hide, .form-group.hide')
+                if content:
+                    # Click to expand, then wait for the section to re-render
+                    baseline = self._watch_mutations(section_selector)
+                    title.click()
+                    self._wait_mutation(section_selector, baseline)
+            # else: no toggle, section might already be expanded
+
+            self._expanded_sections.add(section_selector)
             return True
 
         except Exception as e:
@@ -921,117 +1337,40 @@ class DiscoveryEngine:
         Returns:
             True if successful
         """
+        page = self.browser.page
         try:
-            # Get checkbox ID
-            checkbox_id = self.PROFESSION_CHECKBOX_IDS.get(profession)
-            if not checkbox_id:
+            # Get precomputed checkbox / label selectors
+            selectors = self._profession_filter_selectors.get(profession)
+            if not selectors:
                 logger.warning(f"Unknown profession for sidebar filter: {profession}")
                 return False
+            used_selector, label_selector = selectors
 
             # Expand the profession section first
             self._expand_sidebar_section(self.SELECTORS['sidebar_profession_section'])
-            ui_delay()
 
-            # Find the checkbox using ATTRIBUTE selectors (CSS IDs can't start with digits!)
-            # Try multiple selector patterns as AHPRA may use different ID formats
-            checkbox_selectors = [
-                f'input[id="_{checkbox_id}"]',  # e.g., input[id="_016"]
-                f'input[id="{checkbox_id}"]',   # e.g., input[id="016"]
-                f'input[name="health-profession-{checkbox_id}"]',  # By name attribute
-                f'.health-profession-filters input[id="_{checkbox_id}"]',
-                f'.health-profession-filters input[id="{checkbox_id}"]',
-            ]
-
-            checkbox = None
-            used_selector = None
-            for selector in checkbox_selectors:
-                try:
-                    checkbox = self.browser.page.query_selector(selector)
-                    if checkbox:
-                        used_selector = selector
-                        logger.debug(f"Found profession checkbox with selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            baseline = self._watch_mutations('body')
+            result = page.evaluate(_TOGGLE_PROFESSION_JS, {
+                'checkboxSelector': used_selector,
+                'labelSelector': label_selector,
+                'select': select,
+            })
 
-            if not checkbox:
-                logger.debug(f"Profession checkbox not found: {profession} (ID: {checkbox_id})")
+            if not result.get('ok'):
+                logger.warning(f"Could not click checkbox for profession: {profession} ({result.get('reason')})")
                 return False
 
-            # Check current state using JavaScript (more reliable for hidden inputs)
-            is_checked = self.browser.page.evaluate(
-                f'document.querySelector(\'{used_selector}\')?.checked || false'
-            )
-
-            # Only act if state needs to change
-            if (select and not is_checked) or (not select and is_checked):
-                # The actual <input> is often hidden; try clicking the label instead
-                # Labels can be: <label for="001">, or the parent <li> element
-                label_selectors = [
-                    f'label[for="_{checkbox_id}"]',
-                    f'label[for="{checkbox_id}"]',
-                    f'.health-profession-filters label[for="_{checkbox_id}"]',
-                    f'.health-profession-filters label[for="{checkbox_id}"]',
-                ]
-
-                clicked = False
-                for label_selector in label_selectors:
-                    try:
-                        label = self.browser.page.query_selector(label_selector)
-                        if label and label.is_visible():
-                            label.click()
-                            clicked = True
-                            logger.debug(f"Clicked label for profession: {profession}")
-                            break
-                    except Exception:
-                        continue
-
-                # If label click didn't work, try JavaScript to toggle the checkbox
-                if not clicked:
-                    try:
-                        self.browser.page.evaluate(f'''
-                            const cb = document.querySelector('{used_selector}');
-                            if (cb) {{
-                                cb.checked = {str(select).lower()};
-                                cb.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                                cb.dispatchEvent(new Event('click', {{ bubbles: true }}));
-                            }}
-                        ''')
-                        logger.debug(f"Used JavaScript to {'select' if select else 'deselect'} profession: {profession}")
-                        clicked = True
-                    except Exception as js_err:
-                        logger.debug(f"JavaScript checkbox toggle failed: {js_err}")
-
-                # As last resort, try clicking the parent <li> element
-                if not clicked:
-                    try:
-                        # Find parent li element and click it
-                        parent_li = self.browser.page.evaluate(f'''
-                            const cb = document.querySelector('{used_selector}');
-                            return cb ? cb.closest('li') : null;
-                        ''')
-                        if parent_li:
-                            self.browser.page.evaluate(f'''
-                                const cb = document.querySelector('{used_selector}');
-                                if (cb) {{
-                                    const li = cb.closest('li');
-                                    if (li) li.click();
-                                }}
-                            ''')
-                            logger.debug(f"Clicked parent li for profession: {profession}")
-                            clicked = True
-                    except Exception:
-                        pass
-
-                if not clicked:
-                    logger.warning(f"Could not click checkbox for profession: {profession}")
-                    return False
-
-                ui_delay()  # Wait for filter to apply
+            if result['method'] != 'none':
+                logger.debug(f"{'Selected' if select else 'Deselected'} profession via {result['method']}: {profession}")
+                self._wait_mutation('body', baseline)  # Filter starts applying
 
             return True
 
         except Exception as e:
+            # The click may trigger a filter reload before evaluate returns
+            if 'context was destroyed' in str(e):
+                logger.debug(f"Page reloaded while toggling profession: {profession}")
+                return True
             logger.debug(f"Failed to select sidebar profession: {e}")
             return False
 
@@ -1046,29 +1385,48 @@ class DiscoveryEngine:
         Returns:
             True if successful
         """
+        page = self.browser.page
         try:
             # Expand the location section first
             self._expand_sidebar_section(self.SELECTORS['sidebar_location_section'])
-            ui_delay()
 
             # Click the dropdown to open it
-            dropdown_select = self.browser.page.query_selector(self.SELECTORS['sidebar_state_select'])
+            dropdown_select = page.query_selector(self.SELECTORS['sidebar_state_select'])
             if not dropdown_select:
                 logger.debug("Sidebar state dropdown not found")
                 return False
 
+            location_section = self.SELECTORS['sidebar_location_section']
+            baseline = self._watch_mutations(location_section)
             dropdown_select.click()
-            ui_delay()
+            self._wait_mutation(location_section, baseline)
 
-            # Find and click the option
-            options = self.browser.page.query_selector_all(self.SELECTORS['sidebar_state_options'])
-            for option in options:
-                text = option.text_content().strip()
-                if text == state_abbrev or (state_abbrev == "All" and "All States" in text):
+            # Find and click the option (one query via the precomputed selector)
+            option_selector = self._state_option_selectors.get(state_abbrev)
+            if option_selector:
+                option = page.query_selector(option_selector)
+                if option:
                     option.click()
                     logger.debug(f"Selected sidebar state: {state_abbrev}")
                     return True
 
+            # Fallback: match the option texts in-page and click (one round-trip)
+            if page.evaluate(
+                """([sel, target]) => {
+                    for (const o of document.querySelectorAll(sel)) {
+                        const t = (o.textContent || '').trim();
+                        if (t === target || (target === 'All' && t.includes('All States'))) {
+                            o.click();
+                            return true;
+                        }
+                    }
+                    return false;
+                }""",
+                [self.SELECTORS['sidebar_state_options'], state_abbrev]
+            ):
+                logger.debug(f"Selected sidebar state: {state_abbrev}")
+                return True
+
             logger.debug(f"State option not found in sidebar: {state_abbrev}")
             return False
 
@@ -1086,38 +1444,30 @@ class DiscoveryEngine:
         Returns:
             True if successful
         """
+        page = self.browser.page
         try:
             # Expand the location section first
             self._expand_sidebar_section(self.SELECTORS['sidebar_location_section'])
-            ui_delay()
 
             # Find the suburb input field
-            suburb_input = self.browser.page.query_selector(self.SELECTORS['sidebar_suburb_input'])
+            suburb_input = page.query_selector(self.SELECTORS['sidebar_suburb_input'])
             if not suburb_input:
                 logger.debug("Sidebar suburb input not found")
                 return False
 
-            # Clear existing value first
-            suburb_input.click()
-            ui_delay()
-
-            # Select all and delete (more reliable than fill(''))
-            self.browser.page.keyboard.press('Meta+a')  # Select all (Cmd+A on Mac)
-            ui_delay()
-            self.browser.page.keyboard.press('Backspace')
-            ui_delay()
+            # fill() replaces the whole value (clearing it for None) and fires
+            # input events in one call; works on every platform, unlike Meta+a.
+            # It only returns once the value is set, so no pause is needed.
+            suburb_input.fill(suburb or '')
 
+            # Press Enter to apply the filter (a trusted key event, which
+            # submits where a synthetic keydown would not)
+            baseline = self._watch_mutations('body')
+            suburb_input.press('Enter')
+            self._wait_mutation('body', baseline)
             if suburb:
-                # Input new suburb
-                suburb_input.fill(suburb)
-                ui_delay()
-
-                # Press Enter to apply filter
-                suburb_input.press('Enter')
                 logger.debug(f"Input sidebar suburb: {suburb}")
             else:
-                # Just clear - press Enter to apply empty filter
-                suburb_input.press('Enter')
                 logger.debug("Cleared sidebar suburb filter")
 
             return True
@@ -1126,6 +1476,52 @@ class DiscoveryEngine:
             logger.debug(f"Failed to input sidebar suburb: {e}")
             return False
 
+    def _watch_mutations(self, selector: str) -> Optional[int]:
+        """
+        Start counting DOM mutations under an element before an action.
+
+        Args:
+            selector: CSS selector of the element to observe ('body' for the whole page)
+
+        Returns:
+            Baseline mutation count for _wait_mutation, or None if the
+            element could not be observed
+        """
+        try:
+            return self.browser.page.evaluate(_MUTATION_WATCH_JS, selector)
+        except Exception as e:
+            logger.debug(f"Could not observe {selector}: {e}")
+            return None
+
+    def _wait_mutation(self, selector: str, baseline: Optional[int],
+                       timeout: int = UI_MUTATION_TIMEOUT) -> bool:
+        """
+        Wait for the DOM effect of a UI action instead of a blind pause.
+
+        Returns as soon as the observed element mutates (or the page reloads)
+        after the baseline taken by _watch_mutations. Falls back to ui_delay()
+        when the element could not be observed.
+
+        Args:
+            selector: CSS selector passed to _watch_mutations
+            baseline: Count returned by _watch_mutations
+            timeout: Maximum wait time in milliseconds
+
+        Returns:
+            True if a mutation was observed
+        """
+        if baseline is None:
+            ui_delay()
+            return False
+        try:
+            self.browser.page.wait_for_function(
+                _MUTATION_SEEN_JS, arg=[selector, baseline], timeout=timeout
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"No DOM change observed under {selector}: {e}")
+            return False
+
     def _clear_sidebar_filters(self) -> bool:
         """
         Clear all sidebar filters using the "Clear all filters" link.
@@ -1133,8 +1529,9 @@ class DiscoveryEngine:
         Returns:
             True if successful
         """
+        page = self.browser.page
         try:
-            clear_btn = self.browser.page.query_selector(self.SELECTORS['sidebar_clear_all'])
+            clear_btn = page.query_selector(self.SELECTORS['sidebar_clear_all'])
             if clear_btn:
                 clear_btn.click()
                 ui_delay()
@@ -1155,9 +1552,10 @@ class DiscoveryEngine:
         Returns:
             True if results updated
         """
+        page = self.browser.page
         try:
             # Wait for loading indicator to appear and disappear
-            self.browser.page.wait_for_selector(
+            page.wait_for_selector(
                 self.SELECTORS['loading'],
                 state='attached',
                 timeout=2000
@@ -1167,7 +1565,7 @@ class DiscoveryEngine:
 
         try:
             # Wait for loading to finish
-            self.browser.page.wait_for_selector(
+            page.wait_for_selector(
                 self.SELECTORS['loading'],
                 state='detached',
                 timeout=timeout
@@ -1177,7 +1575,7 @@ class DiscoveryEngine:
 
         # Wait for results table to be present
         try:
-            self.browser.page.wait_for_selector(
+            page.wait_for_selector(
                 self.SELECTORS['results_table'],
                 state='attached',
                 timeout=timeout
@@ -1186,6 +1584,60 @@ class DiscoveryEngine:
         except:
             return False
 
+    def _results_state_args(self) -> Dict[str, str]:
+        """Selector arguments for _RESULTS_STATE_JS."""
+        return {
+            'tableSel': self.SELECTORS['results_table'],
+            'noResultsSel': self.SELECTORS['no_results'],
+            'loadingSel': self.SELECTORS['loading'],
+            'rowSel': self.SELECTORS['result_row'],
+            'summarySel': self.SELECTORS['result_count'],
+        }
+
+    def _results_snapshot(self) -> Optional[str]:
+        """
+        Snapshot the results state before a sidebar filter change.
+
+        Returns:
+            Opaque snapshot string for _wait_for_filter_effect, or None if
+            the page could not be read
+        """
+        try:
+            return self.browser.page.evaluate(_RESULTS_STATE_JS, self._results_state_args())['snapshot']
+        except Exception as e:
+            logger.debug(f"Could not snapshot results: {e}")
+            return None
+
+    def _wait_for_filter_effect(self, previous: Optional[str], timeout: int = 10000) -> bool:
+        """
+        Wait until a sidebar filter change has been applied to the results.
+
+        Polls a single in-page predicate (results attached, no loading
+        indicator, results differ from the snapshot) instead of waiting for
+        load states and selectors one after another. The poll survives a
+        full page reload caused by the filter.
+
+        Args:
+            previous: Snapshot taken with _results_snapshot before the change
+            timeout: Maximum wait time in milliseconds
+
+        Returns:
+            True if the results updated within the timeout
+        """
+        try:
+            self.browser.page.wait_for_function(
+                f"""(args) => {{
+                    const state = ({_RESULTS_STATE_JS})(args);
+                    return state.ready && state.snapshot !== args.previous;
+                }}""",
+                arg={**self._results_state_args(), 'previous': previous},
+                timeout=timeout
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Filter change not observed: {e}")
+            return False
+
     def _wait_for_page_stable(self, timeout: int = 15000) -> bool:
         """
         Wait for page to be fully stable after a filter causes reload.
@@ -1198,22 +1650,23 @@ class DiscoveryEngine:
         Returns:
             True if page is stable and ready
         """
+        page = self.browser.page
+        markers = [
+            self.SELECTORS['result_row'],
+            self.SELECTORS['results_table'],
+            self.SELECTORS['no_results'],
+        ]
         try:
-            # Wait for page load state
-            self.browser.page.wait_for_load_state('domcontentloaded', timeout=timeout)
+            # Wait for page load state (networkidle is never reached reliably on
+            # AHPRA's beacon-heavy pages, so the markers below are the real signal)
+            page.wait_for_load_state('domcontentloaded', timeout=timeout)
 
-            # Wait for network to be relatively idle
-            try:
-                self.browser.page.wait_for_load_state('networkidle', timeout=5000)
-            except:
-                pass  # Network might not go fully idle
+            # Rows already rendered: the page is usable as is
+            if page.evaluate(_ANY_ATTACHED_JS, markers):
+                return True
 
-            # Wait for results table OR no-results message
-            self.browser.page.wait_for_selector(
-                f'{self.SELECTORS["results_table"]}, {self.SELECTORS["no_results"]}, {self.SELECTORS["result_row"]}',
-                state='attached',
-                timeout=timeout
-            )
+            # Otherwise poll for rows, the results table OR the no-results message
+            page.wait_for_function(_ANY_ATTACHED_JS, arg=markers, timeout=timeout)
 
             ui_delay()  # Brief pause for JS to finish
             return True
@@ -1229,16 +1682,17 @@ class DiscoveryEngine:
         Returns:
             True if sidebar filters are available
         """
+        page = self.browser.page
         try:
             # Check for profession filter section
-            profession_section = self.browser.page.query_selector(
+            profession_section = page.query_selector(
                 self.SELECTORS['sidebar_profession_section']
             )
             if profession_section:
                 return True
 
             # Also check for any profession checkbox
-            checkbox = self.browser.page.query_selector(
+            checkbox = page.query_selector(
                 'input[name^="health-profession-"]'
             )
             return checkbox is not None
@@ -1271,94 +1725,159 @@ class DiscoveryEngine:
         result_count = self._get_result_count()
         return result_count > 0
 
-    def _apply_sidebar_filter_and_collect(
+    def _apply_sidebar_filters(
         self,
         prefix: str,
         profession: str,
-        state: str,
+        state_abbrev: str,
         suburb: Optional[str] = None
-    ) -> int:
+    ) -> bool:
         """
-        Apply sidebar filters and collect results (optimized - no page navigation).
-
-        This method assumes we're already on the search results page for the
-        given prefix. It uses sidebar filters to refine by profession/state/suburb
-        without navigating back to the home page.
+        Apply profession, state and (optional) suburb sidebar filters.
 
+        Assumes we're on the search results page for the given prefix.
         Handles page reloads gracefully - if the page reloads during filter
         application, waits for it to stabilize before continuing.
 
         Args:
-            prefix: Current search prefix (for logging)
+            prefix: Current search prefix (used to restore page state)
             profession: Profession to filter by
-            state: State abbreviation to filter by
+            state_abbrev: State abbreviation to filter by
             suburb: Optional suburb to filter by
 
         Returns:
-            Number of practitioners collected
+            True if the profession filter was applied (state/suburb are best effort)
         """
-        state_abbrev = STATE_ABBREVIATIONS.get(state, state)
-
-        try:
-            # Verify sidebar is present before starting
-            if not self._verify_sidebar_present():
-                logger.debug("Sidebar not present, attempting to re-search")
-                if not self._re_search_prefix(prefix):
-                    logger.warning(f"Failed to restore page state for prefix '{prefix}'")
-                    return 0
+        # Verify sidebar is present before starting
+        if not self._verify_sidebar_present():
+            logger.debug("Sidebar not present, attempting to re-search")
+            if not self._re_search_prefix(prefix):
+                logger.warning(f"Failed to restore page state for prefix '{prefix}'")
+                return False
 
-            # Apply profession filter
+        # Apply profession filter (unless a profession probe already left it applied)
+        if not self._sidebar_filters_active(profession):
+            snapshot = self._results_snapshot()
             if not self._select_sidebar_profession(profession, select=True):
                 logger.warning(f"Failed to select profession filter: {profession}")
-                return 0
+                return False
 
-            # Wait for page to stabilize (filter may cause reload)
-            self._wait_for_page_stable()
+            # Wait for results to update (filter may cause reload)
+            self._wait_for_filter_effect(snapshot)
 
             # ANTI-CAPTCHA: Add delay after profession filter to appear more human-like
             sidebar_filter_delay()
 
-            # Verify we're still on a valid results page
+        # Verify we're still on a valid results page
+        if not self._verify_sidebar_present():
+            logger.debug("Page reloaded, sidebar lost - waiting for stabilization")
+            self._wait_for_page_stable(timeout=20000)
+
+        # Apply state filter
+        snapshot = self._results_snapshot()
+        if self._select_sidebar_state(state_abbrev):
+            # Wait for results to update again
+            self._wait_for_filter_effect(snapshot)
+        else:
+            logger.debug(f"State filter not applied: {state_abbrev} (may not be available)")
+            # Continue anyway - profession filter is applied
+
+        # ANTI-CAPTCHA: Add delay after state filter
+        sidebar_filter_delay()
+
+        # Apply suburb filter if specified
+        if suburb:
+            # Verify sidebar is still present after state filter
             if not self._verify_sidebar_present():
-                logger.debug("Page reloaded, sidebar lost - waiting for stabilization")
+                logger.debug("Sidebar lost after state filter, waiting for stabilization")
                 self._wait_for_page_stable(timeout=20000)
 
-            # Apply state filter
-            if not self._select_sidebar_state(state_abbrev):
-                logger.debug(f"State filter not applied: {state_abbrev} (may not be available)")
-                # Continue anyway - profession filter is applied
+            snapshot = self._results_snapshot()
+            if not self._input_sidebar_suburb(suburb):
+                logger.debug(f"Suburb filter not applied: {suburb} (may not be available)")
+                # Continue anyway - profession and state filters are applied
+            else:
+                # Wait for results to update after suburb filter
+                self._wait_for_filter_effect(snapshot)
 
-            # Wait for page to stabilize again
-            self._wait_for_page_stable()
+                # ANTI-CAPTCHA: Add delay after suburb filter
+                sidebar_filter_delay()
 
-            # ANTI-CAPTCHA: Add delay after state filter
-            sidebar_filter_delay()
+        return True
 
-            # Apply suburb filter if specified
-            if suburb:
-                # Verify sidebar is still present after state filter
-                if not self._verify_sidebar_present():
-                    logger.debug("Sidebar lost after state filter, waiting for stabilization")
-                    self._wait_for_page_stable(timeout=20000)
-
-                if not self._input_sidebar_suburb(suburb):
-                    logger.debug(f"Suburb filter not applied: {suburb} (may not be available)")
-                    # Continue anyway - profession and state filters are applied
-                else:
-                    # Wait for page to stabilize after suburb filter
-                    self._wait_for_page_stable()
+    def _collect_filtered_results(self, prefix: str, filter_desc: str) -> Optional[int]:
+        """
+        Collect every page of the currently displayed (filtered) results.
 
-                    # ANTI-CAPTCHA: Add delay after suburb filter
-                    sidebar_filter_delay()
+        Args:
+            prefix: Current search prefix (for checkpointing)
+            filter_desc: Filter description (for logging)
 
-            # Get result count
-            result_count = self._get_result_count()
-            if result_count == 0:
-                filter_desc = f"{profession} | {state_abbrev}"
-                if suburb:
-                    filter_desc += f" | {suburb}"
-                filter_desc += f" | '{prefix}'"
-                logger.debug(f"No results for {filter_desc}")
+        Returns:
+            Number of practitioners collected, or None if there are no results
+        """
+        row_count, declared_total = self._get_result_totals()
+        if (declared_total or row_count) == 0:
+            logger.debug(f"No results for {filter_desc}")
+            return None
+
+        total_collected = 0
+        page = 1
+
+        while page <= PAGINATION_LIMIT:
+            collected, has_next = self._collect_practitioners_from_page(
+                prefix, load_next=page < PAGINATION_LIMIT, total_results=declared_total
+            )
+            total_collected += collected
+
+            if not has_next or collected == 0:
+                break
+
+            page += 1
+
+        logger.debug(f"Sidebar filter collected: {total_collected} for {filter_desc}")
+        return total_collected
+
+    @staticmethod
+    def _describe_filters(prefix: str, profession: str, state_abbrev: str, suburb: Optional[str]) -> str:
+        """Build the 'profession | state | suburb | prefix' description used in logs."""
+        filter_desc = f"{profession} | {state_abbrev}"
+        if suburb:
+            filter_desc += f" | {suburb}"
+        return filter_desc + f" | '{prefix}'"
+
+    def _apply_sidebar_filter_and_collect(
+        self,
+        prefix: str,
+        profession: str,
+        state: str,
+        suburb: Optional[str] = None
+    ) -> int:
+        """
+        Apply sidebar filters and collect results (optimized - no page navigation).
+
+        This method assumes we're already on the search results page for the
+        given prefix. It uses sidebar filters to refine by profession/state/suburb
+        without navigating back to the home page, then clears them again.
+
+        Args:
+            prefix: Current search prefix (for logging)
+            profession: Profession to filter by
+            state: State abbreviation to filter by
+            suburb: Optional suburb to filter by
+
+        Returns:
+            Number of practitioners collected
+        """
+        state_abbrev = STATE_ABBREVIATIONS.get(state, state)
+
+        try:
+            if not self._apply_sidebar_filters(prefix, profession, state_abbrev, suburb):
+                return 0
+
+            filter_desc = self._describe_filters(prefix, profession, state_abbrev, suburb)
+            total_collected = self._collect_filtered_results(prefix, filter_desc)
+            if total_collected is None:
                 # Try to clear filters for next iteration
                 try:
                     self._select_sidebar_profession(profession, select=False)
@@ -1367,39 +1886,18 @@ class DiscoveryEngine:
                     pass  # Page may have reloaded
                 return 0
 
-            # Collect all pages
-            total_collected = 0
-            page = 1
-
-            while page <= PAGINATION_LIMIT:
-                collected = self._collect_practitioners_from_page(prefix)
-                total_collected += collected
-
-                if not self._has_next_page() or collected == 0:
-                    break
-
-                if not self._go_to_next_page():
-                    break
-
-                page += 1
-                ui_delay()
-
-            filter_desc = f"{profession} | {state_abbrev}"
-            if suburb:
-                filter_desc += f" | {suburb}"
-            filter_desc += f" | '{prefix}'"
-            logger.debug(f"Sidebar filter collected: {total_collected} for {filter_desc}")
-
             # Try to clear filters for next iteration
             try:
                 # Clear suburb filter first (if it was applied)
                 if suburb:
+                    snapshot = self._results_snapshot()
                     self._input_sidebar_suburb(None)  # Clear suburb
-                    self._wait_for_page_stable(timeout=5000)
+                    self._wait_for_filter_effect(snapshot, timeout=5000)
                     sidebar_filter_delay()
 
+                snapshot = self._results_snapshot()
                 self._select_sidebar_profession(profession, select=False)
-                self._wait_for_page_stable(timeout=5000)
+                self._wait_for_filter_effect(snapshot, timeout=5000)
                 # ANTI-CAPTCHA: Delay after clearing filter
                 sidebar_filter_delay()
             except Exception:
@@ -1416,6 +1914,21 @@ class DiscoveryEngine:
                 pass
             return 0
 
+    def _suburbs_by_state(self, states: List[str]) -> Dict[str, List[Optional[str]]]:
+        """
+        Build the suburb filters searched for each state.
+
+        Args:
+            states: States in the plan
+
+        Returns:
+            Dict of state -> [None (no suburb filter), *MAJOR_SUBURBS if include_suburbs]
+        """
+        return {
+            state: [None] + (list(MAJOR_SUBURBS.get(state, [])) if self.include_suburbs else [])
+            for state in states
+        }
+
     def _run_optimized_multi_dimensional_discovery(self) -> int:
         """
         Run OPTIMIZED multi-dimensional discovery using sidebar filters.
@@ -1440,142 +1953,475 @@ class DiscoveryEngine:
         professions = PROFESSIONS
         states = STATES
 
-        # Calculate total combinations (with or without suburbs)
+        # Each state has: base search (no suburb) + suburb-specific searches if enabled
+        suburbs_by_state = self._suburbs_by_state(states)
+        total_combinations = len(prefixes) * len(professions) * sum(len(v) for v in suburbs_by_state.values())
+
+        # Log the plan size (with or without suburbs)
         if self.include_suburbs:
-            # Count total suburbs across all states
-            total_suburbs = sum(len(MAJOR_SUBURBS.get(state, [])) for state in states)
-            # Each state has: base search (no suburb) + suburb-specific searches
-            total_combinations = len(prefixes) * len(professions) * (len(states) + total_suburbs)
+            total_suburbs = sum(len(v) - 1 for v in suburbs_by_state.values())
             logger.info(f"Total combinations: {total_combinations:,} ({len(prefixes)} prefixes × {len(professions)} professions × ({len(states)} states + {total_suburbs} suburbs))")
             logger.info("SUBURB MODE ENABLED: Will search by suburb for each state")
         else:
-            total_combinations = len(prefixes) * len(professions) * len(states)
             logger.info(f"Total combinations: {total_combinations:,} ({len(prefixes)} prefixes × {len(professions)} professions × {len(states)} states)")
         logger.info("Using SIDEBAR FILTERS for optimized discovery (fewer page loads)")
 
-        processed = 0
+        # Materialize the remaining work list once (the tuples are the completed
+        # set's keys), then group it prefix -> profession so fully completed
+        # prefixes (e.g. on resume) are skipped without any page navigation
+        completed = self.checkpoint.completed_combinations
+        filters = [(p, s, sub) for p in professions for s in states for sub in suburbs_by_state[s]]
+        tasks = [
+            (prefix, profession, state, suburb)
+            for prefix, (profession, state, suburb) in product(prefixes, filters)
+            if (profession, state, suburb, prefix) not in completed
+        ]
+        pending_count = len(tasks)
+
+        pending: Dict[str, Dict[str, List[Tuple[str, Optional[str]]]]] = {}
+        for prefix, prefix_tasks in groupby(tasks, key=itemgetter(0)):
+            profession_groups = pending[prefix] = {}
+            for _, profession, state, suburb in prefix_tasks:
+                profession_groups.setdefault(profession, []).append((state, suburb))
+
+        skipped_prefixes = len(prefixes) - len(pending)
+        if skipped_prefixes:
+            logger.info(f"Skipping {skipped_prefixes} fully completed prefixes")
+        logger.info(f"Pending combinations: {pending_count:,}")
+
+        processed = count(total_combinations - pending_count + 1)
+
+        if self.concurrency > 1 and len(pending) > 1:
+            self._run_prefix_workers(pending, processed, total_combinations, total_discovered_start)
+        else:
+            for prefix_idx, (prefix, profession_groups) in enumerate(pending.items()):
+                self._process_prefix(
+                    prefix, profession_groups, prefix_idx + 1, len(pending),
+                    processed, total_combinations, total_discovered_start
+                )
 
-        for prefix_idx, prefix in enumerate(prefixes):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"PREFIX [{prefix_idx + 1}/{len(prefixes)}]: '{prefix}'")
-            logger.info(f"{'='*60}")
+        # Final save and cleanup
+        self.checkpoint.save(durable=True)
+        self.checkpoint.close_raw_backup()
 
-            # Navigate to home and perform initial search for this prefix
-            if not self.browser.navigate(AHPRA_SEARCH_URL, wait_until='domcontentloaded'):
-                logger.error(f"Failed to navigate to search page for prefix '{prefix}'")
-                continue
+        new_discovered = self.checkpoint.stats['total_discovered'] - total_discovered_start
+        logger.info(f"\nOPTIMIZED discovery complete. New practitioners found: {new_discovered:,}")
 
-            random_delay()
+        return new_discovered
 
-            # Perform initial search with just the prefix (no filters)
-            if not self._perform_search(prefix):
-                logger.warning(f"Initial search failed for prefix '{prefix}'")
-                continue
+    def _run_prefix_workers(
+        self,
+        pending: Dict[str, Dict[str, List[Tuple[str, Optional[str]]]]],
+        processed: Iterator[int],
+        total_combinations: int,
+        total_discovered_start: int
+    ) -> None:
+        """
+        Process pending prefixes with ``self.concurrency`` browser workers.
 
-            random_delay()
+        Prefixes are independent (each starts from a fresh home-page search),
+        so workers pull whole prefixes from a shared queue. Each worker owns
+        its own BrowserManager; sidebar_filter_delay() still paces every
+        worker and searches share ``self._pacer``.
 
-            # Check if we have results (sidebar filters only appear when there are results)
-            initial_count = self._get_result_count()
-            if initial_count == 0:
-                logger.info(f"No results for prefix '{prefix}', skipping all combinations")
-                continue
+        Args:
+            pending: Pending (state, suburb) pairs keyed by prefix, then profession
+            processed: Shared counter yielding the running combination number
+            total_combinations: Total combinations in the plan (for progress logging)
+            total_discovered_start: Discovered count at start (for progress logging)
+        """
+        self._checkpoint_lock = threading.RLock()
+        checkpoint = _SerializedCheckpoint(self.checkpoint, self._checkpoint_lock)
+        prefix_queue = deque(enumerate(pending.items(), start=1))
 
-            logger.info(f"Initial results for '{prefix}': {initial_count:,} practitioners")
+        self._run_worker_threads(
+            self._prefix_worker,
+            (checkpoint, prefix_queue, len(pending), processed, total_combinations, total_discovered_start)
+        )
 
-            # Track if we need to re-search this prefix
-            needs_research = False
+    def _prefix_worker(
+        self,
+        checkpoint: _SerializedCheckpoint,
+        prefix_queue: deque,
+        total_prefixes: int,
+        processed: Iterator[int],
+        total_combinations: int,
+        total_discovered_start: int
+    ) -> None:
+        """
+        Worker thread body for parallel optimized discovery.
 
-            # Now iterate through professions and states using sidebar filters
-            for profession in professions:
-                for state in states:
-                    state_abbrev = STATE_ABBREVIATIONS.get(state, state)
+        Args:
+            checkpoint: Lock-serialized checkpoint shared by all workers
+            prefix_queue: Shared deque of (prefix_number, (prefix, profession_groups))
+            total_prefixes: Number of pending prefixes (for progress logging)
+            processed: Shared counter yielding the running combination number
+            total_combinations: Total combinations in the plan (for progress logging)
+            total_discovered_start: Discovered count at start (for progress logging)
+        """
+        try:
+            with BrowserManager(headless=self.browser.headless) as browser:
+                worker = DiscoveryEngine(
+                    browser,
+                    checkpoint,
+                    multi_dimensional=True,
+                    include_suburbs=self.include_suburbs,
+                    max_depth=self.max_depth,
+                    test_prefix=self.test_prefix,
+                    use_optimized=True,
+                )
+                worker._retry_counts = self._retry_counts
+                worker._pacer = self._pacer
 
-                    # Build list of suburbs to search: [None] for base search, plus specific suburbs if enabled
-                    suburbs_to_search = [None]  # Always do base search without suburb filter
-                    if self.include_suburbs:
-                        suburbs_to_search.extend(MAJOR_SUBURBS.get(state, []))
+                while not self._stop_workers.is_set():
+                    try:
+                        prefix_number, (prefix, profession_groups) = prefix_queue.popleft()
+                    except IndexError:
+                        break
+                    worker._process_prefix(
+                        prefix, profession_groups, prefix_number, total_prefixes,
+                        processed, total_combinations, total_discovered_start
+                    )
 
-                    for suburb in suburbs_to_search:
-                        combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
+        except Exception as e:
+            logger.error(f"Discovery worker {threading.current_thread().name} failed: {e}")
 
-                        # Skip if already completed
-                        if self.checkpoint.is_combination_completed(combo_key):
-                            processed += 1
-                            continue
+    def _process_prefix(
+        self,
+        prefix: str,
+        profession_groups: Dict[str, List[Tuple[str, Optional[str]]]],
+        prefix_number: int,
+        total_prefixes: int,
+        processed: Iterator[int],
+        total_combinations: int,
+        total_discovered_start: int
+    ) -> None:
+        """
+        Search one prefix and collect its pending combinations via sidebar filters.
+
+        Args:
+            prefix: Name prefix to search
+            profession_groups: Pending (state, suburb) pairs keyed by profession
+            prefix_number: Position of this prefix (for progress logging)
+            total_prefixes: Number of pending prefixes (for progress logging)
+            processed: Shared counter yielding the running combination number
+            total_combinations: Total combinations in the plan (for progress logging)
+            total_discovered_start: Discovered count at start (for progress logging)
+        """
+        logger.info(f"\n{'='*60}")
+        logger.info(f"PREFIX [{prefix_number}/{total_prefixes}]: '{prefix}'")
+        logger.info(f"{'='*60}")
+
+        # Navigate to home and perform initial search for this prefix
+        if not self.browser.navigate(AHPRA_SEARCH_URL, wait_until='domcontentloaded'):
+            logger.error(f"Failed to navigate to search page for prefix '{prefix}'")
+            return
+
+        random_delay()
+
+        # Perform initial search with just the prefix (no filters)
+        if not self._perform_search(prefix):
+            logger.warning(f"Initial search failed for prefix '{prefix}'")
+            return
 
-                        processed += 1
+        random_delay()
 
-                        # Build filter description for logging
-                        filter_desc = f"{profession} | {state_abbrev}"
-                        if suburb:
-                            filter_desc += f" | {suburb}"
-                        filter_desc += f" | '{prefix}'"
+        # Check if we have results (sidebar filters only appear when there are results)
+        initial_count = self._get_result_count()
+        if initial_count == 0:
+            logger.info(f"No results for prefix '{prefix}', skipping all combinations")
+            return
+
+        logger.info(f"Initial results for '{prefix}': {initial_count:,} practitioners")
+
+        # Track if we need to re-search this prefix
+        needs_research = False
+
+        # Now iterate through pending professions and states using sidebar filters
+        for profession, state_suburbs in profession_groups.items():
+            # No results for the profession alone means none for any state/suburb
+            if not needs_research and self._profession_has_no_results(prefix, profession):
+                logger.info(f"No {profession} results for '{prefix}', skipping {len(state_suburbs)} combinations")
+                for state, suburb in state_suburbs:
+                    next(processed)
+                    combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
+                    self.checkpoint.mark_combination_empty(combo_key)
+                    self.checkpoint.mark_combination_completed(combo_key)
+                    self._maybe_save_checkpoint()
+                continue
 
-                        logger.info(f"[{processed}/{total_combinations}] Sidebar filter: {filter_desc}")
+            for state, suburb in state_suburbs:
+                state_abbrev = STATE_ABBREVIATIONS.get(state, state)
+                combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
 
-                        try:
-                            # If page state was lost, re-search before continuing
-                            if needs_research or not self._verify_sidebar_present():
-                                logger.info(f"Re-searching prefix '{prefix}' to restore page state")
-                                if self._re_search_prefix(prefix):
-                                    needs_research = False
-                                else:
-                                    logger.warning(f"Failed to re-search prefix '{prefix}'")
-                                    # Mark as completed with 0 results to avoid infinite loop
-                                    self.checkpoint.mark_combination_completed(combo_key)
-                                    self.checkpoint.save()
-                                    continue
+                current = next(processed)
 
-                            self.checkpoint.set_current_combination(combo_key)
+                # Build filter description for logging
+                filter_desc = self._describe_filters(prefix, profession, state_abbrev, suburb)
 
-                            # Use sidebar filters to apply profession, state, and suburb
-                            count = self._apply_sidebar_filter_and_collect(prefix, profession, state, suburb)
+                logger.info(f"[{current}/{total_combinations}] Sidebar filter: {filter_desc}")
 
-                            # Mark combination as completed
+                try:
+                    # A missing sidebar is often a filter-triggered reload still in
+                    # flight: waiting for it is far cheaper than a full re-search
+                    if not needs_research and not self._verify_sidebar_present():
+                        self._wait_for_page_stable(timeout=5000)
+
+                    # If page state was lost, re-search before continuing
+                    if needs_research or not self._verify_sidebar_present():
+                        logger.info(f"Re-searching prefix '{prefix}' to restore page state")
+                        if self._re_search_prefix(prefix):
+                            needs_research = False
+                        else:
+                            logger.warning(f"Failed to re-search prefix '{prefix}'")
+                            # Mark as completed with 0 results to avoid infinite loop
                             self.checkpoint.mark_combination_completed(combo_key)
-                            self.checkpoint.save()
+                            self._maybe_save_checkpoint(force=True)
+                            continue
 
-                            # Log progress periodically
-                            if processed % 50 == 0:
-                                current_discovered = self.checkpoint.stats['total_discovered']
-                                new_so_far = current_discovered - total_discovered_start
-                                logger.info(f"Progress: {processed}/{total_combinations} | New discoveries: {new_so_far:,}")
+                    self.checkpoint.set_current_combination(combo_key)
 
-                        except Exception as e:
-                            logger.error(f"Error processing combination '{combo_key}': {e}")
-                            self.checkpoint.increment_errors()
-                            needs_research = True  # Page state likely lost
+                    # Use sidebar filters to apply profession, state, and suburb
+                    count = self._apply_sidebar_filter_and_collect(prefix, profession, state, suburb)
 
-                            # Track retry count
-                            self._retry_counts[combo_key] = self._retry_counts.get(combo_key, 0) + 1
+                    # Mark combination as completed
+                    self.checkpoint.mark_combination_completed(combo_key)
+                    self._maybe_save_checkpoint()
 
-                            if self._retry_counts[combo_key] >= MAX_RETRIES:
-                                logger.warning(f"Skipping combination '{combo_key}' after {MAX_RETRIES} failed attempts")
-                                # Mark as completed to avoid retry loop
-                                self.checkpoint.mark_combination_completed(combo_key)
-                                self.checkpoint.save()
+                    # Log progress periodically
+                    if current % 50 == 0:
+                        current_discovered = self.checkpoint.stats['total_discovered']
+                        new_so_far = current_discovered - total_discovered_start
+                        logger.info(f"Progress: {current}/{total_combinations} | New discoveries: {new_so_far:,}")
 
-                # Try to clear profession filter after all states/suburbs for this profession
-                try:
-                    if self._verify_sidebar_present():
-                        self._input_sidebar_suburb(None)  # Clear suburb filter
-                        self._select_sidebar_profession(profession, select=False)
-                        self._select_sidebar_state("All")  # Reset state to All
-                        ui_delay()
-                except Exception:
-                    needs_research = True
+                except Exception as e:
+                    logger.error(f"Error processing combination '{combo_key}': {e}")
+                    self.checkpoint.increment_errors()
+                    needs_research = True  # Page state likely lost
+
+                    # Track retry count
+                    self._retry_counts[combo_key] = self._retry_counts.get(combo_key, 0) + 1
 
-            # Try to clear all filters before moving to next prefix
+                    if self._retry_counts[combo_key] >= MAX_RETRIES:
+                        logger.warning(f"Skipping combination '{combo_key}' after {MAX_RETRIES} failed attempts")
+                        # Mark as completed to avoid retry loop
+                        self.checkpoint.mark_combination_completed(combo_key)
+                        self._maybe_save_checkpoint(force=True)
+
+            # Try to clear profession filter after all states/suburbs for this profession
             try:
-                self._clear_sidebar_filters()
+                if self._verify_sidebar_present():
+                    self._input_sidebar_suburb(None)  # Clear suburb filter
+                    self._select_sidebar_profession(profession, select=False)
+                    self._select_sidebar_state("All")  # Reset state to All
+                    ui_delay()
             except Exception:
-                pass  # Will re-navigate for next prefix anyway
+                needs_research = True
+
+        # Try to clear all filters before moving to next prefix
+        try:
+            self._clear_sidebar_filters()
+        except Exception:
+            pass  # Will re-navigate for next prefix anyway
+
+    def _profession_has_no_results(self, prefix: str, profession: str) -> bool:
+        """
+        Probe whether a profession has any results for the current prefix.
+
+        Applies only the profession sidebar filter and reads the result count.
+        When there are results the filter is left applied for the first
+        state/suburb combination; when there are none it is removed again.
+
+        Args:
+            prefix: Current search prefix (for logging)
+            profession: Profession to probe
+
+        Returns:
+            True only if the profession filter was applied and showed no results
+        """
+        try:
+            if not self._verify_sidebar_present():
+                return False
+
+            snapshot = self._results_snapshot()
+            if not self._select_sidebar_profession(profession, select=True):
+                return False
+            self._wait_for_filter_effect(snapshot)
+            sidebar_filter_delay()
+
+            # Require the explicit no-results message too: a failed count read
+            # also yields 0 and must not prune real combinations
+            if self._get_result_count() > 0 or not self._no_results_shown():
+                return False
+
+            # Restore the unfiltered results for the next profession
+            snapshot = self._results_snapshot()
+            self._select_sidebar_profession(profession, select=False)
+            self._wait_for_filter_effect(snapshot, timeout=5000)
+            return True
+
+        except Exception as e:
+            logger.debug(f"Profession probe failed for {profession} | '{prefix}': {e}")
+            return False
+
+    def _sidebar_filters_active(self, profession: str) -> bool:
+        """
+        Check whether the profession sidebar filter is still applied.
+
+        Used after a search-box submit to detect AHPRA resetting the sidebar;
+        the profession checkbox is the filter that is always set.
+
+        Args:
+            profession: Profession whose checkbox should still be checked
+
+        Returns:
+            True if the profession checkbox is present and checked
+        """
+        checkbox_selector = self._profession_filter_selectors[profession][0]
+        try:
+            return bool(self.browser.page.evaluate(
+                'sel => document.querySelector(sel)?.checked || false', checkbox_selector
+            ))
+        except Exception:
+            return False
+
+    def _resubmit_under_filters(self, prefix: str, profession: str) -> bool:
+        """
+        Re-submit the search box for a new prefix, keeping the sidebar filters.
+
+        Waits for the results to change from the previous prefix's rows, since
+        those already satisfy _perform_search's results wait.
+
+        Args:
+            prefix: New name prefix to search
+            profession: Profession filter expected to stay applied
+
+        Returns:
+            True if the new prefix's results are loaded with the filters
+            still active; False if the caller should run a fresh search
+        """
+        try:
+            snapshot = self._results_snapshot()
+            if not self._perform_search(prefix):
+                logger.info(f"Re-search failed for prefix '{prefix}', retrying with a fresh search")
+                return False
+            if not self._wait_for_filter_effect(snapshot):
+                logger.info(f"Results did not update for prefix '{prefix}', retrying with a fresh search")
+                return False
+            if self._get_result_count() and not self._sidebar_filters_active(profession):
+                logger.info("Sidebar filters were reset by the search, re-applying")
+                return False
+            return True
+
+        except Exception as e:
+            logger.info(f"Re-search failed for prefix '{prefix}' ({e}), retrying with a fresh search")
+            return False
+
+    def _run_filter_first_discovery(self) -> int:
+        """
+        Run optimized multi-dimensional discovery in filter-first order.
+
+        Iteration order: PROFESSION → STATE → SUBURB → PREFIX. The sidebar
+        filters for a (profession, state, suburb) group are applied once, then
+        only the search box is re-submitted for each prefix. If a submit resets
+        the sidebar, the group falls back to a fresh home-page search and
+        re-applies the filters (the prefix-first cost) for the next prefix.
+
+        Returns:
+            Number of new practitioners discovered
+        """
+        prefixes = [self.test_prefix] if self.test_prefix else list(ALPHABET)
+        total_discovered_start = self.checkpoint.stats['total_discovered']
+
+        # Group pending prefixes by filter combination, preserving plan order
+        suburbs_by_state = self._suburbs_by_state(STATES)
+        total_combinations = len(prefixes) * len(PROFESSIONS) * sum(len(v) for v in suburbs_by_state.values())
+        completed = self.checkpoint.completed_combinations
+        filters = [(p, s, sub) for p in PROFESSIONS for s in STATES for sub in suburbs_by_state[s]]
+        tasks = [
+            (filter_set, prefix)
+            for filter_set, prefix in product(filters, prefixes)
+            if (*filter_set, prefix) not in completed
+        ]
+        pending_count = len(tasks)
+
+        pending: Dict[Tuple[str, str, Optional[str]], List[str]] = {
+            filter_set: [prefix for _, prefix in group]
+            for filter_set, group in groupby(tasks, key=itemgetter(0))
+        }
+        logger.info(f"FILTER-FIRST MODE: {len(pending):,} filter groups, {pending_count:,} pending combinations")
+        if self.concurrency > 1:
+            logger.warning("Filter-first mode runs a single browser; ignoring --workers")
+
+        processed = count(total_combinations - pending_count + 1)
+
+        for group_idx, ((profession, state, suburb), group_prefixes) in enumerate(pending.items()):
+            state_abbrev = STATE_ABBREVIATIONS.get(state, state)
+            logger.info(f"\n{'='*60}")
+            logger.info(f"FILTERS [{group_idx + 1}/{len(pending)}]: {profession} | {state_abbrev}" + (f" | {suburb}" if suburb else ""))
+            logger.info(f"{'='*60}")
+
+            filters_applied = False
+
+            for prefix in group_prefixes:
+                combo_key = self.checkpoint.make_combination_key(profession, state, prefix, suburb)
+                filter_desc = self._describe_filters(prefix, profession, state_abbrev, suburb)
+                current = next(processed)
+                logger.info(f"[{current}/{total_combinations}] Filter-first: {filter_desc}")
+
+                try:
+                    if filters_applied:
+                        # Cheap path: re-submit the search box under the current
+                        # filters; any failure falls through to a fresh search
+                        filters_applied = self._resubmit_under_filters(prefix, profession)
+
+                    if not filters_applied:
+                        # Fresh search for this prefix, then apply the sidebar filters
+                        if not self.browser.navigate(AHPRA_SEARCH_URL, wait_until='domcontentloaded'):
+                            raise RuntimeError("failed to navigate to search page")
+                        random_delay()
+                        if not self._perform_search(prefix):
+                            raise RuntimeError(f"search failed for prefix '{prefix}'")
+                        if self._get_result_count() == 0:
+                            # No results for the prefix at all, so none under any filter
+                            logger.debug(f"No results for prefix '{prefix}'")
+                            self.checkpoint.mark_combination_completed(combo_key)
+                            self._maybe_save_checkpoint()
+                            continue
+                        if not self._apply_sidebar_filters(prefix, profession, state_abbrev, suburb):
+                            raise RuntimeError(f"could not apply sidebar filters for {filter_desc}")
+                        filters_applied = True
+
+                    self.checkpoint.set_current_combination(combo_key)
+                    self._collect_filtered_results(prefix, filter_desc)
+
+                    self.checkpoint.mark_combination_completed(combo_key)
+                    self._maybe_save_checkpoint()
+
+                    # Log progress periodically
+                    if current % 50 == 0:
+                        new_so_far = self.checkpoint.stats['total_discovered'] - total_discovered_start
+                        logger.info(f"Progress: {current}/{total_combinations} | New discoveries: {new_so_far:,}")
+
+                except Exception as e:
+                    logger.error(f"Error processing combination '{combo_key}': {e}")
+                    self.checkpoint.increment_errors()
+                    filters_applied = False  # Page state likely lost
+
+                    # Track retry count
+                    self._retry_counts[combo_key] = self._retry_counts.get(combo_key, 0) + 1
+
+                    if self._retry_counts[combo_key] >= MAX_RETRIES:
+                        logger.warning(f"Skipping combination '{combo_key}' after {MAX_RETRIES} failed attempts")
+                        # Mark as completed to avoid retry loop
+                        self.checkpoint.mark_combination_completed(combo_key)
+                        self._maybe_save_checkpoint(force=True)
 
         # Final save and cleanup
-        self.checkpoint.save()
+        self.checkpoint.save(durable=True)
         self.checkpoint.close_raw_backup()
 
         new_discovered = self.checkpoint.stats['total_discovered'] - total_discovered_start
-        logger.info(f"\nOPTIMIZED discovery complete. New practitioners found: {new_discovered:,}")
+        logger.info(f"\nFILTER-FIRST discovery complete. New practitioners found: {new_discovered:,}")
 
         return new_discovered
@@ -7,12 +7,22 @@ Saves extracted data as both JSON backup and CSV output.
 
 import csv
 import json
+import mmap
+import queue
+import re
+import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json
+    orjson = None
+
 from config.settings import (
     EXTRACTED_DIR,
     BACKUP_DIR,
@@ -22,12 +32,44 @@ from config.settings import (
     RETRY_DELAY,
     CHECKPOINT_INTERVAL,
     PROGRESS_DISPLAY_INTERVAL,
+    EXTRACT_FLUSH_BATCH,
+    EXTRACT_FLUSH_SECONDS,
+    EXTRACT_WRITE_BUFFER,
+    EXTRACT_PREFETCH_DEPTH,
 )
 from src.api_client import AHPRAClient
 from src.checkpoint import CheckpointManager
 from src.parser import PractitionerParser
 from src.utils import get_date_string, format_duration
 
+# CSV column order; rows are written positionally rather than via DictWriter
+_CSV_FIELDS = tuple(DATA_FIELDS)
+
+
+def _jsonl_line(record: Dict) -> bytes:
+    """Serialize a record to one UTF-8 JSONL line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+# reg_id member of a JSONL backup record (orjson and stdlib json spacing)
+_BACKUP_REG_ID = re.compile(rb'"reg_id"\s*:\s*"([^"\\]+)"')
+
+# Blocking-page detection: one case-insensitive pass over the HTML finds any
+# marker; only on a hit are the types checked again, in priority order
+_BLOCKING_MARKERS = re.compile(r'captcha|too many requests|rate limit|access denied|blocked', re.IGNORECASE)
+_BLOCKING_TYPES = (
+    ('captcha', re.compile(r'captcha', re.IGNORECASE), "CAPTCHA detected for {}! Server is rate limiting."),
+    ('ratelimit', re.compile(r'too many requests|rate limit', re.IGNORECASE), "Rate limit page detected for {}!"),
+    ('blocked', re.compile(r'access denied|blocked', re.IGNORECASE), "Access denied page detected for {}!"),
+)
+
+# Blocking pages are small; a response at least this long that renders a
+# practitioner (the parser's name heading) is a real page and is not scanned
+_BLOCKING_PAGE_MAX_CHARS = 10_000
+_PRACTITIONER_PAGE_SENTINEL = 'class="practitioner-name"'
+
 
 class ExtractionEngine:
     """
@@ -50,15 +92,27 @@ class ExtractionEngine:
 
         # Output files
         self.output_file: Optional[Path] = None
+        self.output_ids_file: Optional[Path] = None  # Sidecar reg_id index for the CSV
         self._csv_writer = None
         self._output_handle = None
+        self._output_ids_handle = None
 
         # JSON backup (using JSONL format for incremental writes)
         self.backup_file = EXTRACTED_BACKUP_FILE
         self.backup_metadata_file = EXTRACTED_BACKUP_FILE.with_suffix('.meta.json')
+        self.backup_ids_file = EXTRACTED_BACKUP_FILE.with_suffix('.ids')  # One reg_id per line
         self._backup_handle = None  # File handle for JSONL
-        self._backup_reg_ids: set = set()  # Track what's already in backup
+        self._backup_ids_handle = None
+        # Track what's already in backup. Reg_ids in both dedup sets are
+        # interned, sharing one string object with each other and the checkpoint
+        self._backup_reg_ids: set = set()
         self._backup_count: int = 0  # Track count without loading all data
+        self._backup_started_at: Optional[str] = None  # Read from metadata once at startup
+        self._metadata_saved_count: Optional[int] = None  # _backup_count at the last metadata write
+
+        # extracted_at timestamp, rebuilt at most once per second
+        self._ts_cache_time: float = 0
+        self._ts_cache_str: str = ""
 
         # Progress tracking
         self._extraction_start_time: Optional[float] = None
@@ -67,6 +121,10 @@ class ExtractionEngine:
         # CSV deduplication
         self._csv_reg_ids: set = set()
 
+        # Batched flushing of the CSV/JSONL buffers
+        self._writes_since_flush: int = 0
+        self._last_flush_ts: float = time.monotonic()
+
     def initialize(self) -> bool:
         """
         Initialize the extraction engine.
@@ -83,30 +141,44 @@ class ExtractionEngine:
         # Create CSV output file
         date_str = get_date_string()
         self.output_file = EXTRACTED_DIR / f"practitioners_{date_str}.csv"
+        self.output_ids_file = self.output_file.with_suffix('.csv.ids')
 
         # Check if we're resuming (file exists)
         file_exists = self.output_file.exists()
 
-        # Scan existing CSV for reg_ids (deduplication)
+        # Load existing CSV reg_ids (deduplication) from the sidecar index,
+        # falling back to a full CSV scan when the index is missing or stale
         if file_exists:
-            try:
-                with open(self.output_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get('reg_id'):
-                            self._csv_reg_ids.add(row['reg_id'])
-                if self._csv_reg_ids:
-                    logger.info(f"Loaded {len(self._csv_reg_ids)} reg_ids from existing CSV")
-            except Exception as e:
-                logger.warning(f"Failed to scan existing CSV: {e}")
+            sidecar_ids = self._load_sidecar_ids(self.output_ids_file, self.output_file)
+            if sidecar_ids is not None:
+                self._csv_reg_ids = sidecar_ids
+            else:
+                try:
+                    with open(self.output_file, 'r', encoding='utf-8') as f:
+                        reader = csv.DictReader(f)
+                        for row in reader:
+                            if row.get('reg_id'):
+                                self._csv_reg_ids.add(sys.intern(row['reg_id']))
+                    self._rebuild_sidecar_ids(self.output_ids_file, self._csv_reg_ids)
+                except Exception as e:
+                    logger.warning(f"Failed to scan existing CSV: {e}")
+            if self._csv_reg_ids:
+                logger.info(f"Loaded {len(self._csv_reg_ids)} reg_ids from existing CSV")
+        elif self.output_ids_file.exists():
+            self.output_ids_file.unlink()  # Orphaned index of a deleted CSV
 
         # Open file for appending
-        self._output_handle = open(self.output_file, 'a', newline='', encoding='utf-8')
-        self._csv_writer = csv.DictWriter(self._output_handle, fieldnames=DATA_FIELDS)
+        self._output_handle = open(
+            self.output_file, 'a', newline='', encoding='utf-8', buffering=EXTRACT_WRITE_BUFFER
+        )
+        self._csv_writer = csv.writer(self._output_handle)
+        self._output_ids_handle = open(
+            self.output_ids_file, 'a', encoding='utf-8', buffering=EXTRACT_WRITE_BUFFER
+        )
 
         # Write header if new file
         if not file_exists:
-            self._csv_writer.writeheader()
+            self._csv_writer.writerow(_CSV_FIELDS)
 
         logger.info(f"CSV output: {self.output_file}")
 
@@ -132,43 +204,116 @@ class ExtractionEngine:
                 with open(self.backup_metadata_file, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
                 self._backup_count = metadata.get('total_extracted', 0)
+                self._backup_started_at = metadata.get('started_at')
+                self._metadata_saved_count = self._backup_count
             except Exception as e:
                 logger.warning(f"Failed to load backup metadata: {e}")
                 self._backup_count = 0
 
-        # Scan existing JSONL file for reg_ids (deduplication)
+        # Load existing JSONL reg_ids (deduplication) from the sidecar index,
+        # falling back to a full JSONL scan when the index is missing or stale
+        sidecar_ids = None
         if self.backup_file.exists():
+            sidecar_ids = self._load_sidecar_ids(self.backup_ids_file, self.backup_file)
+        elif self.backup_ids_file.exists():
+            self.backup_ids_file.unlink()  # Orphaned index of a deleted backup
+
+        if sidecar_ids is not None:
+            self._backup_reg_ids = sidecar_ids
+            self._backup_count = len(self._backup_reg_ids)
+            logger.info(f"Loaded {len(self._backup_reg_ids)} reg_ids from backup index")
+        elif self.backup_file.exists():
             try:
-                with open(self.backup_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                record = json.loads(line)
-                                if 'reg_id' in record:
-                                    self._backup_reg_ids.add(record['reg_id'])
-                            except json.JSONDecodeError:
-                                continue
+                self._backup_reg_ids = self._scan_backup_reg_ids()
                 self._backup_count = len(self._backup_reg_ids)
                 logger.info(f"Loaded {len(self._backup_reg_ids)} reg_ids from existing backup")
+                self._rebuild_sidecar_ids(self.backup_ids_file, self._backup_reg_ids)
             except Exception as e:
                 logger.warning(f"Failed to scan backup file: {e}")
 
-        # Open JSONL file for appending
-        self._backup_handle = open(self.backup_file, 'a', encoding='utf-8')
+        # Open JSONL file (and its reg_id index) for appending
+        self._backup_handle = open(self.backup_file, 'ab', buffering=EXTRACT_WRITE_BUFFER)
+        self._backup_ids_handle = open(
+            self.backup_ids_file, 'a', encoding='utf-8', buffering=EXTRACT_WRITE_BUFFER
+        )
 
         # Write initial metadata if new
         if not self.backup_metadata_file.exists():
             self._save_backup_metadata(is_initial=True)
 
+    def _scan_backup_reg_ids(self) -> set:
+        """
+        Collect reg_ids from the JSONL backup without parsing the records.
+
+        Runs one regex pass over the memory-mapped file. Only complete lines
+        are scanned, so a record torn by a crash mid-write is not counted.
+
+        Returns:
+            Set of reg_ids found in the backup
+        """
+        with open(self.backup_file, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b'\n') + 1
+                return {
+                    sys.intern(match.group(1).decode('ascii', 'replace'))
+                    for match in _BACKUP_REG_ID.finditer(mm, 0, end)
+                }
+
+    def _load_sidecar_ids(self, ids_file: Path, data_file: Path) -> Optional[set]:
+        """
+        Load reg_ids from a sidecar index written alongside a data file.
+
+        The index is appended and flushed after its data file, so an index
+        that is older than the data file may be missing records (e.g. after
+        a crash) and is not trusted.
+
+        Args:
+            ids_file: Sidecar index (one reg_id per line)
+            data_file: CSV or JSONL file the index describes
+
+        Returns:
+            Set of reg_ids, or None if the index is missing or stale
+        """
+        try:
+            if not ids_file.exists() or ids_file.stat().st_mtime_ns < data_file.stat().st_mtime_ns:
+                logger.info(f"Reg_id index {ids_file.name} missing or stale, rescanning {data_file.name}")
+                return None
+            return set(map(sys.intern, ids_file.read_text(encoding='utf-8').split()))
+        except Exception as e:
+            logger.warning(f"Failed to read reg_id index {ids_file}: {e}")
+            return None
+
+    def _rebuild_sidecar_ids(self, ids_file: Path, reg_ids: set) -> None:
+        """
+        Atomically rewrite a sidecar reg_id index after a full rescan.
+
+        Args:
+            ids_file: Sidecar index to rewrite
+            reg_ids: All reg_ids present in the data file
+        """
+        try:
+            temp_file = ids_file.with_suffix(ids_file.suffix + '.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.writelines(f"{reg_id}\n" for reg_id in reg_ids)
+            temp_file.replace(ids_file)
+        except Exception as e:
+            logger.warning(f"Failed to rebuild reg_id index {ids_file}: {e}")
+
     def close(self) -> None:
         """Close output file handles and API client."""
+        # Data files before their indexes (see _load_sidecar_ids)
         if self._output_handle:
             self._output_handle.flush()
             self._output_handle.close()
             self._output_handle = None
             self._csv_writer = None
 
+        if self._output_ids_handle:
+            self._output_ids_handle.close()
+            self._output_ids_handle = None
+
         if self._backup_handle:
             self._backup_handle.flush()
             self._backup_handle.close()
@@ -176,6 +321,10 @@ class ExtractionEngine:
             # Save final metadata
             self._save_backup_metadata()
 
+        if self._backup_ids_handle:
+            self._backup_ids_handle.close()
+            self._backup_ids_handle = None
+
         if self._owns_client and self.api_client:
             self.api_client.close()
 
@@ -214,61 +363,69 @@ class ExtractionEngine:
         extracted_count = 0
         self._extraction_start_time = time.time()
 
-        for i, reg_id in enumerate(pending):
-            # Skip if already extracted (checkpoint deduplication)
-            if self.checkpoint.is_reg_id_extracted(reg_id):
-                continue
+        # Dedup once up front: pending already excludes extracted reg_ids,
+        # so only the JSON backup (secondary deduplication) is consulted
+        to_extract = [reg_id for reg_id in pending if reg_id not in self._backup_reg_ids]
+        if len(to_extract) < len(pending):
+            logger.info(f"Skipping {len(pending) - len(to_extract):,} reg_ids already in backup")
+        total = len(to_extract)
 
-            # Skip if already in JSON backup (secondary deduplication)
-            if reg_id in self._backup_reg_ids:
-                logger.debug(f"Skipping {reg_id} - already in backup")
-                continue
+        # Responses are fetched ahead on a background thread while the
+        # previous one is parsed and written here
+        fetched = self._prefetch_html(to_extract)
+        try:
+            for reg_id, html, fetch_error in fetched:
+                checkpoint_due = False
+                try:
+                    if fetch_error is not None:
+                        raise fetch_error
 
-            try:
-                # Extract practitioner data via API
-                data = self._extract_practitioner(reg_id)
+                    # Extract practitioner data from the API response
+                    data = self._parse_response(reg_id, html)
 
-                if data:
-                    # Save to JSON backup FIRST (before CSV)
-                    self._save_to_json_backup(data)
+                    if data:
+                        # Save to JSON backup FIRST (before CSV)
+                        self._save_to_json_backup(data)
 
-                    # Write to CSV
-                    self._write_record(data)
+                        # Write to CSV
+                        self._write_record(data)
 
-                    # Mark as extracted in checkpoint
-                    self.checkpoint.mark_extracted(reg_id)
-                    extracted_count += 1
+                        # Mark as extracted in checkpoint
+                        self.checkpoint.mark_extracted(reg_id)
+                        extracted_count += 1
+                        checkpoint_due = extracted_count % CHECKPOINT_INTERVAL == 0
+                        self._maybe_flush()
 
-                    # Display progress every PROGRESS_DISPLAY_INTERVAL (50)
-                    if extracted_count % PROGRESS_DISPLAY_INTERVAL == 0:
-                        self._display_progress(extracted_count, len(pending))
+                        # Display progress every PROGRESS_DISPLAY_INTERVAL (50)
+                        if extracted_count % PROGRESS_DISPLAY_INTERVAL == 0:
+                            self._display_progress(extracted_count, total)
 
-                else:
-                    logger.warning(f"No data extracted for {reg_id}")
-                    self.checkpoint.increment_errors()
+                    else:
+                        logger.warning(f"No data extracted for {reg_id}")
+                        self.checkpoint.increment_errors()
 
-            except Exception as e:
-                logger.error(f"Error extracting {reg_id}: {e}")
-                self.checkpoint.increment_errors()
-                # Flush files on error to prevent data loss
-                if self._output_handle:
-                    self._output_handle.flush()
-                if self._backup_handle:
-                    self._backup_handle.flush()
-
-            # Auto-save checkpoint
-            self.checkpoint.auto_save_if_needed()
-
-            # Periodic checkpoint save every CHECKPOINT_INTERVAL (50)
-            if self.checkpoint.should_save(extracted_count):
-                self.checkpoint.save()
-                self._save_json_backup()  # Also save JSON backup
-                self._output_handle.flush()
+                except Exception as e:
+                    logger.error(f"Error extracting {reg_id}: {e}")
+                    self.checkpoint.increment_errors()
+                    # Flush files on error to prevent data loss
+                    self._flush_outputs()
+
+                # Checkpoint every CHECKPOINT_INTERVAL (50) records or
+                # AUTO_SAVE_INTERVAL seconds. Records must reach the files
+                # before the checkpoint marks them as extracted.
+                if checkpoint_due or self.checkpoint.auto_save_due():
+                    self._flush_outputs()
+                    self.checkpoint.save()
+                    self._save_json_backup()  # Also save JSON backup
+        finally:
+            fetched.close()
+            # Interrupts propagate to a caller that saves the checkpoint:
+            # the buffered records must be written out before that
+            self._flush_outputs()
 
         # Final save
-        self.checkpoint.save()
+        self.checkpoint.save(durable=True)
         self._save_json_backup()
-        self._output_handle.flush()
 
         logger.info(f"Extraction complete. Total extracted: {extracted_count:,}")
         return extracted_count
@@ -285,9 +442,10 @@ class ExtractionEngine:
         else:
             eta_str = "calculating..."
 
-        # Get file sizes
-        csv_size = self.output_file.stat().st_size / 1024 / 1024 if self.output_file.exists() else 0
-        json_size = self.backup_file.stat().st_size / 1024 / 1024 if self.backup_file.exists() else 0
+        # File sizes from the open append handles' positions (no stat calls).
+        # The CSV is read through its binary buffer: TextIOWrapper.tell() flushes.
+        csv_size = self._output_handle.buffer.tell() / 1024 / 1024 if self._output_handle else 0
+        json_size = self._backup_handle.tell() / 1024 / 1024 if self._backup_handle else 0
 
         logger.info(
             f"[{extracted:,}/{total:,}] "
@@ -302,26 +460,55 @@ class ExtractionEngine:
         Write a practitioner record to JSON backup file incrementally.
 
         Uses JSONL format (one JSON object per line) for memory efficiency.
+        The extracted_at stamp is added to `data` only while it is
+        serialized, instead of copying the record.
 
         Args:
-            data: Practitioner data dictionary
+            data: Practitioner data dictionary (returned unchanged)
         """
-        # Add extracted_at timestamp
-        backup_entry = data.copy()
-        backup_entry['extracted_at'] = datetime.now().isoformat()
+        # Add extracted_at timestamp (second resolution is plenty at API pace)
+        now = time.time()
+        if now - self._ts_cache_time >= 1.0:
+            self._ts_cache_time = now
+            self._ts_cache_str = datetime.fromtimestamp(now).isoformat()
+        data['extracted_at'] = self._ts_cache_str
 
         # Write as single JSON line (JSONL format)
         try:
-            self._backup_handle.write(json.dumps(backup_entry, ensure_ascii=False) + '\n')
-            # IMMEDIATELY flush to prevent data loss
-            self._backup_handle.flush()
+            self._backup_handle.write(_jsonl_line(data))
             self._backup_count += 1
 
-            # Track in dedup set
+            # Track in dedup set and its on-disk index
             if data.get('reg_id'):
-                self._backup_reg_ids.add(data['reg_id'])
+                self._backup_reg_ids.add(sys.intern(data['reg_id']))
+                self._backup_ids_handle.write(data['reg_id'] + '\n')
         except Exception as e:
             logger.error(f"Failed to write to JSON backup: {e}")
+        finally:
+            # Hand the record back unchanged
+            data.pop('extracted_at', None)
+
+    def _maybe_flush(self) -> None:
+        """
+        Count a written record and flush the output buffers every
+        EXTRACT_FLUSH_BATCH records or EXTRACT_FLUSH_SECONDS seconds.
+        """
+        self._writes_since_flush += 1
+        if (self._writes_since_flush >= EXTRACT_FLUSH_BATCH
+                or time.monotonic() - self._last_flush_ts >= EXTRACT_FLUSH_SECONDS):
+            self._flush_outputs()
+
+    def _flush_outputs(self) -> None:
+        """Flush buffered CSV and JSONL writes (then their reg_id indexes) to the OS."""
+        try:
+            for handle in (self._output_handle, self._backup_handle,
+                           self._output_ids_handle, self._backup_ids_handle):
+                if handle:
+                    handle.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush output files: {e}")
+        self._writes_since_flush = 0
+        self._last_flush_ts = time.monotonic()
 
     def _save_json_backup(self) -> None:
         """Flush JSONL backup and save metadata."""
@@ -339,36 +526,77 @@ class ExtractionEngine:
         """
         Save backup metadata to separate file.
 
+        Skipped when no records were backed up since the last write. The
+        original started_at is kept in memory from startup rather than
+        re-read from the old file.
+
         Args:
             is_initial: True if this is the initial metadata creation
         """
+        if not is_initial and self._backup_count == self._metadata_saved_count:
+            return
+
         try:
+            now = datetime.now().isoformat()
+            if is_initial or not self._backup_started_at:
+                self._backup_started_at = now
+
             metadata = {
                 'total_extracted': self._backup_count,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': now,
+                'started_at': self._backup_started_at,
             }
 
-            if is_initial:
-                metadata['started_at'] = datetime.now().isoformat()
-            elif self.backup_metadata_file.exists():
-                # Preserve original started_at
-                try:
-                    with open(self.backup_metadata_file, 'r', encoding='utf-8') as f:
-                        old_meta = json.load(f)
-                    metadata['started_at'] = old_meta.get('started_at', metadata['last_updated'])
-                except Exception:
-                    metadata['started_at'] = metadata['last_updated']
-            else:
-                metadata['started_at'] = metadata['last_updated']
-
             # Atomic write
             temp_file = self.backup_metadata_file.with_suffix('.tmp')
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2)
             temp_file.replace(self.backup_metadata_file)
+            self._metadata_saved_count = self._backup_count
         except Exception as e:
             logger.error(f"Failed to save backup metadata: {e}")
 
+    def _prefetch_html(self, reg_ids: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        Fetch practitioner pages in order on a background thread.
+
+        A single daemon thread makes the requests one after another, so the
+        API client's pacing, backoff and session state stay single-threaded
+        and the request rate is unchanged; it runs at most
+        EXTRACT_PREFETCH_DEPTH responses ahead of the consumer. Closing the
+        generator stops it after the request in flight.
+
+        Args:
+            reg_ids: Registration IDs to fetch
+
+        Yields:
+            (reg_id, html or None, exception raised by the fetch or None)
+        """
+        results: queue.Queue = queue.Queue(maxsize=EXTRACT_PREFETCH_DEPTH)
+        stop = threading.Event()
+
+        def fetch_all() -> None:
+            for reg_id in reg_ids:
+                if stop.is_set():
+                    return
+                try:
+                    item = (reg_id, self.api_client.fetch_practitioner(reg_id), None)
+                except Exception as e:
+                    item = (reg_id, None, e)
+                while not stop.is_set():
+                    try:
+                        results.put(item, timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+
+        threading.Thread(target=fetch_all, name='extract-prefetch', daemon=True).start()
+        try:
+            for _ in reg_ids:
+                yield results.get()
+        finally:
+            stop.set()
+
     def _extract_practitioner(self, reg_id: str) -> Optional[Dict]:
         """
         Extract data for a single practitioner via API.
@@ -379,32 +607,39 @@ class ExtractionEngine:
         Returns:
             Extracted data dictionary or None
         """
-        # Fetch HTML via API
-        html = self.api_client.fetch_practitioner(reg_id)
+        return self._parse_response(reg_id, self.api_client.fetch_practitioner(reg_id))
 
+    def _parse_response(self, reg_id: str, html: Optional[str]) -> Optional[Dict]:
+        """
+        Check a fetched practitioner page for blocking and parse it.
+
+        Args:
+            reg_id: Registration ID
+            html: Fetched HTML, or None if the fetch failed
+
+        Returns:
+            Extracted data dictionary or None
+        """
         if not html:
             logger.warning(f"Failed to fetch data for {reg_id} - no HTML returned")
             return None
 
         # Debug: Check for rate limiting or CAPTCHA indicators
-        html_lower = html.lower()
-        blocking_detected = False
         blocking_type = None
+        is_practitioner_page = (
+            len(html) >= _BLOCKING_PAGE_MAX_CHARS and _PRACTITIONER_PAGE_SENTINEL in html
+        )
+        if not is_practitioner_page and _BLOCKING_MARKERS.search(html):
+            for kind, pattern, message in _BLOCKING_TYPES:
+                if pattern.search(html):
+                    logger.error(message.format(reg_id))
+                    blocking_type = kind
+                    break
+
+        if blocking_type:
+            # Never serve a blocking page from the HTML cache
+            self.api_client.discard_cached(reg_id)
 
-        if 'captcha' in html_lower or 'recaptcha' in html_lower:
-            logger.error(f"CAPTCHA detected for {reg_id}! Server is rate limiting.")
-            blocking_detected = True
-            blocking_type = "captcha"
-        elif 'too many requests' in html_lower or 'rate limit' in html_lower:
-            logger.error(f"Rate limit page detected for {reg_id}!")
-            blocking_detected = True
-            blocking_type = "ratelimit"
-        elif 'access denied' in html_lower or 'blocked' in html_lower:
-            logger.error(f"Access denied page detected for {reg_id}!")
-            blocking_detected = True
-            blocking_type = "blocked"
-
-        if blocking_detected:
             # Save the blocking page for analysis
             try:
                 debug_file = Path(f"debug_{blocking_type}_{reg_id}.html")
@@ -451,13 +686,12 @@ class ExtractionEngine:
                 logger.debug(f"Skipping CSV write - {reg_id} already exists")
                 return
 
-            self._csv_writer.writerow(data)
-            # IMMEDIATELY flush to prevent data loss
-            self._output_handle.flush()
+            self._csv_writer.writerow([data.get(field, '') for field in _CSV_FIELDS])
 
-            # Track in dedup set
+            # Track in dedup set and its on-disk index
             if reg_id:
-                self._csv_reg_ids.add(reg_id)
+                self._csv_reg_ids.add(sys.intern(reg_id))
+                self._output_ids_handle.write(reg_id + '\n')
         except Exception as e:
             logger.error(f"Failed to write record: {e}")
 
@@ -480,7 +714,7 @@ class ExtractionEngine:
         Returns:
             Progress dictionary
         """
-        pending = len(self.checkpoint.get_pending_reg_ids())
+        pending = self.checkpoint.get_pending_count()
         extracted = len(self.checkpoint.extracted_reg_ids)
 
         return {
@@ -5,12 +5,81 @@ Extracts all 16 required fields from practitioner profiles.
 """
 
 import re
+from bisect import bisect_right
+import threading
+from datetime import datetime
 from typing import Dict, Optional, Any
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from loguru import logger
 
 from config.settings import DATA_FIELDS
 
+# XPath predicate matching one class among an element's classes (CSS `.name`)
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+
+# Selectors compiled once and shared by every parse
+_XPATH_NAME = etree.XPath(f"//h2[{_HAS_CLASS.format('practitioner-name')}]")
+_XPATH_PROFESSION = etree.XPath(f"//h3[{_HAS_CLASS.format('practitioner-profession')}]")
+_XPATH_REG_NUMBER = etree.XPath(f"//span[{_HAS_CLASS.format('reg-number')}]")
+_XPATH_DIVISIONS = etree.XPath(
+    f"//*[{_HAS_CLASS.format('reg-types')}]//span[starts-with(@class, 'reg-type')]"
+)
+# Section rows, and the first field-title / field-entry within a row
+_XPATH_SECTION_ROWS = etree.XPath(f"//*[{_HAS_CLASS.format('section-row')}]")
+_XPATH_ROW_TITLE = etree.XPath(f"(.//*[{_HAS_CLASS.format('field-title')}])[1]")
+_XPATH_ROW_ENTRY = etree.XPath(f"(.//*[{_HAS_CLASS.format('field-entry')}])[1]")
+_XPATH_PAGE_TEXT = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+)
+
+# Empty result copied at the start of every parse (all fields None)
+_RESULT_TEMPLATE = dict.fromkeys(DATA_FIELDS)
+
+# Patterns used on every parse, compiled once
+_REG_ID_RE = re.compile(r'([A-Z]{3}\d{10,})')
+_TITLE_SUFFIX_RE = re.compile(r'\s*[-|]\s*AHPRA.*$')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+
+# Leading honorific followed by a space or dot (longest alternatives first)
+_TITLE_PREFIX_RE = re.compile(r'(Associate Professor|Professor|Prof|Miss|Mrs|Ms|Mr|Dr)[ .]')
+
+# Dates already in DD/MM/YYYY with a day 01-31 and month 01-12 come out of
+# _normalize_date unchanged, so they skip strptime entirely
+_DMY_FULL_RE = re.compile(r'(?:0[1-9]|[12]\d|3[01])/(?:0[1-9]|1[0-2])/\d{4}')
+
+# Date formats tried by _normalize_date, in order
+_DATE_FORMATS = (
+    '%d/%m/%Y', '%d-%m-%Y', '%d %B %Y', '%d %b %Y',
+    '%Y-%m-%d', '%m/%d/%Y',
+)
+
+# Status keywords for the page-text fallback, in priority order
+_STATUS_PATTERNS = tuple(
+    (status, re.compile(rf'\b{status}\b', re.IGNORECASE))
+    for status in ('Registered', 'Suspended', 'Cancelled', 'Non-practising')
+)
+
+# Per-thread lxml parser, reused across pages (parser objects are not thread-safe)
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """Return this thread's HTML parser, creating it on first use."""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        # No id() index (unused here); comments/PIs never carry field data
+        parser = lxml.html.HTMLParser(
+            collect_ids=False, remove_comments=True, remove_pis=True
+        )
+        _parser_local.parser = parser
+    return parser
+
+
+def _text(element) -> str:
+    """Element text with each text node stripped (BeautifulSoup get_text(strip=True))."""
+    return ''.join(s.strip() for s in element.itertext())
+
 
 class PractitionerParser:
     """
@@ -26,8 +95,12 @@ class PractitionerParser:
 
     def __init__(self):
         """Initialize the parser."""
-        self._soup = None
+        self._root = None  # lxml document root of the page being parsed
+        self._page_text_cache = None  # Lazily built page text of the current page
         self._field_map = {}  # Cache for field-title/field-entry pairs
+        self._field_titles = ''  # Field-map titles joined for one-shot substring search
+        self._field_offsets = []  # Start offset of each title within _field_titles
+        self._field_values = []  # Field-map values, parallel to _field_offsets
 
     def parse(self, html_content: str) -> Dict[str, Any]:
         """
@@ -39,12 +112,13 @@ class PractitionerParser:
         Returns:
             Dictionary with extracted fields
         """
-        self._soup = BeautifulSoup(html_content, 'lxml')
-
         # Initialize result with all fields
-        result = {field: None for field in DATA_FIELDS}
+        result = _RESULT_TEMPLATE.copy()
 
         try:
+            self._root = self._parse_document(html_content)
+            self._page_text_cache = None
+
             # Build field map from field-title/field-entry pairs
             self._build_field_map()
 
@@ -64,24 +138,72 @@ class PractitionerParser:
 
         return result
 
-    def _build_field_map(self) -> None:
+    @staticmethod
+    def _parse_document(html_content: str):
         """
-        Build a map of field titles to their values from field-title/field-entry pairs.
+        Parse HTML into an lxml document tree.
+
+        Args:
+            html_content: Raw HTML
+
+        Returns:
+            Root <html> element
+        """
+        parser = _html_parser()
+        try:
+            return lxml.html.document_fromstring(html_content, parser=parser)
+        except ValueError:
+            # lxml rejects str input carrying an XML encoding declaration
+            return lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+
+    def _select_one(self, xpath: etree.XPath):
+        """
+        Return the first element matching a compiled XPath, or None.
+
+        Args:
+            xpath: Compiled XPath evaluated against the document root
         """
-        self._field_map = {}
+        matches = xpath(self._root)
+        return matches[0] if matches else None
 
-        # Find all section-row divs containing field-title and field-entry
-        section_rows = self._soup.select('.section-row')
+    def _page_text(self) -> str:
+        """All visible page text (script/style contents excluded), unstripped.
 
-        for row in section_rows:
-            title_elem = row.select_one('.field-title')
-            entry_elem = row.select_one('.field-entry')
+        Built on first use and cached for the rest of the current parse.
+        """
+        if self._page_text_cache is None:
+            self._page_text_cache = ''.join(_XPATH_PAGE_TEXT(self._root))
+        return self._page_text_cache
 
-            if title_elem and entry_elem:
-                title = title_elem.get_text(strip=True).lower()
-                value = entry_elem.get_text(strip=True)
+    def _build_field_map(self) -> None:
+        """
+        Build a map of field titles to their values from field-title/field-entry pairs.
+        """
+        field_map = {}
+        self._field_map = field_map
+
+        # Pair each row's first title with its first entry (precompiled,
+        # row-relative XPath, so a row missing either is skipped)
+        for row in _XPATH_SECTION_ROWS(self._root):
+            title_elems = _XPATH_ROW_TITLE(row)
+            entry_elems = _XPATH_ROW_ENTRY(row)
+
+            if title_elems and entry_elems:
+                title = _text(title_elems[0]).lower()
+                value = _text(entry_elems[0])
                 if title and value:
-                    self._field_map[title] = value
+                    field_map[title] = value
+
+        # Titles joined with a separator no field name contains, so one
+        # str.find locates the first title (in map order) containing a name
+        offsets = []
+        position = 0
+        for key in field_map:
+            offsets.append(position)
+            position += len(key) + 1
+        self._field_titles = '\0'.join(field_map)
+        self._field_offsets = offsets
+        self._field_values = list(field_map.values())
 
     def _get_field(self, *field_names) -> Optional[str]:
         """
@@ -93,29 +215,29 @@ class PractitionerParser:
         Returns:
             Field value or None
         """
+        titles = self._field_titles
         for name in field_names:
-            name_lower = name.lower()
-            for key, value in self._field_map.items():
-                if name_lower in key:
-                    return value
+            position = titles.find(name.lower())
+            if position >= 0:
+                return self._field_values[bisect_right(self._field_offsets, position) - 1]
         return None
 
     def _extract_name(self, result: Dict) -> None:
         """Extract name fields from practitioner-name element."""
         try:
             # Primary: h2.practitioner-name
-            name_elem = self._soup.select_one('h2.practitioner-name')
-            if name_elem:
-                full_name = name_elem.get_text(strip=True)
+            name_elem = self._select_one(_XPATH_NAME)
+            if name_elem is not None:
+                full_name = _text(name_elem)
                 result['name'] = full_name
                 self._parse_name_parts(full_name, result)
                 return
 
             # Fallback: page title
-            title = self._soup.find('title')
-            if title:
-                name_text = title.get_text(strip=True)
-                name_text = re.sub(r'\s*[-|]\s*AHPRA.*$', '', name_text)
+            title = self._root.find('.//title')
+            if title is not None:
+                name_text = _text(title)
+                name_text = _TITLE_SUFFIX_RE.sub('', name_text)
                 if name_text:
                     result['name'] = name_text
                     self._parse_name_parts(name_text, result)
@@ -125,16 +247,13 @@ class PractitionerParser:
 
     def _parse_name_parts(self, full_name: str, result: Dict) -> None:
         """Parse full name into components (title, first, middle, last)."""
-        titles = ['Dr', 'Mr', 'Mrs', 'Ms', 'Miss', 'Prof', 'Professor', 'Associate Professor']
-
         name = full_name.strip()
 
         # Extract title
-        for title in titles:
-            if name.startswith(title + ' ') or name.startswith(title + '.'):
-                result['name_title'] = title
-                name = name[len(title):].strip(' .')
-                break
+        match = _TITLE_PREFIX_RE.match(name)
+        if match:
+            result['name_title'] = match.group(1)
+            name = name[match.end(1):].strip(' .')
 
         # Split remaining name
         parts = name.split()
@@ -149,10 +268,10 @@ class PractitionerParser:
         """Extract registration ID."""
         try:
             # Primary: span.reg-number
-            reg_elem = self._soup.select_one('span.reg-number')
-            if reg_elem:
-                text = reg_elem.get_text(strip=True)
-                match = re.search(r'([A-Z]{3}\d{10,})', text)
+            reg_elem = self._select_one(_XPATH_REG_NUMBER)
+            if reg_elem is not None:
+                text = _text(reg_elem)
+                match = _REG_ID_RE.search(text)
                 if match:
                     result['reg_id'] = match.group(1)
                     return
@@ -160,14 +279,14 @@ class PractitionerParser:
             # Fallback: field map
             reg_number = self._get_field('registration number')
             if reg_number:
-                match = re.search(r'([A-Z]{3}\d{10,})', reg_number)
+                match = _REG_ID_RE.search(reg_number)
                 if match:
                     result['reg_id'] = match.group(1)
                     return
 
             # Last resort: search page text
-            page_text = self._soup.get_text()
-            match = re.search(r'([A-Z]{3}\d{10,})', page_text)
+            page_text = self._page_text()
+            match = _REG_ID_RE.search(page_text)
             if match:
                 result['reg_id'] = match.group(1)
 
@@ -178,9 +297,9 @@ class PractitionerParser:
         """Extract profession from practitioner-profession element."""
         try:
             # Primary: h3.practitioner-profession
-            prof_elem = self._soup.select_one('h3.practitioner-profession')
-            if prof_elem:
-                result['profession'] = prof_elem.get_text(strip=True)
+            prof_elem = self._select_one(_XPATH_PROFESSION)
+            if prof_elem is not None:
+                result['profession'] = _text(prof_elem)
                 return
 
             # Fallback: field map
@@ -195,9 +314,9 @@ class PractitionerParser:
         """Extract professional divisions from reg-types element."""
         try:
             # Primary: div.reg-types > span[class^="reg-type"]
-            reg_types = self._soup.select('.reg-types span[class^="reg-type"]')
+            reg_types = _XPATH_DIVISIONS(self._root)
             if reg_types:
-                divisions = [rt.get_text(strip=True) for rt in reg_types]
+                divisions = [_text(rt) for rt in reg_types]
                 result['divisions'] = '; '.join(divisions)
                 return
 
@@ -219,10 +338,9 @@ class PractitionerParser:
                 return
 
             # Fallback: search for status keywords
-            page_text = self._soup.get_text()
-            statuses = ['Registered', 'Suspended', 'Cancelled', 'Non-practising']
-            for status in statuses:
-                if re.search(rf'\b{status}\b', page_text, re.IGNORECASE):
+            page_text = self._page_text()
+            for status, pattern in _STATUS_PATTERNS:
+                if pattern.search(page_text):
                     result['registration_status'] = status
                     return
 
@@ -242,7 +360,7 @@ class PractitionerParser:
             if expiry:
                 # Clean up - remove explanatory text
                 expiry = expiry.split('.')[0] if '.' in expiry else expiry
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', expiry)
+                date_match = _DATE_RE.search(expiry)
                 if date_match:
                     result['reg_expiry'] = self._normalize_date(date_match.group(1))
                 else:
@@ -255,16 +373,13 @@ class PractitionerParser:
         """Normalize date string to DD/MM/YYYY format."""
         try:
             date_str = ' '.join(date_str.split())
-            from datetime import datetime
-
-            formats = [
-                '%d/%m/%Y', '%d-%m-%Y', '%d %B %Y', '%d %b %Y',
-                '%Y-%m-%d', '%m/%d/%Y',
-            ]
+            if _DMY_FULL_RE.fullmatch(date_str):
+                return date_str
 
-            for fmt in formats:
+            strptime = datetime.strptime
+            for fmt in _DATE_FORMATS:
                 try:
-                    dt = datetime.strptime(date_str, fmt)
+                    dt = strptime(date_str, fmt)
                     return dt.strftime('%d/%m/%Y')
                 except ValueError:
                     continue
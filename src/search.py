@@ -7,6 +7,9 @@ Implements:
 3. Filter Combination Search - Uses profession + state combinations for validation
 """
 
+import hashlib
+import json
+from collections import Counter
 from typing import Generator, List, Tuple, Optional
 from loguru import logger
 
@@ -429,6 +432,26 @@ class MultiDimensionalSearch:
         ]
         self.prefix_gen = PrefixGenerator(max_prefix_depth)
 
+    def get_plan_signature(self) -> str:
+        """
+        Get a hash of everything that determines the combination plan.
+
+        A persisted combination queue is only reused when this matches, so
+        changing professions, states, suburbs or depth forces a rebuild.
+
+        Returns:
+            Hex digest identifying the plan
+        """
+        plan = [
+            self.professions,
+            self.states,
+            self.max_prefix_depth,
+            self.test_prefix,
+            {state: self.suburbs.get(state, []) for state in self.high_volume_states}
+            if self.include_suburbs else None,
+        ]
+        return hashlib.sha1(json.dumps(plan, sort_keys=True).encode('utf-8')).hexdigest()
+
     def get_all_combinations(
         self,
         completed_combinations: set = None
@@ -437,7 +460,7 @@ class MultiDimensionalSearch:
         Get all search combinations (profession, state, suburb, prefix).
 
         Args:
-            completed_combinations: Set of already completed combination keys
+            completed_combinations: Set of already completed (profession, state, suburb, prefix) keys
 
         Returns:
             List of (profession, state, suburb, prefix) tuples
@@ -458,18 +481,18 @@ class MultiDimensionalSearch:
             for state in self.states:
                 # Generate prefix combinations for this profession/state
                 for prefix in prefixes:
-                    combo_key = f"{profession}|{state}|{prefix}"
+                    combo_key = (profession, state, None, prefix)
                     if combo_key not in completed:
-                        combinations.append((profession, state, None, prefix))
+                        combinations.append(combo_key)
 
                 # If including suburbs for high-volume states
                 if self.include_suburbs and state in self.high_volume_states:
                     suburbs_for_state = self.suburbs.get(state, [])
                     for suburb in suburbs_for_state:
                         for prefix in prefixes:
-                            combo_key = f"{profession}|{state}|{suburb}|{prefix}"
+                            combo_key = (profession, state, suburb, prefix)
                             if combo_key not in completed:
-                                combinations.append((profession, state, suburb, prefix))
+                                combinations.append(combo_key)
 
         total_count = len(combinations)
         logger.info(f"Multi-dimensional search plan: {total_count:,} combinations")
@@ -485,7 +508,7 @@ class MultiDimensionalSearch:
 
         Args:
             profession: The profession to search
-            completed_combinations: Set of already completed combination keys
+            completed_combinations: Set of already completed (profession, state, suburb, prefix) keys
 
         Returns:
             List of (profession, state, suburb, prefix) tuples
@@ -501,17 +524,17 @@ class MultiDimensionalSearch:
 
         for state in self.states:
             for prefix in prefixes:
-                combo_key = f"{profession}|{state}|{prefix}"
+                combo_key = (profession, state, None, prefix)
                 if combo_key not in completed:
-                    combinations.append((profession, state, None, prefix))
+                    combinations.append(combo_key)
 
             if self.include_suburbs and state in self.high_volume_states:
                 suburbs_for_state = self.suburbs.get(state, [])
                 for suburb in suburbs_for_state:
                     for prefix in prefixes:
-                        combo_key = f"{profession}|{state}|{suburb}|{prefix}"
+                        combo_key = (profession, state, suburb, prefix)
                         if combo_key not in completed:
-                            combinations.append((profession, state, suburb, prefix))
+                            combinations.append(combo_key)
 
         return combinations
 
@@ -525,7 +548,7 @@ class MultiDimensionalSearch:
 
         Args:
             state: The state to search
-            completed_combinations: Set of already completed combination keys
+            completed_combinations: Set of already completed (profession, state, suburb, prefix) keys
 
         Returns:
             List of (profession, state, suburb, prefix) tuples
@@ -541,17 +564,17 @@ class MultiDimensionalSearch:
 
         for profession in self.professions:
             for prefix in prefixes:
-                combo_key = f"{profession}|{state}|{prefix}"
+                combo_key = (profession, state, None, prefix)
                 if combo_key not in completed:
-                    combinations.append((profession, state, None, prefix))
+                    combinations.append(combo_key)
 
             if self.include_suburbs and state in self.high_volume_states:
                 suburbs_for_state = self.suburbs.get(state, [])
                 for suburb in suburbs_for_state:
                     for prefix in prefixes:
-                        combo_key = f"{profession}|{state}|{suburb}|{prefix}"
+                        combo_key = (profession, state, suburb, prefix)
                         if combo_key not in completed:
-                            combinations.append((profession, state, suburb, prefix))
+                            combinations.append(combo_key)
 
         return combinations
 
@@ -618,12 +641,9 @@ class MultiDimensionalSearch:
 
     def _get_progress_by_profession(self, completed: set) -> dict:
         """Get progress breakdown by profession."""
-        progress = {}
-        for profession in self.professions:
-            # Count combinations that start with this profession
-            done = sum(1 for c in completed if c.startswith(f"{profession}|"))
-            progress[profession] = done
-        return progress
+        # Combination keys are (profession, state, suburb, prefix) tuples
+        counts = Counter(c[0] for c in completed)
+        return {profession: counts.get(profession, 0) for profession in self.professions}
 
 
 class SearchOrchestrator:
@@ -723,6 +743,17 @@ class SearchOrchestrator:
             return []
         return self.multi_search.get_all_combinations(completed_combinations)
 
+    def get_multi_dimensional_signature(self) -> Optional[str]:
+        """
+        Get the plan signature for the multi-dimensional queue.
+
+        Returns:
+            Hex digest, or None when not in multi-dimensional mode
+        """
+        if not self.multi_dimensional:
+            return None
+        return self.multi_search.get_plan_signature()
+
     def handle_search_result(
         self,
         prefix: str,
@@ -3,6 +3,7 @@ Utility functions for AHPRA scraper.
 """
 
 import random
+import threading
 import time
 import sys
 from datetime import datetime
@@ -81,6 +82,47 @@ def random_delay(min_delay: float = None, max_delay: float = None) -> float:
     return delay
 
 
+class RequestPacer:
+    """
+    Spaces server requests by a random MIN_DELAY-MAX_DELAY gap.
+
+    Unlike random_delay(), time already spent since the previous request
+    (parsing, checkpoint IO) counts toward the gap, and one pacer can be
+    shared by several worker threads so they draw from a single budget
+    instead of each adding their own delays.
+    """
+
+    def __init__(self, min_delay: float = None, max_delay: float = None):
+        """
+        Initialize request pacer.
+
+        Args:
+            min_delay: Minimum gap between requests (default from settings)
+            max_delay: Maximum gap between requests (default from settings)
+        """
+        self.min_delay = min_delay if min_delay is not None else MIN_DELAY
+        self.max_delay = max_delay if max_delay is not None else MAX_DELAY
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> float:
+        """
+        Block until the next request slot, then reserve the one after it.
+
+        Returns:
+            Time slept in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + random.uniform(self.min_delay, self.max_delay)
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
 def ui_delay(min_delay: float = None, max_delay: float = None) -> float:
     """
     Sleep for a short duration for UI interactions (form filling, button clicks).
@@ -236,7 +236,7 @@ class TestDiscovery:
         test_checkpoint_name = f"test_{self.prefix}_{test_timestamp}"
 
         # Create isolated discovered_ids file for this test run
-        self.test_discovered_ids_file = DISCOVERY_DIR / f"test_discovered_ids_{self.prefix}_{test_timestamp}.json"
+        self.test_discovered_ids_file = DISCOVERY_DIR / f"test_discovered_ids_{self.prefix}_{test_timestamp}.txt"
         checkpoint = CheckpointManager(test_checkpoint_name, discovered_ids_file=self.test_discovered_ids_file)
 
         if self.use_fresh_checkpoint:
@@ -64,7 +64,7 @@ def main():
     # Create isolated checkpoint for this test
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     checkpoint_name = f"test_optimized_{test_prefix or 'full'}_{timestamp}"
-    test_discovered_ids_file = DISCOVERY_DIR / f"test_optimized_ids_{test_prefix or 'full'}_{timestamp}.json"
+    test_discovered_ids_file = DISCOVERY_DIR / f"test_optimized_ids_{test_prefix or 'full'}_{timestamp}.txt"
 
     print(f"\nCheckpoint: {checkpoint_name}")
     print(f"Discovered IDs will be saved to: {test_discovered_ids_file.name}")